@@ -4,10 +4,17 @@ Dash UI Kit - A lightweight styling library for Plotly Dash applications.
 Provides Tailwind-like utility classes and shadcn-inspired pre-built components.
 """
 
+from dash.development.base_component import ComponentRegistry
+
 from dash_ui_kit.__version__ import __version__, __version_info__
 
 # Import components
-from dash_ui_kit.components.button import Button
+from dash_ui_kit.components.accordion import (
+    Accordion,
+    AccordionItem,
+    accordion_value_id,
+)
+from dash_ui_kit.components.button import Button, ButtonPatch
 from dash_ui_kit.components.card import (
     Card,
     CardContent,
@@ -15,32 +22,180 @@ from dash_ui_kit.components.card import (
     CardFooter,
     CardHeader,
     CardTitle,
+    LazyCard,
+)
+from dash_ui_kit.components.graph import Graph, graph_id
+from dash_ui_kit.components.input import (
+    Input,
+    InputError,
+    InputGroup,
+    Label,
+    input_error_id,
+    input_source_id,
+    input_value_id,
+)
+from dash_ui_kit.components.badge import Badge, BadgePatch
+from dash_ui_kit.components.dialog import Dialog, dialog_trigger_id
+from dash_ui_kit.components.feed import InfiniteFeed
+from dash_ui_kit.components.form import (
+    Form,
+    form_field_id,
+    form_state_id,
+    form_submit_id,
+    form_values_id,
+)
+from dash_ui_kit.components.select import Select, select_dropdown_id
+from dash_ui_kit.components.skeleton import (
+    Skeleton,
+    SkeletonBadge,
+    SkeletonButton,
+    SkeletonCard,
+    SkeletonRows,
+    SkeletonText,
 )
-from dash_ui_kit.components.input import Input, InputError, InputGroup, Label
-from dash_ui_kit.components.badge import Badge
-from dash_ui_kit.components.select import Select
+from dash_ui_kit.components.sparkline import Sparkline
+from dash_ui_kit.components.stat import StatCard, stat_cards_from_frame
+from dash_ui_kit.components.table import DataTable, table_state_id
+from dash_ui_kit.components.tabs import Tab, Tabs, tabs_id
+from dash_ui_kit.components.toast import Toaster, toast, toaster_id
+from dash_ui_kit.components.virtual import CardGrid, VirtualList
+
+# Import caching
+from dash_ui_kit.cache.interning import (
+    FrozenComponentError,
+    intern_components,
+    set_interning,
+)
+from dash_ui_kit.cache.layout import memoize_layout
+from dash_ui_kit.cache.options import OptionsCache, cached_options
+from dash_ui_kit.cache.shared import SharedLayoutCache
+
+# Import theming
+from dash_ui_kit.themes.default import default_theme
+from dash_ui_kit.themes.figures import figure_template, register_figure_template
 
 # Import utilities
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.patch import diff_layout, layout_patch
+from dash_ui_kit.utils.downsample import downsample
+from dash_ui_kit.utils.feeds import FeedPage, FeedSource, decode_cursor, encode_cursor
+from dash_ui_kit.utils.formatting import format_numbers, percent_change
+from dash_ui_kit.utils.options import options_from_columns
+from dash_ui_kit.utils.search import OptionIndex, SearchPage
+from dash_ui_kit.utils.serialization import deserialize_layout, serialize_layout
+from dash_ui_kit.utils.sources import RowSource
+from dash_ui_kit.utils.tables import TablePage, TableSource
+from dash_ui_kit.utils.templates import render_template
+from dash_ui_kit.utils.validation import Validator, validate_values
+
+# Clientside scripts, served by Dash from this package like a component library's
+_js_dist = [
+    {"relative_package_path": f"assets/scripts/{name}.js", "namespace": __name__}
+    for name in [
+        "accordion",
+        "button",
+        "dialog",
+        "feed",
+        "form",
+        "input",
+        "lazy",
+        "tabs",
+        "toast",
+        "validation",
+        "virtual",
+    ]
+]
+ComponentRegistry.registry.add(__name__)
 
 __all__ = [
     # Version
     "__version__",
     "__version_info__",
     # Components
+    "Accordion",
+    "AccordionItem",
+    "accordion_value_id",
     "Button",
+    "ButtonPatch",
     "Card",
     "CardContent",
     "CardDescription",
     "CardFooter",
+    "CardGrid",
     "CardHeader",
     "CardTitle",
+    "LazyCard",
     "Input",
     "InputError",
     "InputGroup",
     "Label",
+    "input_error_id",
+    "input_source_id",
+    "input_value_id",
     "Badge",
+    "BadgePatch",
+    "Dialog",
+    "dialog_trigger_id",
+    "InfiniteFeed",
+    "Graph",
+    "graph_id",
+    "Form",
+    "form_field_id",
+    "form_state_id",
+    "form_submit_id",
+    "form_values_id",
     "Select",
+    "select_dropdown_id",
+    "DataTable",
+    "table_state_id",
+    "Skeleton",
+    "SkeletonBadge",
+    "SkeletonButton",
+    "SkeletonCard",
+    "SkeletonRows",
+    "SkeletonText",
+    "Sparkline",
+    "StatCard",
+    "stat_cards_from_frame",
+    "Tab",
+    "Tabs",
+    "tabs_id",
+    "Toaster",
+    "toast",
+    "toaster_id",
+    "VirtualList",
+    # Caching
+    "FrozenComponentError",
+    "OptionsCache",
+    "SharedLayoutCache",
+    "cached_options",
+    "intern_components",
+    "memoize_layout",
+    "set_interning",
+    # Theming
+    "default_theme",
+    "figure_template",
+    "register_figure_template",
     # Utilities
+    "FeedPage",
+    "FeedSource",
+    "OptionIndex",
+    "RowSource",
+    "SearchPage",
+    "TablePage",
+    "TableSource",
+    "Validator",
     "cn",
+    "decode_cursor",
+    "deserialize_layout",
+    "diff_layout",
+    "downsample",
+    "encode_cursor",
+    "format_numbers",
+    "layout_patch",
+    "options_from_columns",
+    "percent_change",
+    "render_template",
+    "serialize_layout",
+    "validate_values",
 ]
@@ -0,0 +1,90 @@
+/**
+ * Accordion
+ *
+ * Expands and collapses `Accordion` items in the browser. The server is only
+ * asked for the body of a lazy item the first time it is expanded; loaded
+ * bodies stay in the browser.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  var ITEM = "duk-accordion__item";
+
+  // Bodies requested but not loaded yet, keyed by the accordion's id
+  var pending = {};
+
+  // Id of the toggle that fired, from "<json id>.n_clicks"
+  function triggeredId() {
+    var triggered = window.dash_clientside.callback_context.triggered || [];
+    if (!triggered.length) {
+      return null;
+    }
+    var propId = triggered[0].prop_id;
+    try {
+      return JSON.parse(propId.slice(0, propId.lastIndexOf(".")));
+    } catch (e) {
+      return null;
+    }
+  }
+
+  function isMultiple(toggleId) {
+    var toggle = document.getElementById(
+      JSON.stringify({ id: toggleId.id, item: toggleId.item, type: toggleId.type })
+    );
+    var root = toggle && toggle.closest(".duk-accordion");
+    return !!root && root.getAttribute("data-duk-multiple") === "true";
+  }
+
+  function request(key, value, loaded) {
+    var requested = (pending[key] = pending[key] || {});
+    // Forget requests the server has answered since
+    Object.keys(requested).forEach(function (item) {
+      if (loaded.indexOf(item) >= 0) {
+        delete requested[item];
+      }
+    });
+    if (loaded.indexOf(value) >= 0 || requested[value]) {
+      return window.dash_clientside.no_update;
+    }
+    requested[value] = true;
+    return { value: value };
+  }
+
+  ns.accordionToggle = function (clicks, open, loaded, ids) {
+    var noUpdate = window.dash_clientside.no_update;
+    var toggled = triggeredId();
+    if (!toggled) {
+      return [noUpdate, noUpdate, noUpdate, noUpdate];
+    }
+    var value = toggled.item;
+    open = open || [];
+    loaded = loaded || [];
+
+    var opening = open.indexOf(value) < 0;
+    if (!opening) {
+      open = open.filter(function (item) {
+        return item !== value;
+      });
+    } else if (isMultiple(toggled)) {
+      open = open.concat([value]);
+    } else {
+      open = [value];
+    }
+
+    var expanded = ids.map(function (id) {
+      return open.indexOf(id.item) >= 0;
+    });
+    return [
+      expanded.map(function (isOpen) {
+        return isOpen ? ITEM + " " + ITEM + "--open" : ITEM;
+      }),
+      expanded.map(function (isOpen) {
+        return isOpen ? "true" : "false";
+      }),
+      open,
+      opening ? request(toggled.id, value, loaded) : noUpdate,
+    ];
+  };
+})();
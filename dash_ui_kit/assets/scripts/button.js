@@ -0,0 +1,78 @@
+/**
+ * Button clientside loading state
+ *
+ * Buttons rendered with `data-duk-loading-until="<target id>"` switch to the
+ * loading state as soon as they are clicked and leave it when the target
+ * component has been updated by its callback, without any server round trip.
+ */
+(function () {
+  if (window.__dukButtonLoading) {
+    return;
+  }
+  window.__dukButtonLoading = true;
+
+  var LOADING_CLASS = "duk-button--loading";
+
+  function stop(button, state) {
+    if (!state.active) {
+      return;
+    }
+    state.active = false;
+    if (state.observer) {
+      state.observer.disconnect();
+    }
+    clearTimeout(state.timer);
+    button.classList.remove(LOADING_CLASS);
+    button.disabled = state.wasDisabled;
+    button.removeAttribute("aria-busy");
+  }
+
+  function start(button) {
+    var targetId = button.getAttribute("data-duk-loading-until");
+    var timeout = parseFloat(button.getAttribute("data-duk-loading-timeout"));
+    var state = {
+      active: true,
+      wasDisabled: button.disabled,
+      observer: null,
+      timer: null,
+    };
+
+    button.classList.add(LOADING_CLASS);
+    button.disabled = true;
+    button.setAttribute("aria-busy", "true");
+
+    var target = document.getElementById(targetId);
+    if (target && window.MutationObserver) {
+      state.observer = new MutationObserver(function () {
+        // Dash flags components whose props are being computed; wait until
+        // the callback has finished and the new value is rendered.
+        if (target.getAttribute("data-dash-is-loading") !== "true") {
+          stop(button, state);
+        }
+      });
+      state.observer.observe(target, {
+        attributes: true,
+        childList: true,
+        characterData: true,
+        subtree: true,
+      });
+    }
+
+    state.timer = setTimeout(function () {
+      stop(button, state);
+    }, isNaN(timeout) ? 30000 : timeout * 1000);
+  }
+
+  document.addEventListener("click", function (event) {
+    var button = event.target.closest
+      ? event.target.closest("button[data-duk-loading-until]")
+      : null;
+    if (!button || button.disabled) {
+      return;
+    }
+    // Let Dash record the click (n_clicks) before disabling the button
+    setTimeout(function () {
+      start(button);
+    }, 0);
+  });
+})();
@@ -0,0 +1,59 @@
+/**
+ * Dialogs
+ *
+ * Unmounts the content of a `Dialog` when it is closed, and closes the
+ * topmost open dialog on Escape. Content is mounted by a server callback
+ * when the dialog is opened, and focused once it appears.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  ns.dialogClose = function (closeClicks, overlayClicks) {
+    if (closeClicks || overlayClicks) {
+      return null;
+    }
+    return window.dash_clientside.no_update;
+  };
+
+  // DOM id Dash renders for {"type": type, "id": id} (keys sorted)
+  function domId(type, id) {
+    return JSON.stringify({ id: id, type: type });
+  }
+
+  ns.dialogFocus = function (children, id) {
+    if (children) {
+      requestAnimationFrame(function () {
+        var mount = document.getElementById(domId("duk-dialog-mount", id.id));
+        var dialog = mount && mount.querySelector(".duk-dialog");
+        if (dialog) {
+          dialog.focus();
+        }
+      });
+    }
+    return window.dash_clientside.no_update;
+  };
+
+  if (window.__dukDialog) {
+    return;
+  }
+  window.__dukDialog = true;
+
+  function topmost() {
+    var dialogs = document.querySelectorAll(".duk-dialog");
+    return dialogs.length ? dialogs[dialogs.length - 1] : null;
+  }
+
+  document.addEventListener("keydown", function (event) {
+    if (event.key !== "Escape") {
+      return;
+    }
+    var dialog = topmost();
+    var close = dialog && dialog.querySelector(".duk-dialog__close");
+    if (close) {
+      event.preventDefault();
+      close.click();
+    }
+  });
+})();
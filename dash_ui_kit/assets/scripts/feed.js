@@ -0,0 +1,86 @@
+/**
+ * Infinite feeds
+ *
+ * Requests the next page of an `InfiniteFeed` when its "Load more" button is
+ * clicked, once per cursor. With `auto`, an IntersectionObserver clicks the
+ * button when the end of the feed comes into view, and checks again after
+ * each page in case the feed is still shorter than the screen.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  // Start loading this far before the end of the feed is visible
+  var ROOT_MARGIN = "400px";
+
+  // Per feed: clicks handled and cursors requested, by stringified id
+  var feeds = {};
+  var observer = null;
+
+  // DOM id Dash renders for {"type": type, "id": id} (keys sorted)
+  function domId(type, id) {
+    return JSON.stringify({ id: id, type: type });
+  }
+
+  function observe(id) {
+    var footer = document.getElementById(domId("duk-feed-footer", id));
+    if (!footer) {
+      // First render: the feed may not be in the document yet
+      requestAnimationFrame(function () {
+        if (document.getElementById(domId("duk-feed-footer", id))) {
+          observe(id);
+        }
+      });
+      return;
+    }
+    var feed = footer.closest(".duk-feed");
+    if (!feed || feed.getAttribute("data-duk-auto") !== "true") {
+      return;
+    }
+    if (typeof IntersectionObserver === "undefined") {
+      return;
+    }
+    if (!observer) {
+      observer = new IntersectionObserver(
+        function (entries) {
+          entries.forEach(function (entry) {
+            var done = entry.target.classList.contains("duk-feed__footer--done");
+            if (entry.isIntersecting && !done) {
+              var more = entry.target.querySelector(".duk-feed__more");
+              if (more) {
+                more.click();
+              }
+            }
+          });
+        },
+        { rootMargin: ROOT_MARGIN }
+      );
+    }
+    // Observing again reports the footer's current visibility
+    observer.unobserve(footer);
+    observer.observe(footer);
+  }
+
+  ns.feedRequest = function (nClicks, state, id) {
+    var noUpdate = window.dash_clientside.no_update;
+    var key = JSON.stringify(id.id);
+    var feed = (feeds[key] = feeds[key] || { clicks: 0, requested: {} });
+
+    if ((nClicks || 0) > feed.clicks) {
+      feed.clicks = nClicks;
+      var cursor = state && state.cursor;
+      if (cursor && !feed.requested[cursor]) {
+        feed.requested[cursor] = true;
+        return { cursor: cursor };
+      }
+      return noUpdate;
+    }
+
+    // Initial render or a new page: watch the end of the feed again
+    if (state && state.cursor) {
+      observe(id.id);
+    }
+    return noUpdate;
+  };
+})();
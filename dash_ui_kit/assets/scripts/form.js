@@ -0,0 +1,80 @@
+/**
+ * Form clientside collection
+ *
+ * Gathers the values of every field of a `Form` when it is submitted, diffs
+ * them against the previous submission and writes only the changed fields
+ * to the form's values store.
+ *
+ * Fields wrapped by kit components (gated or validated inputs, searched
+ * selects) arrive as extra (values, ids) pairs for every form on the page;
+ * their `id` key is the field's own id as JSON, naming the form and field.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  function same(a, b) {
+    return JSON.stringify(a === undefined ? null : a) ===
+      JSON.stringify(b === undefined ? null : b);
+  }
+
+  function wrappedField(id) {
+    if (typeof id.id !== "string" || id.id.charAt(0) !== "{") {
+      return null;
+    }
+    try {
+      return JSON.parse(id.id);
+    } catch (e) {
+      return null;
+    }
+  }
+
+  ns.collectForm = function (nClicks, values, ids, config, previous, configId) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (!nClicks) {
+      return [noUpdate, noUpdate];
+    }
+
+    var changedOnly = !config || config.changed_only !== false;
+    previous = previous || {};
+
+    var fields = [];
+    var i;
+    for (i = 0; i < ids.length; i++) {
+      fields.push([ids[i].name, values[i]]);
+    }
+    for (var arg = 6; arg + 1 < arguments.length; arg += 2) {
+      var wrappedValues = arguments[arg];
+      var wrappedIds = arguments[arg + 1];
+      for (i = 0; i < wrappedIds.length; i++) {
+        var field = wrappedField(wrappedIds[i]);
+        if (
+          field &&
+          field.type === "duk-form-field" &&
+          field.form === configId.form
+        ) {
+          fields.push([field.name, wrappedValues[i]]);
+        }
+      }
+    }
+
+    var current = {};
+    var changed = {};
+    var hasChanges = false;
+    for (i = 0; i < fields.length; i++) {
+      var name = fields[i][0];
+      var value = fields[i][1] === undefined ? null : fields[i][1];
+      current[name] = value;
+      if (!changedOnly || !same(value, previous[name])) {
+        changed[name] = value;
+        hasChanges = true;
+      }
+    }
+
+    if (!hasChanges) {
+      return [noUpdate, noUpdate];
+    }
+    return [changed, current];
+  };
+})();
@@ -0,0 +1,57 @@
+/**
+ * Input clientside value gating
+ *
+ * Filters values typed into a gated `Input` before they are written to its
+ * value store: short values, unchanged values and values arriving faster
+ * than the throttle window never trigger a server callback.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  // Throttle state per input, keyed by its stringified id
+  var throttles = {};
+
+  ns.gateInput = function (value, config, lastValue, id) {
+    var noUpdate = window.dash_clientside.no_update;
+    config = config || {};
+
+    var text = value === null || value === undefined ? "" : String(value);
+    if (config.min_length && text.length > 0 && text.length < config.min_length) {
+      return noUpdate;
+    }
+    if (config.suppress_unchanged && value === lastValue) {
+      return noUpdate;
+    }
+    if (!config.throttle_ms) {
+      return value;
+    }
+
+    var key = JSON.stringify(id);
+    var state = throttles[key] || (throttles[key] = { sentAt: 0, pending: null });
+
+    // A newer value replaces any value waiting for the window to end
+    if (state.pending) {
+      clearTimeout(state.pending.timer);
+      state.pending.resolve(noUpdate);
+      state.pending = null;
+    }
+
+    var wait = state.sentAt + config.throttle_ms - Date.now();
+    if (wait <= 0) {
+      state.sentAt = Date.now();
+      return value;
+    }
+
+    return new Promise(function (resolve) {
+      var pending = { resolve: resolve, timer: null };
+      pending.timer = setTimeout(function () {
+        state.pending = null;
+        state.sentAt = Date.now();
+        resolve(value);
+      }, wait);
+      state.pending = pending;
+    });
+  };
+})();
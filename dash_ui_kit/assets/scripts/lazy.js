@@ -0,0 +1,129 @@
+/**
+ * Lazy cards
+ *
+ * Requests the content of a `LazyCard` when it comes near the viewport.
+ * Cards are observed with one IntersectionObserver per root margin, queued
+ * in the order they became visible, and loaded at most `max_concurrent` at
+ * a time; a slot is freed when the content arrives (or after a timeout, if
+ * the callback failed).
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  // Milliseconds after which a card that never answered frees its slot
+  var LOAD_TIMEOUT = 30000;
+
+  var observers = {};
+  var queue = [];
+  var loading = new Map();
+
+  // DOM id Dash renders for {"type": type, "id": id} (keys sorted)
+  function domId(type, id) {
+    return JSON.stringify({ id: id, type: type });
+  }
+
+  function cardOf(id) {
+    var body = document.getElementById(domId("duk-lazy-card-body", id));
+    return body && body.closest(".duk-lazy-card");
+  }
+
+  function limit(card) {
+    return Number(card.getAttribute("data-duk-concurrency")) || 4;
+  }
+
+  function send(id) {
+    var request = { at: Date.now() };
+    var setProps = window.dash_clientside.set_props;
+    if (setProps) {
+      setProps({ type: "duk-lazy-card-request", id: id }, { data: request });
+      return;
+    }
+    // Dash < 2.16: the trigger's clientside callback sends the request
+    var trigger = document.getElementById(domId("duk-lazy-card-trigger", id));
+    if (trigger) {
+      trigger.click();
+    }
+  }
+
+  function pump() {
+    while (queue.length) {
+      var next = queue[0];
+      if (!next.card.isConnected) {
+        queue.shift();
+        continue;
+      }
+      if (loading.size >= limit(next.card)) {
+        return;
+      }
+      queue.shift();
+      loading.set(
+        next.id,
+        setTimeout(function (id) {
+          done(id);
+        }, LOAD_TIMEOUT, next.id)
+      );
+      send(next.id);
+    }
+  }
+
+  function done(id) {
+    if (loading.has(id)) {
+      clearTimeout(loading.get(id));
+      loading.delete(id);
+    }
+    pump();
+  }
+
+  function observerFor(margin) {
+    if (!observers[margin]) {
+      observers[margin] = new IntersectionObserver(
+        function (entries, observer) {
+          entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+              observer.unobserve(entry.target);
+              queue.push({ id: entry.target.__dukLazyId, card: entry.target });
+            }
+          });
+          pump();
+        },
+        { rootMargin: margin }
+      );
+    }
+    return observers[margin];
+  }
+
+  function watch(id) {
+    var card = cardOf(id);
+    if (!card) {
+      // First render: the card may not be in the document yet
+      requestAnimationFrame(function () {
+        if (cardOf(id)) {
+          watch(id);
+        }
+      });
+      return;
+    }
+    card.__dukLazyId = id;
+    if (typeof IntersectionObserver === "undefined") {
+      queue.push({ id: id, card: card });
+      pump();
+      return;
+    }
+    observerFor(card.getAttribute("data-duk-root-margin") || "0px").observe(card);
+  }
+
+  ns.lazyCardRequest = function (nClicks, id) {
+    if (!nClicks) {
+      watch(id.id);
+      return window.dash_clientside.no_update;
+    }
+    return { at: Date.now() };
+  };
+
+  ns.lazyCardLoaded = function (children, id) {
+    done(id.id);
+    return "duk-card-content duk-lazy-card__body";
+  };
+})();
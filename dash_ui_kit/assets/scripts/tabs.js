@@ -0,0 +1,35 @@
+/**
+ * Lazy tabs
+ *
+ * Asks the server for the content of a `Tabs` panel only the first time its
+ * tab is selected. Loaded panels stay in the browser, so switching back to
+ * them makes no request.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  // Panels requested but not loaded yet, keyed by the tabs' stringified id
+  var pending = {};
+
+  ns.tabsRequest = function (value, loaded, id) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (value === null || value === undefined || (loaded || []).indexOf(value) >= 0) {
+      return noUpdate;
+    }
+    var key = JSON.stringify(id);
+    var requested = (pending[key] = pending[key] || {});
+    // Forget requests the server has answered since
+    Object.keys(requested).forEach(function (tab) {
+      if ((loaded || []).indexOf(tab) >= 0) {
+        delete requested[tab];
+      }
+    });
+    if (requested[value]) {
+      return noUpdate;
+    }
+    requested[value] = true;
+    return { value: value };
+  };
+})();
@@ -0,0 +1,147 @@
+/**
+ * Toaster
+ *
+ * Shows the toasts written to a `Toaster`'s store. Toasts beyond
+ * `max_visible` wait in a queue; each one dismisses itself after its
+ * duration, paused while the pointer is over it. Everything after the store
+ * write happens in the browser.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  // Duration of the leave transition in components.css
+  var LEAVE_MS = 150;
+  // Keys remembered to ignore toasts written again with the same store data
+  var SEEN_LIMIT = 200;
+
+  // State per toaster, by stringified id
+  var toasters = {};
+
+  // DOM id Dash renders for {"type": type, "id": id} (keys sorted)
+  function domId(type, id) {
+    return JSON.stringify({ id: id, type: type });
+  }
+
+  function stateOf(id) {
+    var key = JSON.stringify(id);
+    if (!toasters[key]) {
+      toasters[key] = { id: id, queue: [], visible: 0, seen: [] };
+    }
+    return toasters[key];
+  }
+
+  function text(tag, className, value) {
+    var el = document.createElement(tag);
+    el.className = className;
+    el.textContent = value;
+    return el;
+  }
+
+  function dismiss(state, el) {
+    if (el.__dukClosing) {
+      return;
+    }
+    el.__dukClosing = true;
+    clearTimeout(el.__dukTimer);
+    el.classList.add("duk-toast--leaving");
+    setTimeout(function () {
+      if (el.parentNode) {
+        el.parentNode.removeChild(el);
+      }
+      state.visible -= 1;
+      pump(state);
+    }, LEAVE_MS);
+  }
+
+  function startTimer(state, el, duration) {
+    if (duration > 0) {
+      el.__dukTimer = setTimeout(function () {
+        dismiss(state, el);
+      }, duration);
+    }
+  }
+
+  function show(state, stack, toast) {
+    var root = stack.closest(".duk-toaster");
+    var fallback = Number(root && root.getAttribute("data-duk-duration"));
+    var duration =
+      toast.duration === null || toast.duration === undefined
+        ? fallback
+        : Number(toast.duration);
+
+    var el = document.createElement("div");
+    el.className = "duk-toast duk-toast--" + (toast.variant || "default");
+    el.setAttribute("role", toast.variant === "destructive" ? "alert" : "status");
+
+    var body = document.createElement("div");
+    body.className = "duk-toast__body";
+    if (toast.title) {
+      body.appendChild(text("div", "duk-toast__title", toast.title));
+    }
+    body.appendChild(text("div", "duk-toast__message", toast.message));
+    el.appendChild(body);
+
+    var close = text("button", "duk-toast__close", "×");
+    close.type = "button";
+    close.setAttribute("aria-label", "Close");
+    close.addEventListener("click", function () {
+      dismiss(state, el);
+    });
+    el.appendChild(close);
+
+    el.addEventListener("mouseenter", function () {
+      clearTimeout(el.__dukTimer);
+    });
+    el.addEventListener("mouseleave", function () {
+      if (!el.__dukClosing) {
+        startTimer(state, el, duration);
+      }
+    });
+
+    stack.appendChild(el);
+    state.visible += 1;
+    startTimer(state, el, duration);
+  }
+
+  function pump(state) {
+    var stack = document.getElementById(domId("duk-toaster-stack", state.id));
+    if (!stack) {
+      return;
+    }
+    var root = stack.closest(".duk-toaster");
+    var limit = Number(root && root.getAttribute("data-duk-max-visible")) || 3;
+    while (state.queue.length && state.visible < limit) {
+      show(state, stack, state.queue.shift());
+    }
+  }
+
+  ns.toasterShow = function (data, id) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (!data) {
+      return noUpdate;
+    }
+    var state = stateOf(id.id);
+    (Array.isArray(data) ? data : [data]).forEach(function (toast) {
+      if (typeof toast === "string") {
+        toast = { message: toast };
+      }
+      if (!toast) {
+        return;
+      }
+      if (toast.key) {
+        if (state.seen.indexOf(toast.key) >= 0) {
+          return;
+        }
+        state.seen.push(toast.key);
+        if (state.seen.length > SEEN_LIMIT) {
+          state.seen.shift();
+        }
+      }
+      state.queue.push(toast);
+    });
+    pump(state);
+    return noUpdate;
+  };
+})();
@@ -0,0 +1,106 @@
+/**
+ * Input clientside validation
+ *
+ * Compiles the rules of a `Validator` once into a check function and runs it
+ * on every value of a validated `Input`, toggling its error class and the
+ * text of its `InputError` without a server round trip.
+ * Mirrors dash_ui_kit/utils/validation.py.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  var NUMBER = /^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$/;
+
+  // Compiled validators, keyed by their serialized rules
+  var compiled = {};
+
+  function toNumber(value) {
+    if (typeof value === "number") {
+      return isNaN(value) ? null : value;
+    }
+    if (typeof value === "string" && NUMBER.test(value)) {
+      return parseFloat(value);
+    }
+    return null;
+  }
+
+  function compileRule(rule) {
+    var limit = rule.value;
+    switch (rule.rule) {
+      case "min_length":
+        // Count code points, like Python's len()
+        return function (value) {
+          return Array.from(String(value)).length < limit;
+        };
+      case "max_length":
+        return function (value) {
+          return Array.from(String(value)).length > limit;
+        };
+      case "pattern":
+        var regex = new RegExp("^(?:" + limit + ")$");
+        return function (value) {
+          return !regex.test(String(value));
+        };
+      case "number":
+        return function (value) {
+          return toNumber(value) === null;
+        };
+      case "min":
+        return function (value) {
+          var number = toNumber(value);
+          return number !== null && number < limit;
+        };
+      case "max":
+        return function (value) {
+          var number = toNumber(value);
+          return number !== null && number > limit;
+        };
+      default:
+        return function () {
+          return false;
+        };
+    }
+  }
+
+  function compile(rules) {
+    var required = null;
+    var checks = [];
+    rules.forEach(function (rule) {
+      if (rule.rule === "required") {
+        required = rule.message;
+      } else {
+        checks.push({ fails: compileRule(rule), message: rule.message });
+      }
+    });
+
+    return function (value) {
+      if (value === null || value === undefined || value === "") {
+        return required;
+      }
+      for (var i = 0; i < checks.length; i++) {
+        if (checks[i].fails(value)) {
+          return checks[i].message;
+        }
+      }
+      return null;
+    };
+  }
+
+  ns.validate = function (rules, value) {
+    var key = JSON.stringify(rules);
+    var check = compiled[key] || (compiled[key] = compile(rules));
+    return check(value);
+  };
+
+  ns.validateInput = function (value, spec) {
+    if (!spec) {
+      var noUpdate = window.dash_clientside.no_update;
+      return [noUpdate, noUpdate];
+    }
+    var message = ns.validate(spec.rules, value);
+    var className = spec.className + (message ? " duk-input--error" : "");
+    return [message || "", className];
+  };
+})();
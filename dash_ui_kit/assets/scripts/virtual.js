@@ -0,0 +1,299 @@
+/**
+ * Virtualized lists and grids
+ *
+ * Renders only the items of a `VirtualList` or `CardGrid` that are in view,
+ * filling an HTML item template with row data and recycling a constant pool
+ * of item elements while scrolling. Rows of server-side sources are fetched
+ * a window at a time, so neither the DOM nor the browser's copy of the data
+ * grows with the number of rows.
+ */
+(function () {
+  window.dash_clientside = window.dash_clientside || {};
+  var ns = (window.dash_clientside.dash_ui_kit =
+    window.dash_clientside.dash_ui_kit || {});
+
+  var FIELD = /\{(\w+)\}/g;
+  var ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+  // How long scrolling must pause before a missing window is requested
+  var REQUEST_DELAY = 50;
+
+  // State per viewport element
+  var views = new Map();
+
+  function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, function (c) {
+      return ESCAPES[c];
+    });
+  }
+
+  function fill(template, row) {
+    return template.replace(FIELD, function (_, name) {
+      var value = row[name];
+      return value === null || value === undefined ? "" : escapeHtml(value);
+    });
+  }
+
+  // DOM id Dash renders for {"type": type, "id": id} (keys sorted)
+  function domId(type, id) {
+    return JSON.stringify({ id: id, type: type });
+  }
+
+  // The viewport is the parent of the spacer giving it its scroll height
+  function viewportOf(id) {
+    var spacer = document.getElementById(domId("duk-virtual-spacer", id));
+    return spacer && spacer.parentElement;
+  }
+
+  function attr(el, name) {
+    return el.getAttribute("data-duk-" + name);
+  }
+
+  function stateOf(el, id) {
+    var state = views.get(el);
+    if (!state) {
+      var grid = attr(el, "layout") === "grid";
+      state = {
+        el: el,
+        id: id,
+        spacer: document.getElementById(domId("duk-virtual-spacer", id)),
+        itemsEl: el.querySelector(grid ? ".duk-card-grid__cells" : ".duk-virtual-list__rows"),
+        itemClass: grid ? "duk-card-grid__cell" : "duk-virtual-list__row",
+        grid: grid,
+        template: attr(el, "template") || "",
+        itemHeight: Number(attr(el, "row-height")) || 40,
+        minWidth: Number(attr(el, "min-width")) || 0,
+        gap: Number(attr(el, "gap")) || 0,
+        windowSize: Number(attr(el, "window")) || 100,
+        overscan: Number(attr(el, "overscan")) || 0,
+        remote: attr(el, "remote") === "true",
+        rows: new Map(),
+        total: 0,
+        columns: 1,
+        pitch: 0,
+        height: null,
+        pool: [],
+        view: [0, 0],
+        pending: null,
+        wanted: null,
+        timer: null,
+        frame: 0,
+      };
+      views.set(el, state);
+    }
+    return state;
+  }
+
+  function covers(range, from, to) {
+    return range && range.start <= from && range.end >= to;
+  }
+
+  function send(state, range) {
+    state.pending = range;
+    var setProps = window.dash_clientside.set_props;
+    if (setProps) {
+      setProps({ type: "duk-virtual-window", id: state.id }, { data: range });
+      return;
+    }
+    // Dash < 2.16: hand the range to a clientside callback via a click
+    state.el.setAttribute("data-duk-request", JSON.stringify(range));
+    var trigger = document.getElementById(domId("duk-virtual-trigger", state.id));
+    if (trigger) {
+      trigger.click();
+    }
+  }
+
+  function request(state, from, to) {
+    if (covers(state.pending, from, to) || covers(state.wanted, from, to)) {
+      return;
+    }
+    var size = Math.max(state.windowSize, to - from);
+    var start = Math.max(0, from - Math.floor((size - (to - from)) / 2));
+    state.wanted = { start: start, end: start + size, at: Date.now() };
+
+    clearTimeout(state.timer);
+    state.timer = setTimeout(function () {
+      var range = state.wanted;
+      state.wanted = null;
+      if (range) {
+        send(state, range);
+      }
+    }, REQUEST_DELAY);
+  }
+
+  function layout(state) {
+    if (!state.grid) {
+      state.pitch = state.itemHeight;
+      return;
+    }
+    // As many columns of at least minWidth as fit, like auto-fill
+    var width = state.itemsEl.clientWidth;
+    var columns = Math.max(
+      1,
+      Math.floor((width + state.gap) / (state.minWidth + state.gap))
+    );
+    if (columns !== state.columns) {
+      state.columns = columns;
+      state.itemsEl.style.gridTemplateColumns = "repeat(" + columns + ", minmax(0, 1fr))";
+    }
+    state.pitch = state.itemHeight + state.gap;
+  }
+
+  function render(state) {
+    layout(state);
+    var el = state.el;
+    var pitch = state.pitch;
+    var columns = state.columns;
+    var lines = Math.ceil(state.total / columns);
+
+    var height = Math.max(0, lines * pitch - (state.grid ? state.gap : 0)) + "px";
+    if (height !== state.height) {
+      state.height = height;
+      state.spacer.style.height = height;
+    }
+
+    var firstLine = Math.floor(el.scrollTop / pitch);
+    var visibleLines = Math.ceil(el.clientHeight / pitch) + 1;
+    var fromLine = Math.max(0, firstLine - state.overscan);
+    var toLine = Math.min(lines, firstLine + visibleLines + state.overscan);
+    var from = fromLine * columns;
+    var to = Math.min(state.total, toLine * columns);
+    var count = Math.max(0, to - from);
+
+    // Grow the pool to the window size; items map to pool[index % size] so
+    // scrolling by one line rewrites a single line of elements
+    var pool = state.pool;
+    if (pool.length < count) {
+      while (pool.length < count) {
+        var created = document.createElement("div");
+        created.className = state.itemClass;
+        state.itemsEl.appendChild(created);
+        pool.push(created);
+      }
+      pool.forEach(function (node) {
+        node.__dukIndex = -1;
+      });
+    }
+
+    if (state.grid) {
+      // Cells flow through the grid in `order`; the grid starts at fromLine
+      state.itemsEl.style.transform = "translateY(" + fromLine * pitch + "px)";
+    }
+
+    var missing = false;
+    for (var index = from; index < to; index++) {
+      var node = pool[index % pool.length];
+      var row = state.rows.get(index);
+      if (row === undefined) {
+        missing = true;
+      }
+      if (node.__dukIndex !== index || node.__dukRow !== row) {
+        node.__dukIndex = index;
+        node.__dukRow = row;
+        if (state.grid) {
+          node.style.order = index;
+        } else {
+          node.style.height = pitch + "px";
+          node.style.transform = "translateY(" + index * pitch + "px)";
+        }
+        node.setAttribute("data-index", index);
+        node.innerHTML = row === undefined ? "" : fill(state.template, row);
+        node.classList.toggle(state.itemClass + "--loading", row === undefined);
+      }
+    }
+    pool.forEach(function (node) {
+      node.hidden = !(node.__dukIndex >= from && node.__dukIndex < to);
+    });
+
+    state.view = [from, to];
+    if (missing && state.remote) {
+      request(state, from, to);
+    }
+  }
+
+  function evict(state) {
+    // Keep the browser's copy of remote data to a few windows around the view
+    var margin = 2 * state.windowSize;
+    var low = state.view[0] - margin;
+    var high = state.view[1] + margin;
+    state.rows.forEach(function (_, index) {
+      if (index < low || index >= high) {
+        state.rows.delete(index);
+      }
+    });
+  }
+
+  function schedule(state) {
+    if (!state.frame) {
+      state.frame = requestAnimationFrame(function () {
+        state.frame = 0;
+        render(state);
+      });
+    }
+  }
+
+  ns.virtualPage = function (page, id) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (!page) {
+      return noUpdate;
+    }
+    var el = viewportOf(id.id);
+    if (!el) {
+      // First render: the view may not be in the document yet
+      requestAnimationFrame(function () {
+        if (viewportOf(id.id)) {
+          ns.virtualPage(page, id);
+        }
+      });
+      return noUpdate;
+    }
+
+    var state = stateOf(el, id.id);
+    page.rows.forEach(function (row, offset) {
+      state.rows.set(page.start + offset, row);
+    });
+    if (state.pending && state.pending.start === page.start) {
+      state.pending = null;
+    }
+    state.total = page.total;
+
+    var height = state.height;
+    render(state);
+    if (state.remote) {
+      evict(state);
+    }
+    return state.height !== height ? { height: state.height } : noUpdate;
+  };
+
+  ns.virtualRequest = function (nClicks, id) {
+    var el = viewportOf(id.id);
+    var range = el && el.getAttribute("data-duk-request");
+    return range ? JSON.parse(range) : window.dash_clientside.no_update;
+  };
+
+  if (window.__dukVirtual) {
+    return;
+  }
+  window.__dukVirtual = true;
+
+  // Scroll events don't bubble; listen in the capture phase for every view
+  document.addEventListener(
+    "scroll",
+    function (event) {
+      var state = views.get(event.target);
+      if (state) {
+        schedule(state);
+      }
+    },
+    true
+  );
+
+  window.addEventListener("resize", function () {
+    views.forEach(function (state, el) {
+      if (el.isConnected) {
+        schedule(state);
+      } else {
+        views.delete(el);
+      }
+    });
+  });
+})();
@@ -0,0 +1,24 @@
+"""Caching helpers for expensive layouts."""
+
+from dash_ui_kit.cache.interning import (
+    FrozenComponentError,
+    clear_interned,
+    intern_components,
+    interning_info,
+    set_interning,
+)
+from dash_ui_kit.cache.layout import memoize_layout
+from dash_ui_kit.cache.options import OptionsCache, cached_options
+from dash_ui_kit.cache.shared import SharedLayoutCache
+
+__all__ = [
+    "FrozenComponentError",
+    "OptionsCache",
+    "SharedLayoutCache",
+    "cached_options",
+    "clear_interned",
+    "intern_components",
+    "interning_info",
+    "memoize_layout",
+    "set_interning",
+]
@@ -0,0 +1,234 @@
+"""Opt-in sharing of identical, static kit components (flyweights)."""
+
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from dash.development.base_component import Component
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Argument types that make a call safe to share: immutable, hashable values
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+_enabled: ContextVar[Optional[bool]] = ContextVar("duk_interning", default=None)
+_default_enabled = False
+_max_entries = 10_000
+
+_interned: "OrderedDict[Hashable, Component]" = OrderedDict()
+_frozen_types: Dict[Type[Component], Type[Component]] = {}
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+class FrozenComponentError(AttributeError):
+    """Raised when code tries to modify a shared (interned) component."""
+
+
+def _refuse_mutation(self: Component, *args: Any) -> None:
+    raise FrozenComponentError(
+        f"{type(self).__name__} is an interned component shared across the "
+        "layout and cannot be modified. Create it with an id, or outside of "
+        "intern_components(), to get a private instance."
+    )
+
+
+def _thaw(value: Any) -> Any:
+    """Turn the child tuples of a frozen prop back into lists."""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _rebuild(cls: Type[Component], state: Dict[str, Any]) -> Component:
+    """Recreate a component of ``cls`` from its attributes, without ``__init__``."""
+    component: Component = object.__new__(cls)
+    component.__dict__.update(state)
+    return component
+
+
+def _reduce_frozen(self: Component) -> Tuple[Any, ...]:
+    """Pickle (and copy) a shared component as a private, mutable instance."""
+    state = {
+        name: _thaw(value) if name in self._prop_names else value
+        for name, value in self.__dict__.items()
+    }
+    return _rebuild, (type(self).__bases__[0], state)
+
+
+def _frozen_type(cls: Type[Component]) -> Type[Component]:
+    """Return a subclass of ``cls`` whose instances refuse mutation."""
+    frozen = _frozen_types.get(cls)
+    if frozen is None:
+        # Built by the components' own metaclass, as a class statement would
+        metaclass = cast(Callable[..., Type[Component]], type(cls))
+        frozen = metaclass(
+            cls.__name__,
+            (cls,),
+            {
+                # Keep the original module and children metadata so Dash's
+                # component registry is unaffected by the subclass.
+                "__module__": cls.__module__,
+                "_children_props": getattr(cls, "_children_props", []),
+                "__setattr__": _refuse_mutation,
+                "__delattr__": _refuse_mutation,
+                "__setitem__": _refuse_mutation,
+                "__delitem__": _refuse_mutation,
+                "__reduce__": _reduce_frozen,
+            },
+        )
+        _frozen_types[cls] = frozen
+    return frozen
+
+
+def _freeze(value: Any) -> Any:
+    """Freeze a component tree in place, turning child lists into tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Component):
+        for name in value._prop_names:  # pylint: disable=protected-access
+            prop = getattr(value, name, None)
+            if isinstance(prop, (list, tuple, Component)):
+                object.__setattr__(value, name, _freeze(prop))
+        object.__setattr__(value, "__class__", _frozen_type(type(value)))
+    return value
+
+
+def _is_atomic(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_atomic(item) for item in value)
+    return isinstance(value, _ATOMIC_TYPES)
+
+
+def _typed(value: Any) -> Hashable:
+    """Tag values with their type so that e.g. ``1``, ``1.0`` and ``True`` differ."""
+    if isinstance(value, tuple):
+        return tuple(_typed(item) for item in value)
+    return (type(value), value)
+
+
+def is_interning() -> bool:
+    """Return True if kit components are currently interned."""
+    enabled = _enabled.get()
+    return _default_enabled if enabled is None else enabled
+
+
+def set_interning(enabled: bool, max_entries: Optional[int] = None) -> None:
+    """
+    Enable or disable component interning globally.
+
+    Args:
+        enabled: Whether id-less, argument-identical kit components share one
+            instance
+        max_entries: Maximum number of distinct shared components kept
+            (least recently used are dropped first)
+    """
+    global _default_enabled, _max_entries
+    _default_enabled = enabled
+    if max_entries is not None:
+        _max_entries = max_entries
+
+
+@contextmanager
+def intern_components(enabled: bool = True) -> Iterator[None]:
+    """
+    Share identical static kit components while building a layout.
+
+    Inside the block, kit components created without an ``id`` and with only
+    plain values (strings, numbers, booleans, None or tuples of these) as
+    arguments return one shared, immutable instance per distinct set of
+    arguments. Modifying a shared instance raises ``FrozenComponentError``.
+
+    Args:
+        enabled: Set False to disable interning inside the block
+
+    Example:
+        ```python
+        from dash_ui_kit import Badge, intern_components
+
+        with intern_components():
+            rows = [
+                html.Tr([html.Td(name), html.Td(Badge("Active", variant="secondary"))])
+                for name in names
+            ]
+        ```
+    """
+    token = _enabled.set(enabled)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def clear_interned() -> None:
+    """Drop all shared component instances."""
+    with _lock:
+        _interned.clear()
+        _stats["hits"] = _stats["misses"] = 0
+
+
+def interning_info() -> Dict[str, int]:
+    """Return hits, misses and the number of shared instances."""
+    with _lock:
+        return {**_stats, "entries": len(_interned), "max_entries": _max_entries}
+
+
+def internable(func: F) -> F:
+    """
+    Let a kit component factory return shared instances while interning.
+
+    Calls with an ``id`` or with any non-plain argument (components, lists,
+    dicts) always build a new component.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if (
+            not is_interning()
+            or kwargs.get("id") is not None
+            or not all(_is_atomic(arg) for arg in args)
+            or not all(_is_atomic(value) for value in kwargs.values())
+        ):
+            return func(*args, **kwargs)
+
+        key = (
+            func.__module__,
+            func.__qualname__,
+            _typed(args),
+            tuple(sorted((name, _typed(value)) for name, value in kwargs.items())),
+        )
+        with _lock:
+            component = _interned.get(key)
+            if component is not None:
+                _interned.move_to_end(key)
+                _stats["hits"] += 1
+                return component
+
+        component = func(*args, **kwargs)
+        # A positional id (second argument) makes the component addressable
+        if getattr(component, "id", None) is not None:
+            return component
+        component = _freeze(component)
+
+        with _lock:
+            _stats["misses"] += 1
+            _interned[key] = component
+            while len(_interned) > _max_entries:
+                _interned.popitem(last=False)
+        return component
+
+    return cast(F, wrapper)
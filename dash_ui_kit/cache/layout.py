@@ -0,0 +1,219 @@
+"""Memoization of layout factory functions."""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar, cast
+
+from dash_ui_kit.cache.shared import SharedLayoutCache
+from dash_ui_kit.utils.serialization import deserialize_layout, serialize_layout
+
+F = TypeVar("F", bound=Callable[..., Any])
+KeyFunc = Callable[..., Hashable]
+
+
+def _default_key(*args: Any, **kwargs: Any) -> Hashable:
+    """Key a call by its positional and keyword arguments."""
+    return (args, tuple(sorted(kwargs.items())))
+
+
+class _LayoutMemo:
+    """In-process store behind ``memoize_layout``."""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        ttl: Optional[float],
+        max_entries: int,
+        key: KeyFunc,
+        serialize: bool,
+        backend: Optional[SharedLayoutCache],
+        wait_timeout: Optional[float],
+    ) -> None:
+        self.func = func
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.key = key
+        self.serialize = serialize or backend is not None
+        self.backend = backend
+        self.wait_timeout = wait_timeout
+
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._building: Dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _backend_key(self, key: Hashable) -> str:
+        name = f"{self.func.__module__}.{self.func.__qualname__}"
+        return name + ":" + hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, stored value) for a fresh entry. Lock must be held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires and expires <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Store a value and enforce the size limit. Lock must be held."""
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, value: Any) -> Any:
+        return deserialize_layout(value) if self.serialize else value
+
+    def _build(self, key: Hashable, args: Any, kwargs: Any) -> Any:
+        """Build a value, trying the shared backend first."""
+        if self.backend is not None:
+            payload = self.backend.get(self._backend_key(key))
+            if payload is not None:
+                return payload
+
+        layout = self.func(*args, **kwargs)
+        if not self.serialize:
+            return layout
+
+        payload = serialize_layout(layout)
+        if self.backend is not None:
+            self.backend.set(self._backend_key(key), payload, ttl=self.ttl)
+        return payload
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = self.key(*args, **kwargs)
+
+        while True:
+            with self._lock:
+                found, value = self._lookup(key)
+                if found:
+                    self.hits += 1
+                    return self._load(value)
+
+                building = self._building.get(key)
+                if building is None:
+                    # This caller builds; concurrent callers wait for it
+                    self.misses += 1
+                    building = self._building[key] = threading.Event()
+                    break
+
+            # Another thread is building this key. Wait for it, then retry
+            # the lookup (and build ourselves if the builder failed).
+            if not building.wait(self.wait_timeout):
+                self.misses += 1
+                return self._load(self._build(key, args, kwargs))
+
+        try:
+            value = self._build(key, args, kwargs)
+            with self._lock:
+                self._store(key, value)
+        finally:
+            with self._lock:
+                del self._building[key]
+            building.set()
+
+        return self._load(value)
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> None:
+        key = self.key(*args, **kwargs)
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.backend is not None:
+            self.backend.delete(self._backend_key(key))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+
+def memoize_layout(
+    ttl: Optional[float] = 60,
+    max_entries: int = 128,
+    key: Optional[KeyFunc] = None,
+    serialize: bool = False,
+    backend: Optional[SharedLayoutCache] = None,
+    wait_timeout: Optional[float] = 30,
+) -> Callable[[F], F]:
+    """
+    Cache the layouts returned by a layout factory function.
+
+    Concurrent calls for the same key are collapsed: one thread builds the
+    layout while the others wait for its result, so a burst of page loads
+    after expiry triggers a single rebuild.
+
+    Args:
+        ttl: Seconds before a cached layout is rebuilt; None never expires
+        max_entries: Maximum number of cached layouts (least recently used
+            entries are evicted first)
+        key: Callable receiving the factory's arguments and returning a
+            hashable cache key. Use it to vary the cache by user or role,
+            e.g. ``key=lambda: (current_user.role,)``. Defaults to the
+            call arguments.
+        serialize: Store the layout as serialized JSON and rebuild fresh
+            components on every hit, so callers never share component
+            instances
+        backend: Optional ``SharedLayoutCache`` used to share built layouts
+            between worker processes (implies ``serialize``)
+        wait_timeout: Seconds a waiting caller blocks for another thread's
+            build before building itself; None waits indefinitely
+
+    Returns:
+        Callable: Decorator for layout functions. The decorated function has
+        ``invalidate(*args, **kwargs)``, ``cache_clear()`` and
+        ``cache_info()`` helpers.
+
+    Example:
+        ```python
+        from flask_login import current_user
+        from dash_ui_kit import memoize_layout
+
+        @memoize_layout(ttl=60, key=lambda: current_user.role)
+        def build_layout():
+            return Card([CardHeader([CardTitle("Revenue")]), ...])
+
+        app.layout = build_layout
+        ```
+    """
+    if max_entries < 1:
+        raise ValueError("max_entries must be at least 1")
+
+    def decorator(func: F) -> F:
+        memo = _LayoutMemo(
+            func,
+            ttl=ttl,
+            max_entries=max_entries,
+            key=key or _default_key,
+            serialize=serialize,
+            backend=backend,
+            wait_timeout=wait_timeout,
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return memo(*args, **kwargs)
+
+        wrapper.invalidate = memo.invalidate  # type: ignore[attr-defined]
+        wrapper.cache_clear = memo.cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_info = memo.cache_info  # type: ignore[attr-defined]
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,220 @@
+"""Cache of dropdown options built from data sources."""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dash import no_update
+
+from dash_ui_kit.utils.options import Options, build_options
+
+Loader = Callable[[], Any]
+
+
+class OptionsCache:
+    """
+    LRU cache of dropdown options per (source, column, version).
+
+    Filter panels often rebuild the same options from the same column on
+    every callback. The cache builds them once per version of the source
+    and returns the same object afterwards, so the work of computing unique
+    values, sorting and allocating option dicts is skipped.
+
+    A source is either a data object such as a DataFrame (entries are
+    dropped when it is garbage collected) or a hashable name used with a
+    ``load`` function. ``version`` is whatever identifies the state of the
+    data: a timestamp, an ETag or a row count. Entries for older versions
+    are replaced when a new version is requested.
+
+    Args:
+        max_entries: Maximum number of cached option lists (least recently
+            used are evicted first)
+
+    Example:
+        ```python
+        from dash_ui_kit import OptionsCache
+
+        options_cache = OptionsCache(max_entries=256)
+
+        @callback(Output("region", "options"), Input("refresh", "n_intervals"))
+        def regions(_):
+            return options_cache.get(
+                "sales", "region", version=sales_etag(), load=load_sales
+            )
+        ```
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[Hashable, ...], Options] = OrderedDict()
+        self._sources: Dict[Hashable, weakref.ref[Any]] = {}
+        # Reentrant: weakref callbacks may run while the lock is held
+        self._lock = threading.RLock()
+
+    def _source_key(self, source: Any) -> Hashable:
+        """Key a source by name, or by identity for unhashable data objects."""
+        try:
+            hash(source)
+        except TypeError:
+            pass
+        else:
+            if isinstance(source, (str, bytes, int, tuple)):
+                return ("name", source)
+
+        key = ("object", id(source))
+        with self._lock:
+            ref = self._sources.get(key)
+            if ref is None or ref() is not source:
+
+                def forget(_: Any, key: Tuple[str, Any] = key) -> None:
+                    self._forget(key)
+
+                try:
+                    ref = weakref.ref(source, forget)
+                except TypeError:
+                    raise TypeError(
+                        "Options sources must be hashable names or objects "
+                        f"supporting weak references, not {type(source).__name__}"
+                    ) from None
+                self._forget(key)
+                self._sources[key] = ref
+        return key
+
+    def _forget(self, source_key: Hashable) -> None:
+        with self._lock:
+            self._sources.pop(source_key, None)
+            for key in [key for key in self._entries if key[0] == source_key]:
+                del self._entries[key]
+
+    def get(
+        self,
+        source: Any,
+        column: Hashable,
+        version: Hashable = None,
+        label: Optional[Hashable] = None,
+        sort: bool = False,
+        compact: bool = False,
+        load: Optional[Loader] = None,
+        client_version: Hashable = None,
+    ) -> Any:
+        """
+        Return the options for a column of a source.
+
+        Args:
+            source: DataFrame (or any object indexable by column), or a
+                hashable name when ``load`` is given
+            column: Column holding the option values
+            version: Identifies the current state of the source
+            label: Column holding the option labels; defaults to ``column``
+            sort: Sort options by label
+            compact: Return the compact forms accepted by ``dcc.Dropdown``
+                (see ``options_from_columns``)
+            load: Called without arguments to produce the data when options
+                for this version are not cached
+            client_version: Version of the options the browser already has.
+                When it equals ``version``, ``dash.no_update`` is returned so
+                neither the response nor the dropdown changes.
+
+        Returns:
+            The cached options (the same object on every hit), or
+            ``dash.no_update``
+        """
+        if client_version is not None and client_version == version:
+            return no_update
+
+        source_key = self._source_key(source)
+        settings = (column, label, sort, compact)
+        key = (source_key, settings, version)
+        with self._lock:
+            options = self._entries.get(key)
+            if options is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return options
+            self.misses += 1
+
+        data = load() if load is not None else source
+        values = data[column]
+        labels = values if label is None else data[label]
+        options = build_options(labels, values, sort=sort, compact=compact)
+
+        with self._lock:
+            # Drop options built from older versions of the same column
+            for stale in [
+                other
+                for other in self._entries
+                if other[0] == source_key and other[1] == settings
+            ]:
+                del self._entries[stale]
+            self._entries[key] = options
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return options
+
+    def invalidate(self, source: Any = None) -> None:
+        """
+        Drop cached options.
+
+        Args:
+            source: Only drop the options of this source; all by default
+        """
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+                return
+        self._forget(self._source_key(source))
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hits, misses and the number of cached option lists."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_default_cache = OptionsCache()
+
+
+def cached_options(
+    source: Any,
+    column: Hashable,
+    version: Hashable = None,
+    label: Optional[Hashable] = None,
+    sort: bool = False,
+    compact: bool = False,
+    load: Optional[Loader] = None,
+    client_version: Hashable = None,
+) -> Any:
+    """
+    Return options for a column from the shared ``OptionsCache``.
+
+    See ``OptionsCache.get`` for the arguments.
+
+    Example:
+        ```python
+        from dash_ui_kit import cached_options
+
+        @callback(Output("region", "options"), Input("year", "value"))
+        def regions(year):
+            frame = sales_by_year[year]
+            return cached_options(frame, "region", version=year, sort=True)
+        ```
+    """
+    return _default_cache.get(
+        source,
+        column,
+        version=version,
+        label=label,
+        sort=sort,
+        compact=compact,
+        load=load,
+        client_version=client_version,
+    )
@@ -0,0 +1,505 @@
+"""Layout cache shared between worker processes through a memory-mapped file."""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dash_ui_kit.utils.serialization import deserialize_layout, serialize_layout
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore
+
+_MAGIC = b"DUKCACHE"
+_VERSION = 1
+
+# magic, version, slot count, data capacity, data tail, used slots
+_HEADER = struct.Struct("<8sIIQQQ")
+_HEADER_SIZE = 64
+
+# key digest, data offset, payload length, crc32, expires at, stored at
+_SLOT = struct.Struct("<16sQIIdd")
+
+_EMPTY = b"\x00" * 16
+_DELETED = b"\xff" * 16
+
+# Compact the index once this share of slots is occupied (live or deleted)
+_MAX_LOAD = 0.75
+
+_Entry = Tuple[bytes, bytes, float, float]
+
+
+class SharedLayoutCache:
+    """
+    A key/value cache for serialized layouts stored in a memory-mapped file.
+
+    Every worker process on a host that opens the same ``path`` shares the
+    same entries, so an expensive layout built by one gunicorn worker is
+    reused by all the others. The file holds a fixed-size hash index followed
+    by a data region. Writers hold an exclusive ``flock`` and write the
+    payload before its index slot; readers hold a shared lock and verify a
+    CRC32, so a reader never observes a partially written entry.
+
+    Expired entries are treated as misses and their space is reclaimed when
+    the data region or index fills up, at which point the oldest entries are
+    evicted if needed. Hit, miss and eviction counters are kept per process.
+    A cache opened before the server forks its workers can be shared with
+    them: each worker reopens the file on first use to get its own lock.
+
+    On platforms without ``fcntl`` (Windows) locking only covers threads of
+    the current process.
+
+    Args:
+        path: Location of the cache file, created if missing
+        max_entries: Number of index slots (only used when creating the file)
+        max_bytes: Size of the data region (only used when creating the file)
+        default_ttl: Time to live in seconds for entries stored without an
+            explicit ``ttl``; None keeps them until evicted
+
+    Example:
+        ```python
+        from dash_ui_kit import SharedLayoutCache
+
+        cache = SharedLayoutCache("/dev/shm/myapp-layouts.cache", default_ttl=60)
+
+        def build_layout():
+            return cache.get_or_build("home", build_home_layout)
+
+        app.layout = build_layout
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 4096,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: Optional[float] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.path = path
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._thread_lock = threading.RLock()
+        self._pid = os.getpid()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._open(max_entries, max_bytes)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    # ------------------------------------------------------------------
+    # File layout
+    # ------------------------------------------------------------------
+
+    def _open(self, max_entries: int, max_bytes: int) -> None:
+        """Initialise the file if needed and map it into memory."""
+        with self._locked(exclusive=True, mapped=False):
+            if os.fstat(self._fd).st_size < _HEADER_SIZE:
+                size = _HEADER_SIZE + max_entries * _SLOT.size + max_bytes
+                os.ftruncate(self._fd, size)
+                header = _HEADER.pack(_MAGIC, _VERSION, max_entries, max_bytes, 0, 0)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, header)
+
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            magic, version, n_slots, capacity, _, _ = _HEADER.unpack(
+                os.read(self._fd, _HEADER.size)
+            )
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{self.path} is not a dash-ui-kit layout cache")
+
+            self._n_slots = n_slots
+            self._capacity = capacity
+            self._data_start = _HEADER_SIZE + n_slots * _SLOT.size
+            self._map = mmap.mmap(self._fd, self._data_start + capacity)
+
+    def _read_header(self) -> Tuple[int, int]:
+        """Return the current (data tail, used slots)."""
+        _, _, _, _, tail, used = _HEADER.unpack_from(self._map, 0)
+        return tail, used
+
+    def _write_header(self, tail: int, used: int) -> None:
+        _HEADER.pack_into(
+            self._map, 0, _MAGIC, _VERSION, self._n_slots, self._capacity, tail, used
+        )
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT.size
+
+    def _read_slot(self, index: int) -> Tuple[bytes, int, int, int, float, float]:
+        return _SLOT.unpack_from(self._map, self._slot_offset(index))
+
+    def _write_slot(
+        self,
+        index: int,
+        digest: bytes,
+        offset: int = 0,
+        length: int = 0,
+        crc: int = 0,
+        expires: float = 0.0,
+        stored: float = 0.0,
+    ) -> None:
+        _SLOT.pack_into(
+            self._map,
+            self._slot_offset(index),
+            digest,
+            offset,
+            length,
+            crc,
+            expires,
+            stored,
+        )
+
+    def _read_payload(self, offset: int, length: int, crc: int) -> Optional[bytes]:
+        start = self._data_start + offset
+        payload = self._map[start : start + length]
+        if zlib.crc32(payload) != crc:
+            return None
+        return payload
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        # Reserve the sentinel values used for empty and deleted slots
+        if digest in (_EMPTY, _DELETED):
+            digest = b"\x01" + digest[1:]
+        return digest
+
+    def _probe(self, digest: bytes) -> Iterator[int]:
+        start = int.from_bytes(digest[:8], "little") % self._n_slots
+        for step in range(self._n_slots):
+            yield (start + step) % self._n_slots
+
+    def _find(self, digest: bytes) -> Optional[int]:
+        """Return the slot holding ``digest``, if any."""
+        for index in self._probe(digest):
+            slot_digest = self._read_slot(index)[0]
+            if slot_digest == digest:
+                return index
+            if slot_digest == _EMPTY:
+                return None
+        return None
+
+    def _reopen_after_fork(self) -> None:
+        """
+        Give a forked worker its own descriptor and in-process lock.
+
+        ``flock`` locks belong to the open file description, which a forked
+        child shares with its parent through the inherited descriptor; only a
+        descriptor opened by the child itself excludes the other workers.
+        """
+        if self._pid == os.getpid():
+            return
+        inherited = self._fd
+        self._fd = os.open(self.path, os.O_RDWR)
+        os.close(inherited)
+        self._thread_lock = threading.RLock()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def _locked(self, exclusive: bool, mapped: bool = True) -> Iterator[None]:
+        """Hold the in-process lock and, where available, a file lock."""
+        if mapped and self._map.closed:
+            raise ValueError("SharedLayoutCache is closed")
+        self._reopen_after_fork()
+        with self._thread_lock:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _live_entries(self, now: float) -> List[_Entry]:
+        """Collect (digest, payload, expires, stored) for every valid entry."""
+        entries = []
+        for index in range(self._n_slots):
+            digest, offset, length, crc, expires, stored = self._read_slot(index)
+            if digest in (_EMPTY, _DELETED):
+                continue
+            if expires and expires <= now:
+                continue
+            payload = self._read_payload(offset, length, crc)
+            if payload is not None:
+                entries.append((digest, payload, expires, stored))
+        return entries
+
+    def _compact(self, reserve_bytes: int = 0, reserve_slots: int = 0) -> None:
+        """
+        Rewrite the index and data region, dropping expired entries.
+
+        The newest entries are kept first; older ones are evicted until
+        ``reserve_bytes`` of data and ``reserve_slots`` index slots are free.
+        Must be called with the exclusive lock held.
+        """
+        entries = self._live_entries(time.time())
+        entries.sort(key=lambda entry: entry[3], reverse=True)
+
+        max_slots = int(self._n_slots * _MAX_LOAD) - reserve_slots
+        kept: List[_Entry] = []
+        total = 0
+        for entry in entries:
+            if len(kept) >= max_slots or total + len(entry[1]) > (
+                self._capacity - reserve_bytes
+            ):
+                continue
+            kept.append(entry)
+            total += len(entry[1])
+        self.evictions += len(entries) - len(kept)
+
+        index_start = _HEADER_SIZE
+        self._map[index_start : self._data_start] = b"\x00" * (
+            self._data_start - index_start
+        )
+
+        tail = 0
+        for digest, payload, expires, stored in kept:
+            start = self._data_start + tail
+            self._map[start : start + len(payload)] = payload
+            for index in self._probe(digest):
+                if self._read_slot(index)[0] == _EMPTY:
+                    self._write_slot(
+                        index,
+                        digest,
+                        tail,
+                        len(payload),
+                        zlib.crc32(payload),
+                        expires,
+                        stored,
+                    )
+                    break
+            tail += len(payload)
+
+        self._write_header(tail, len(kept))
+
+    def evict_expired(self) -> None:
+        """Drop expired entries and reclaim their space."""
+        with self._locked(exclusive=True):
+            self._compact()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the raw bytes stored under ``key``, or None on a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[bytes]: Stored payload, None if missing or expired
+        """
+        digest = self._digest(key)
+        with self._locked(exclusive=False):
+            index = self._find(digest)
+            payload = None
+            if index is not None:
+                _, offset, length, crc, expires, _ = self._read_slot(index)
+                if not expires or expires > time.time():
+                    payload = self._read_payload(offset, length, crc)
+
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Store raw bytes under ``key``.
+
+        Args:
+            key: Cache key
+            value: Payload to store
+            ttl: Time to live in seconds; defaults to ``default_ttl``
+
+        Raises:
+            ValueError: If the payload is larger than the data region
+        """
+        if len(value) > self._capacity:
+            raise ValueError(
+                f"Value of {len(value)} bytes exceeds cache capacity "
+                f"of {self._capacity} bytes"
+            )
+
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        expires = now + ttl if ttl else 0.0
+        digest = self._digest(key)
+
+        with self._locked(exclusive=True):
+            tail, used = self._read_header()
+            existing = self._find(digest)
+            needs_slot = existing is None
+            if tail + len(value) > self._capacity or (
+                needs_slot and used + 1 > self._n_slots * _MAX_LOAD
+            ):
+                self._compact(reserve_bytes=len(value), reserve_slots=1)
+                tail, used = self._read_header()
+                existing = self._find(digest)
+                needs_slot = existing is None
+
+            start = self._data_start + tail
+            self._map[start : start + len(value)] = value
+
+            if existing is not None:
+                index = existing
+            else:
+                index = next(
+                    i
+                    for i in self._probe(digest)
+                    if self._read_slot(i)[0] in (_EMPTY, _DELETED)
+                )
+                if self._read_slot(index)[0] == _EMPTY:
+                    used += 1
+
+            # The index slot is written last so the entry appears atomically
+            self._write_slot(
+                index, digest, tail, len(value), zlib.crc32(value), expires, now
+            )
+            self._write_header(tail + len(value), used)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove ``key`` from the cache.
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        digest = self._digest(key)
+        with self._locked(exclusive=True):
+            index = self._find(digest)
+            if index is None:
+                return False
+            self._write_slot(index, _DELETED)
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._locked(exclusive=True):
+            self._map[_HEADER_SIZE : self._data_start] = b"\x00" * (
+                self._data_start - _HEADER_SIZE
+            )
+            self._write_header(0, 0)
+
+    def get_layout(self, key: str, components: bool = True) -> Any:
+        """
+        Return the layout stored under ``key``, or None on a miss.
+
+        Args:
+            key: Cache key
+            components: Rebuild Dash components; False returns the JSON spec
+
+        Returns:
+            Any: Cached layout or None
+        """
+        payload = self.get(key)
+        if payload is None:
+            return None
+        return deserialize_layout(payload, components=components)
+
+    def set_layout(self, key: str, layout: Any, ttl: Optional[float] = None) -> None:
+        """
+        Serialize ``layout`` and store it under ``key``.
+
+        Args:
+            key: Cache key
+            layout: Component tree or JSON-compatible value
+            ttl: Time to live in seconds; defaults to ``default_ttl``
+        """
+        self.set(key, serialize_layout(layout), ttl=ttl)
+
+    def get_or_build(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        ttl: Optional[float] = None,
+        components: bool = True,
+    ) -> Any:
+        """
+        Return the cached layout for ``key``, building and storing it on a miss.
+
+        Args:
+            key: Cache key
+            builder: Zero-argument callable returning the layout
+            ttl: Time to live in seconds; defaults to ``default_ttl``
+            components: Rebuild Dash components; False returns the JSON spec
+
+        Returns:
+            Any: The cached or freshly built layout
+        """
+        payload = self.get(key)
+        if payload is None:
+            payload = serialize_layout(builder())
+            self.set(key, payload, ttl=ttl)
+        return deserialize_layout(payload, components=components)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Hit, miss and eviction counts are for the current process; entry and
+        byte counts describe the shared file.
+
+        Returns:
+            Dict[str, Any]: hits, misses, evictions, hit_rate, entries, bytes
+        """
+        now = time.time()
+        entries = 0
+        size = 0
+        with self._locked(exclusive=False):
+            for index in range(self._n_slots):
+                digest, _, length, _, expires, _ = self._read_slot(index)
+                if digest in (_EMPTY, _DELETED) or (expires and expires <= now):
+                    continue
+                entries += 1
+                size += length
+            hits, misses, evictions = self.hits, self.misses, self.evictions
+
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        """Unmap the cache file and release its descriptor."""
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
+
+    def __enter__(self) -> "SharedLayoutCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.stats()["entries"])
@@ -1,7 +1,12 @@
 """Pre-built Dash components with consistent styling."""
 
-from dash_ui_kit.components.badge import Badge
-from dash_ui_kit.components.button import Button
+from dash_ui_kit.components.accordion import (
+    Accordion,
+    AccordionItem,
+    accordion_value_id,
+)
+from dash_ui_kit.components.badge import Badge, BadgePatch
+from dash_ui_kit.components.button import Button, ButtonPatch
 from dash_ui_kit.components.card import (
     Card,
     CardContent,
@@ -9,22 +14,94 @@ from dash_ui_kit.components.card import (
     CardFooter,
     CardHeader,
     CardTitle,
+    LazyCard,
+)
+from dash_ui_kit.components.dialog import Dialog, dialog_trigger_id
+from dash_ui_kit.components.feed import InfiniteFeed
+from dash_ui_kit.components.form import (
+    Form,
+    form_field_id,
+    form_state_id,
+    form_submit_id,
+    form_values_id,
+)
+from dash_ui_kit.components.graph import Graph, graph_id
+from dash_ui_kit.components.input import (
+    Input,
+    InputError,
+    InputGroup,
+    Label,
+    input_error_id,
+    input_source_id,
+    input_value_id,
+)
+from dash_ui_kit.components.select import Select, select_dropdown_id
+from dash_ui_kit.components.skeleton import (
+    Skeleton,
+    SkeletonBadge,
+    SkeletonButton,
+    SkeletonCard,
+    SkeletonRows,
+    SkeletonText,
 )
-from dash_ui_kit.components.input import Input, InputError, InputGroup, Label
-from dash_ui_kit.components.select import Select
+from dash_ui_kit.components.sparkline import Sparkline
+from dash_ui_kit.components.stat import StatCard, stat_cards_from_frame
+from dash_ui_kit.components.table import DataTable, table_state_id
+from dash_ui_kit.components.tabs import Tab, Tabs, tabs_id
+from dash_ui_kit.components.toast import Toaster, toast, toaster_id
+from dash_ui_kit.components.virtual import CardGrid, VirtualList
 
 __all__ = [
+    "Accordion",
+    "AccordionItem",
     "Badge",
+    "BadgePatch",
     "Button",
+    "ButtonPatch",
     "Card",
     "CardContent",
     "CardDescription",
     "CardFooter",
+    "CardGrid",
     "CardHeader",
     "CardTitle",
+    "DataTable",
+    "Dialog",
+    "Form",
+    "InfiniteFeed",
+    "Graph",
     "Input",
     "InputError",
     "InputGroup",
     "Label",
+    "LazyCard",
     "Select",
+    "Skeleton",
+    "SkeletonBadge",
+    "SkeletonButton",
+    "SkeletonCard",
+    "SkeletonRows",
+    "SkeletonText",
+    "Sparkline",
+    "StatCard",
+    "Tab",
+    "Tabs",
+    "Toaster",
+    "VirtualList",
+    "accordion_value_id",
+    "dialog_trigger_id",
+    "form_field_id",
+    "form_state_id",
+    "form_submit_id",
+    "form_values_id",
+    "graph_id",
+    "input_error_id",
+    "input_source_id",
+    "input_value_id",
+    "select_dropdown_id",
+    "stat_cards_from_frame",
+    "table_state_id",
+    "tabs_id",
+    "toast",
+    "toaster_id",
 ]
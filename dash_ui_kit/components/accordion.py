@@ -0,0 +1,235 @@
+"""Accordion component building collapsed item bodies on first expansion."""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.loaders import Loader, LoaderRegistry, load_error, new_token
+from dash_ui_kit.utils.types import Children
+
+
+class AccordionItem(NamedTuple):
+    """
+    One item of an ``Accordion``.
+
+    Attributes:
+        title: Text (or components) of the item's header
+        value: Value identifying the item
+        children: Body built up front
+        load: Called without arguments to build the body the first time the
+            item is expanded, instead of ``children``
+        cache_key: Key of the built body in the ``cache`` of ``Accordion``,
+            shared by every user of the app
+        disabled: Whether the item can be toggled
+    """
+
+    title: Children
+    value: str
+    children: Children = None
+    load: Optional[Loader] = None
+    cache_key: Optional[str] = None
+    disabled: bool = False
+
+
+# Loaders of lazy items by (layout token, item value) and (accordion id, item value)
+_loaders = LoaderRegistry()
+
+
+def accordion_value_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the store holding the values of an ``Accordion``'s open items.
+
+    Args:
+        id: Id passed to ``Accordion``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the ``dcc.Store``
+    """
+    return {"type": "duk-accordion-value", "id": stringify_id(id)}
+
+
+def _accordion_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-accordion-{kind}", "id": stringify_id(id)}
+
+
+def _accordion_item_id(kind: str, id: ComponentId, value: Any) -> Dict[str, Any]:
+    return {"type": f"duk-accordion-{kind}", "id": stringify_id(id), "item": value}
+
+
+def _item_class(is_open: bool) -> str:
+    return cn("duk-accordion__item", is_open and "duk-accordion__item--open")
+
+
+def Accordion(
+    id: ComponentId,
+    items: Sequence[AccordionItem],
+    value: Union[str, Sequence[str], None] = None,
+    multiple: bool = False,
+    cache: Any = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    Collapsible items whose bodies are built on demand.
+
+    Expanding and collapsing happens in the browser, without a server round
+    trip. An item with ``load`` has an empty body until it is first
+    expanded; its body is then built by a callback and kept in the browser.
+    Collapsed bodies are hidden with ``display: none``, so the browser
+    neither lays out nor paints them.
+
+    With a ``cache`` (such as a ``SharedLayoutCache``), items with a
+    ``cache_key`` are built once and reused across users and workers.
+
+    Loaders are kept on the server when the layout is built, under a token
+    stored with the items, so every build (and every user) loads its own
+    bodies even when ids repeat, and under the accordion's id, so a worker
+    that built the same layout can load them too. An item no loader is
+    found for shows an error asking to reload; see ``LoaderRegistry``.
+
+    Args:
+        id: Unique identifier, used to build the ids of the items
+        items: The ``AccordionItem`` items
+        value: Value (or values, with ``multiple``) of the items open
+            initially; none by default
+        multiple: Allow several items to be open at once; otherwise opening
+            an item collapses the others
+        cache: Object with ``get_or_build(key, builder)`` used for items with
+            a ``cache_key``
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: The items and their stores; the open items are the
+        ``data`` of ``accordion_value_id(id)``
+
+    Example:
+        ```python
+        from dash_ui_kit import Accordion, AccordionItem
+
+        Accordion(
+            id="faq",
+            items=[
+                AccordionItem("What is Dash UI Kit?", "what",
+                              children=html.P("A component library.")),
+                AccordionItem("Billing", "billing", load=build_billing_help),
+            ],
+        )
+        ```
+    """
+    values = [item.value for item in items]
+    if len(set(values)) != len(values):
+        raise ValueError("AccordionItem values must be unique")
+    if value is None:
+        opened = []
+    elif isinstance(value, str):
+        opened = [value]
+    else:
+        opened = list(value)
+    if not multiple and len(opened) > 1:
+        raise ValueError("Only one item can be open without multiple=True")
+
+    token = new_token()
+    children = []
+    loaded = []
+    for item in items:
+        is_open = item.value in opened
+        body = item.children
+        if item.load is None:
+            loaded.append(item.value)
+        else:
+            for key in ((token, item.value), (stringify_id(id), item.value)):
+                _loaders.register(key, item.load, item.cache_key, cache)
+            if is_open:
+                body = _loaders.build((token, item.value))
+                loaded.append(item.value)
+
+        children.append(
+            html.Div(
+                [
+                    html.H3(
+                        html.Button(
+                            [
+                                html.Span(item.title, className="duk-accordion__title"),
+                                html.Span(
+                                    className="duk-accordion__chevron",
+                                    **{"aria-hidden": "true"},
+                                ),
+                            ],
+                            id=_accordion_item_id("toggle", id, item.value),
+                            className="duk-accordion__trigger",
+                            disabled=item.disabled,
+                            n_clicks=0,
+                            **{"aria-expanded": "true" if is_open else "false"},
+                        ),
+                        className="duk-accordion__header",
+                    ),
+                    html.Div(
+                        body,
+                        id=_accordion_item_id("body", id, item.value),
+                        className="duk-accordion__body",
+                        role="region",
+                    ),
+                ],
+                id=_accordion_item_id("item", id, item.value),
+                className=_item_class(is_open),
+            )
+        )
+
+    children += [
+        dcc.Store(id=accordion_value_id(id), data=opened),
+        dcc.Store(id=_accordion_id("loaded", id), data=loaded),
+        dcc.Store(id=_accordion_id("request", id)),
+        dcc.Store(id=_accordion_id("token", id), data=token),
+    ]
+    return html.Div(
+        children,
+        className=cn("duk-accordion", className),
+        **{"data-duk-multiple": "true" if multiple else "false"},
+        **kwargs,
+    )
+
+
+# Expands and collapses items, asking the server only for unloaded bodies
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="accordionToggle"),
+    dash.Output(_accordion_item_id("item", dash.MATCH, dash.ALL), "className"),
+    dash.Output(_accordion_item_id("toggle", dash.MATCH, dash.ALL), "aria-expanded"),
+    dash.Output(accordion_value_id(dash.MATCH), "data"),
+    dash.Output(_accordion_id("request", dash.MATCH), "data"),
+    dash.Input(_accordion_item_id("toggle", dash.MATCH, dash.ALL), "n_clicks"),
+    dash.State(accordion_value_id(dash.MATCH), "data"),
+    dash.State(_accordion_id("loaded", dash.MATCH), "data"),
+    dash.State(_accordion_item_id("toggle", dash.MATCH, dash.ALL), "id"),
+    prevent_initial_call=True,
+)
+
+
+@dash.callback(
+    dash.Output(_accordion_item_id("body", dash.MATCH, dash.ALL), "children"),
+    dash.Output(_accordion_id("loaded", dash.MATCH), "data"),
+    dash.Input(_accordion_id("request", dash.MATCH), "data"),
+    dash.State(_accordion_id("loaded", dash.MATCH), "data"),
+    dash.State(_accordion_id("token", dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _load_item(
+    request: Optional[Dict[str, Any]], loaded: List[str], token: str
+) -> Tuple[List[Any], List[str]]:
+    """Build the body of an item expanded for the first time."""
+    if not request or request["value"] in loaded:
+        raise PreventUpdate
+    value = request["value"]
+    key = _loaders.find((token, value), (dash.ctx.triggered_id["id"], value))
+
+    bodies = dash.ctx.outputs_list[0]
+    content = load_error() if key is None else _loaders.build(key)
+    return (
+        [content if body["id"]["item"] == value else dash.no_update for body in bodies],
+        # Items that failed are requested again when next expanded
+        loaded if key is None else loaded + [value],
+    )
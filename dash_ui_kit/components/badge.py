@@ -1,16 +1,46 @@
 """Badge component for labels and tags."""
 
-from typing import Any, Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
 from dash import html
 
+from dash_ui_kit.cache.interning import internable
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.patch import ComponentPatch
 from dash_ui_kit.utils.types import Children
 
 VariantType = Literal["default", "secondary", "outline", "destructive"]
 SizeType = Literal["sm", "md", "lg"]
 
 
+def badge_class_name(
+    variant: VariantType = "default", size: SizeType = "md", className: str = ""
+) -> str:
+    """
+    Compute the class string of a Badge.
+
+    Args:
+        variant: Visual style variant
+        size: Badge size
+        className: Additional CSS classes
+
+    Returns:
+        str: Class string used by ``Badge``
+    """
+    # Base badge classes
+    base_classes = "duk-badge"
+
+    # Variant classes
+    variant_classes = f"duk-badge--{variant}"
+
+    # Size classes
+    size_classes = f"duk-badge--{size}"
+
+    # Compose final class string
+    return cn(base_classes, variant_classes, size_classes, className)
+
+
+@internable
 def Badge(
     children: Children = None,
     id: Optional[str] = None,
@@ -59,16 +89,56 @@ def Badge(
         Badge("Large", size="lg")
         ```
     """
-    # Base badge classes
-    base_classes = "duk-badge"
+    badge_classes = badge_class_name(variant, size, className)
 
-    # Variant classes
-    variant_classes = f"duk-badge--{variant}"
+    if id is not None:
+        kwargs["id"] = id
 
-    # Size classes
-    size_classes = f"duk-badge--{size}"
+    return html.Span(children, className=badge_classes, **kwargs)
 
-    # Compose final class string
-    badge_classes = cn(base_classes, variant_classes, size_classes, className)
 
-    return html.Span(children, id=id, className=badge_classes, **kwargs)
+class BadgePatch(ComponentPatch):
+    """
+    Partial update of an existing Badge.
+
+    The class string is derived from ``variant``, ``size`` and ``className``
+    together; arguments left as None use the ``Badge`` defaults.
+
+    Args:
+        children: New badge label
+        variant: New visual style variant
+        size: New badge size
+        className: Additional CSS classes
+
+    Example:
+        ```python
+        from dash_ui_kit import BadgePatch
+
+        @callback(*BadgePatch.outputs("status"), Input("poll", "n_intervals"))
+        def update_status(_):
+            if service_is_down():
+                return BadgePatch("Down", variant="destructive").values()
+            return BadgePatch("Up", variant="secondary").values()
+        ```
+    """
+
+    PROPS = ("className", "children")
+
+    def __init__(
+        self,
+        children: Children = None,
+        variant: Optional[VariantType] = None,
+        size: Optional[SizeType] = None,
+        className: Optional[str] = None,
+    ) -> None:
+        props: Dict[str, Any] = {}
+
+        if variant is not None or size is not None or className is not None:
+            props["className"] = badge_class_name(
+                variant or "default", size or "md", className or ""
+            )
+
+        if children is not None:
+            props["children"] = children
+
+        super().__init__(props)
@@ -1,25 +1,65 @@
 """Button component with multiple variants and sizes."""
 
-from typing import Any, Literal, Optional, Union
+from typing import Any, Dict, Literal, Optional
 
 from dash import html
 
+from dash_ui_kit.cache.interning import internable
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.patch import ComponentPatch
 from dash_ui_kit.utils.types import Children
 
 VariantType = Literal["default", "outline", "ghost", "destructive"]
 SizeType = Literal["sm", "md", "lg"]
 
 
+def button_class_name(
+    variant: VariantType = "default",
+    size: SizeType = "md",
+    className: str = "",
+    loading: bool = False,
+) -> str:
+    """
+    Compute the class string of a Button.
+
+    Args:
+        variant: Visual style variant
+        size: Button size
+        className: Additional CSS classes
+        loading: Whether to add the loading state class
+
+    Returns:
+        str: Class string used by ``Button``
+    """
+    # Base button classes
+    base_classes = "duk-button"
+
+    # Variant classes
+    variant_classes = f"duk-button--{variant}"
+
+    # Size classes
+    size_classes = f"duk-button--{size}"
+
+    # Loading state class, drawing the spinner in CSS
+    loading_classes = "duk-button--loading" if loading else ""
+
+    # Compose final class string
+    return cn(base_classes, variant_classes, size_classes, className, loading_classes)
+
+
+@internable
 def Button(
     children: Children = None,
-    id: Optional[str] = None,
+    id: Optional[ComponentId] = None,
     variant: VariantType = "default",
     size: SizeType = "md",
     disabled: bool = False,
     loading: bool = False,
     className: str = "",
     n_clicks: int = 0,
+    loading_until: Optional[ComponentId] = None,
+    loading_timeout: float = 30,
     **kwargs: Any
 ) -> html.Button:
     """
@@ -38,9 +78,16 @@ def Button(
             - "md": Medium (40px height)
             - "lg": Large (48px height)
         disabled: Whether button is disabled
-        loading: Whether to show loading state
+        loading: Whether to show loading state (a spinner drawn by the
+            ``duk-button--loading`` class; also disables the button)
         className: Additional CSS classes
         n_clicks: Click counter (Dash callback property)
+        loading_until: Id of a component updated by this button's callback.
+            When set, the button shows a spinner and is disabled in the
+            browser as soon as it is clicked, and is restored once that
+            component has been updated, with no extra callbacks.
+        loading_timeout: Seconds after which the clientside loading state is
+            cleared even if the component was not updated
         **kwargs: Additional props passed to html.Button
 
     Returns:
@@ -67,36 +114,109 @@ def Button(
         # States
         Button("Disabled", disabled=True)
         Button("Loading", loading=True)
+
+        # Clientside loading state until "results" is updated
+        Button("Run report", id="run-btn", loading_until="results")
         ```
     """
-    # Base button classes
-    base_classes = "duk-button"
+    button_classes = button_class_name(variant, size, className, loading)
 
-    # Variant classes
-    variant_classes = f"duk-button--{variant}"
+    # Clientside loading state, handled by assets/scripts/button.js
+    if loading_until is not None:
+        kwargs["data-duk-loading-until"] = stringify_id(loading_until)
+        kwargs["data-duk-loading-timeout"] = loading_timeout
 
-    # Size classes
-    size_classes = f"duk-button--{size}"
-
-    # Compose final class string
-    button_classes = cn(base_classes, variant_classes, size_classes, className)
-
-    # Handle loading state
-    if loading:
-        children = html.Div(
-            [
-                html.Span("⏳", className="inline-block animate-spin mr-2"),
-                children,
-            ],
-            className="flex items-center",
-        )
-        disabled = True
+    if id is not None:
+        kwargs["id"] = id
 
     return html.Button(
         children,
-        id=id,
         className=button_classes,
         disabled=disabled or loading,
         n_clicks=n_clicks,
         **kwargs,
     )
+
+
+class ButtonPatch(ComponentPatch):
+    """
+    Partial update of an existing Button.
+
+    Computes the ``className``, ``disabled`` and ``children`` props a
+    ``Button`` built with the given arguments would have, so a callback can
+    switch variant or loading state without resending the button.
+
+    The class string is derived from ``variant``, ``size``, ``className``
+    and ``loading`` together; arguments left as None use the ``Button``
+    defaults, so pass the ones the button was built with. Setting
+    ``loading`` requires all three, so toggling it never resets the
+    button's style. The loading state is only a class (plus ``disabled``),
+    so turning it on or off never resends ``children``, which is only
+    updated when given.
+
+    Args:
+        variant: New visual style variant
+        size: New button size
+        className: Additional CSS classes
+        loading: Whether to show the loading state (also disables the
+            button); False clears it. Needs ``variant``, ``size`` and
+            ``className``
+        disabled: Whether the button is disabled
+        children: New button content
+
+    Example:
+        ```python
+        from dash_ui_kit import ButtonPatch
+
+        @callback(
+            *ButtonPatch.outputs("save-btn"),
+            Input("save-btn", "n_clicks"),
+            prevent_initial_call=True,
+        )
+        def start_saving(_):
+            # The arguments save-btn was built with, plus the loading state
+            return ButtonPatch(
+                variant="outline", size="sm", className="", loading=True
+            ).values()
+        ```
+
+    Raises:
+        ValueError: If ``loading`` is given without ``variant``, ``size``
+            and ``className``
+    """
+
+    PROPS = ("className", "disabled", "children")
+
+    def __init__(
+        self,
+        variant: Optional[VariantType] = None,
+        size: Optional[SizeType] = None,
+        className: Optional[str] = None,
+        loading: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        children: Children = None,
+    ) -> None:
+        if loading is not None and None in (variant, size, className):
+            raise ValueError(
+                "ButtonPatch(loading=...) rebuilds the button's classes: pass "
+                "the variant, size and className it was built with"
+            )
+        props: Dict[str, Any] = {}
+
+        if (
+            variant is not None
+            or size is not None
+            or className is not None
+            or loading is not None
+        ):
+            props["className"] = button_class_name(
+                variant or "default", size or "md", className or "", bool(loading)
+            )
+
+        if loading is not None or disabled is not None:
+            props["disabled"] = bool(disabled) or bool(loading)
+
+        if children is not None:
+            props["children"] = children
+
+        super().__init__(props)
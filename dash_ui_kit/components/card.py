@@ -1,15 +1,38 @@
 """Card component with sub-components for structured content."""
 
-from typing import Any, Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
-from dash import html
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
 
+from dash_ui_kit.cache.interning import internable
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.loaders import Loader, LoaderRegistry, load_error, new_token
 from dash_ui_kit.utils.types import Children
 
 VariantType = Literal["default", "outlined", "elevated"]
 
 
+def card_class_name(variant: VariantType = "default", className: str = "") -> str:
+    """
+    Compute the class string of a Card.
+
+    Args:
+        variant: Visual style variant
+        className: Additional CSS classes
+
+    Returns:
+        str: Class string used by ``Card``
+    """
+    base_classes = "duk-card"
+    variant_classes = f"duk-card--{variant}" if variant != "default" else ""
+
+    return cn(base_classes, variant_classes, className)
+
+
+@internable
 def Card(
     children: Children = None,
     id: Optional[str] = None,
@@ -47,14 +70,15 @@ def Card(
         ])
         ```
     """
-    base_classes = "duk-card"
-    variant_classes = f"duk-card--{variant}" if variant != "default" else ""
+    card_classes = card_class_name(variant, className)
 
-    card_classes = cn(base_classes, variant_classes, className)
+    if id is not None:
+        kwargs["id"] = id
 
-    return html.Div(children, id=id, className=card_classes, **kwargs)
+    return html.Div(children, className=card_classes, **kwargs)
 
 
+@internable
 def CardHeader(
     children: Children = None,
     id: Optional[str] = None,
@@ -73,9 +97,13 @@ def CardHeader(
     Returns:
         html.Div: Styled card header
     """
-    return html.Div(children, id=id, className=cn("duk-card-header", className), **kwargs)
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.Div(children, className=cn("duk-card-header", className), **kwargs)
 
 
+@internable
 def CardTitle(
     children: Children = None,
     id: Optional[str] = None,
@@ -94,9 +122,13 @@ def CardTitle(
     Returns:
         html.H3: Styled card title
     """
-    return html.H3(children, id=id, className=cn("duk-card-title", className), **kwargs)
+    if id is not None:
+        kwargs["id"] = id
 
+    return html.H3(children, className=cn("duk-card-title", className), **kwargs)
 
+
+@internable
 def CardDescription(
     children: Children = None,
     id: Optional[str] = None,
@@ -115,11 +147,13 @@ def CardDescription(
     Returns:
         html.P: Styled card description
     """
-    return html.P(
-        children, id=id, className=cn("duk-card-description", className), **kwargs
-    )
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.P(children, className=cn("duk-card-description", className), **kwargs)
 
 
+@internable
 def CardContent(
     children: Children = None,
     id: Optional[str] = None,
@@ -138,11 +172,13 @@ def CardContent(
     Returns:
         html.Div: Styled card content
     """
-    return html.Div(
-        children, id=id, className=cn("duk-card-content", className), **kwargs
-    )
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.Div(children, className=cn("duk-card-content", className), **kwargs)
 
 
+@internable
 def CardFooter(
     children: Children = None,
     id: Optional[str] = None,
@@ -161,6 +197,144 @@ def CardFooter(
     Returns:
         html.Div: Styled card footer
     """
-    return html.Div(
-        children, id=id, className=cn("duk-card-footer", className), **kwargs
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.Div(children, className=cn("duk-card-footer", className), **kwargs)
+
+
+# Loaders of lazy cards by layout token and by card id
+_loaders = LoaderRegistry()
+
+
+def _lazy_card_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-lazy-card-{kind}", "id": stringify_id(id)}
+
+
+def LazyCard(
+    id: ComponentId,
+    header: Children,
+    load: Loader,
+    placeholder: Children = None,
+    footer: Children = None,
+    variant: VariantType = "default",
+    root_margin: str = "200px",
+    max_concurrent: int = 4,
+    cache_key: Optional[str] = None,
+    cache: Any = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A card whose content is built when it scrolls into view.
+
+    The header (and footer) render with the page; the content is requested
+    by a callback only once the card comes within ``root_margin`` of the
+    viewport, detected with an ``IntersectionObserver``. At most
+    ``max_concurrent`` cards load at a time, in the order they became
+    visible, so a dashboard of 40 query-backed cards only pays for the ones
+    the user sees.
+
+    ``load`` is kept on the server under a token stored in the card, so
+    every build of the layout loads its own content even when ids repeat,
+    and under the card's id, so a worker that built the same layout can
+    load it too. A card no loader is found for shows an error asking to
+    reload; see ``LoaderRegistry``.
+
+    Args:
+        id: Unique identifier, used to request the content
+        header: Header shown immediately (typically a ``CardHeader``)
+        load: Called without arguments to build the card content
+        placeholder: Shown until the content arrives; an empty, shaded
+            block by default
+        footer: Footer shown immediately (typically a ``CardFooter``)
+        variant: Visual style variant, as for ``Card``
+        root_margin: How far outside the viewport loading starts (CSS
+            margin syntax)
+        max_concurrent: Maximum number of cards loading at the same time
+        cache_key: Key of the built content in ``cache``
+        cache: Object with ``get_or_build(key, builder)``, such as a
+            ``SharedLayoutCache``, for content shared by every user
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Styled card container
+
+    Example:
+        ```python
+        from dash_ui_kit import CardHeader, CardTitle, LazyCard
+
+        LazyCard(
+            id="revenue-by-region",
+            header=CardHeader(CardTitle("Revenue by region")),
+            load=build_revenue_chart,  # runs a slow query
+        )
+        ```
+    """
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+    token = new_token()
+    for key in (token, stringify_id(id)):
+        _loaders.register(key, load, cache_key, cache)
+
+    children = [
+        header,
+        html.Div(
+            placeholder,
+            id=_lazy_card_id("body", id),
+            className="duk-card-content duk-lazy-card__body duk-lazy-card__body--loading",
+        ),
+    ]
+    if footer is not None:
+        children.append(footer)
+    children += [
+        dcc.Store(id=_lazy_card_id("request", id)),
+        dcc.Store(id=_lazy_card_id("token", id), data=token),
+        html.Div(id=_lazy_card_id("trigger", id), hidden=True),
+    ]
+
+    return Card(
+        children,
+        variant=variant,
+        className=cn("duk-lazy-card", className),
+        **{
+            "data-duk-root-margin": root_margin,
+            "data-duk-concurrency": str(max_concurrent),
+        },
+        **kwargs,
     )
+
+
+# Registers the card with the observer when it mounts; with Dash < 2.16 (no
+# set_props) the script clicks the hidden trigger to request the content
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="lazyCardRequest"),
+    dash.Output(_lazy_card_id("request", dash.MATCH), "data"),
+    dash.Input(_lazy_card_id("trigger", dash.MATCH), "n_clicks"),
+    dash.State(_lazy_card_id("trigger", dash.MATCH), "id"),
+)
+
+
+@dash.callback(
+    dash.Output(_lazy_card_id("body", dash.MATCH), "children"),
+    dash.Input(_lazy_card_id("request", dash.MATCH), "data"),
+    dash.State(_lazy_card_id("token", dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _load_card(request: Optional[Dict[str, Any]], token: str) -> Any:
+    """Build the content of a card that scrolled into view."""
+    if not request:
+        raise PreventUpdate
+    key = _loaders.find(token, dash.ctx.triggered_id["id"])
+    return load_error() if key is None else _loaders.build(key)
+
+
+# Frees the card's loading slot once its content has arrived
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="lazyCardLoaded"),
+    dash.Output(_lazy_card_id("body", dash.MATCH), "className"),
+    dash.Input(_lazy_card_id("body", dash.MATCH), "children"),
+    dash.State(_lazy_card_id("body", dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
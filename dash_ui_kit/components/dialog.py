@@ -0,0 +1,201 @@
+"""Dialog component mounting its content only while open."""
+
+from typing import Any, Dict, Optional
+
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.components.button import Button
+from dash_ui_kit.components.button import VariantType as ButtonVariantType
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.loaders import Loader, LoaderRegistry, load_error, new_token
+from dash_ui_kit.utils.types import Children
+
+# Loaders of dialog content by layout token and by dialog id
+_loaders = LoaderRegistry()
+
+
+def dialog_trigger_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the button opening a ``Dialog``.
+
+    Args:
+        id: Id passed to ``Dialog``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the trigger button
+    """
+    return {"type": "duk-dialog-trigger", "id": stringify_id(id)}
+
+
+def _dialog_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-dialog-{kind}", "id": stringify_id(id)}
+
+
+def _dialog_content(
+    id: ComponentId,
+    title: Optional[str],
+    description: Optional[str],
+    body: Children,
+) -> html.Div:
+    """The overlay and panel mounted while the dialog is open."""
+    header = []
+    if title is not None:
+        header.append(html.H2(title, className="duk-dialog__title"))
+    if description is not None:
+        header.append(html.P(description, className="duk-dialog__description"))
+
+    panel = [
+        html.Div(body, className="duk-dialog__body"),
+        html.Button(
+            "×",
+            id=_dialog_id("close", id),
+            className="duk-dialog__close",
+            n_clicks=0,
+            **{"aria-label": "Close"},
+        ),
+    ]
+    if header:
+        panel.insert(0, html.Div(header, className="duk-dialog__header"))
+
+    return html.Div(
+        [
+            html.Div(
+                id=_dialog_id("overlay", id),
+                className="duk-dialog__overlay",
+                n_clicks=0,
+            ),
+            html.Div(
+                panel,
+                className="duk-dialog",
+                role="dialog",
+                tabIndex="-1",
+                **{"aria-modal": "true"},
+            ),
+        ],
+        className="duk-dialog-layer",
+    )
+
+
+def Dialog(
+    id: ComponentId,
+    trigger: Children,
+    load: Loader,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    trigger_variant: ButtonVariantType = "default",
+    cache_key: Optional[str] = None,
+    cache: Any = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A modal dialog whose content exists only while it is open.
+
+    The layout holds just the trigger button and an empty mount point.
+    Clicking the trigger builds the content with ``load`` in a callback and
+    mounts it; closing the dialog (close button, overlay or Escape) removes
+    it again in the browser, without a server round trip. A page with dozens
+    of dialogs costs nothing until one is opened.
+
+    With a ``cache`` (such as a ``SharedLayoutCache``) and a ``cache_key``,
+    the content is built once and reused by every user.
+
+    ``load`` is kept on the server when the layout is built, under a token
+    stored next to the mount point, so every build (and every user) opens
+    its own content even when ids repeat, and under the dialog's id, so a
+    worker that built the same layout can open it too. A dialog no loader
+    is found for opens with an error asking to reload; see
+    ``LoaderRegistry``.
+
+    Args:
+        id: Unique identifier, used to build the ids of the dialog's parts
+        trigger: Content of the button opening the dialog
+        load: Called without arguments to build the dialog body on opening
+        title: Heading of the dialog
+        description: Text under the heading
+        trigger_variant: Variant of the trigger ``Button``
+        cache_key: Key of the built content in ``cache``
+        cache: Object with ``get_or_build(key, builder)``, such as a
+            ``SharedLayoutCache``
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: The trigger button, the dialog's mount point and the
+        loader's token
+
+    Example:
+        ```python
+        from dash_ui_kit import Dialog
+
+        Dialog(
+            id="edit-user",
+            trigger="Edit profile",
+            title="Edit profile",
+            description="Changes are saved when you click Save.",
+            load=build_profile_form,
+        )
+        ```
+    """
+
+    def build() -> html.Div:
+        # Only the body is cached: the frame holds this dialog's own ids
+        if cache is not None and cache_key is not None:
+            body = cache.get_or_build(cache_key, load)
+        else:
+            body = load()
+        return _dialog_content(id, title, description, body)
+
+    token = new_token()
+    for key in (token, stringify_id(id)):
+        _loaders.register(key, build)
+
+    return html.Div(
+        [
+            Button(trigger, id=dialog_trigger_id(id), variant=trigger_variant),
+            html.Div(id=_dialog_id("mount", id), className="duk-dialog-mount"),
+            dcc.Store(id=_dialog_id("token", id), data=token),
+        ],
+        className=cn("duk-dialog-wrapper", className),
+        **kwargs,
+    )
+
+
+@dash.callback(
+    dash.Output(_dialog_id("mount", dash.MATCH), "children"),
+    dash.Input(dialog_trigger_id(dash.MATCH), "n_clicks"),
+    dash.State(_dialog_id("token", dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _open_dialog(n_clicks: Optional[int], token: str) -> html.Div:
+    """Build and mount the content of an opened dialog."""
+    if not n_clicks:
+        raise PreventUpdate
+    id = dash.ctx.triggered_id["id"]
+    key = _loaders.find(token, id)
+    if key is None:
+        return _dialog_content(id, None, None, load_error())
+    return _loaders.build(key)
+
+
+# Unmounts the content when the close button or the overlay is clicked
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="dialogClose"),
+    dash.Output(_dialog_id("mount", dash.MATCH), "children", allow_duplicate=True),
+    dash.Input(_dialog_id("close", dash.MATCH), "n_clicks"),
+    dash.Input(_dialog_id("overlay", dash.MATCH), "n_clicks"),
+    prevent_initial_call=True,
+)
+
+
+# Moves focus into the content once mounted; the className is left unchanged
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="dialogFocus"),
+    dash.Output(_dialog_id("mount", dash.MATCH), "className"),
+    dash.Input(_dialog_id("mount", dash.MATCH), "children"),
+    dash.State(_dialog_id("mount", dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
@@ -0,0 +1,141 @@
+"""Infinite feed component appending pages of items fetched by cursor."""
+
+from typing import Any, Dict, Optional, Tuple
+
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.components.button import Button
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.feeds import FeedSource
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+
+
+def _feed_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-feed-{kind}", "id": stringify_id(id)}
+
+
+def _footer_class(cursor: Optional[str]) -> str:
+    return cn("duk-feed__footer", cursor is None and "duk-feed__footer--done")
+
+
+def InfiniteFeed(
+    id: ComponentId,
+    source: FeedSource,
+    page_size: int = 20,
+    auto: bool = True,
+    more_label: str = "Load more",
+    end_label: str = "No more items",
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A feed that appends the next page of items as the user reaches its end.
+
+    The first page is rendered with the layout. Each further page is fetched
+    from the ``FeedSource`` by cursor and appended with a ``dash.Patch``, so
+    a request sends only the new items, never the items already shown.
+    With ``auto``, pages load when the end of the feed scrolls into view;
+    the "Load more" button works either way.
+
+    Args:
+        id: Unique identifier, used to build the ids of the feed's parts
+        source: ``FeedSource`` serving the items
+        page_size: Items per page (capped by the source's ``max_page_size``)
+        auto: Load the next page when the end of the feed becomes visible
+        more_label: Text of the button loading the next page
+        end_label: Text shown at the end of the feed
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: The items, the footer with the "Load more" button and the
+        feed's stores
+
+    Example:
+        ```python
+        from dash_ui_kit import FeedSource, InfiniteFeed
+
+        activity = FeedSource(fetch_activity, "activity",
+                              key=lambda event: event["id"], render=event_row)
+
+        InfiniteFeed(id="activity", source=activity, page_size=20)
+        ```
+    """
+    if not isinstance(source, FeedSource):
+        raise TypeError("InfiniteFeed needs a FeedSource as source")
+
+    page = source.page(limit=page_size)
+    return html.Div(
+        [
+            html.Div(
+                source.render(page.items),
+                id=_feed_id("items", id),
+                className="duk-feed__items",
+            ),
+            html.Div(
+                [
+                    Button(
+                        more_label,
+                        id=_feed_id("more", id),
+                        variant="outline",
+                        size="sm",
+                        className="duk-feed__more",
+                    ),
+                    html.Span(end_label, className="duk-feed__end"),
+                ],
+                id=_feed_id("footer", id),
+                className=_footer_class(page.cursor),
+            ),
+            dcc.Store(
+                id=_feed_id("state", id),
+                data={
+                    "source": source.name,
+                    "cursor": page.cursor,
+                    "page_size": page_size,
+                },
+            ),
+            dcc.Store(id=_feed_id("request", id)),
+        ],
+        className=cn("duk-feed", className),
+        **{"data-duk-auto": "true" if auto else "false"},
+        **kwargs,
+    )
+
+
+# Requests each cursor once, and watches the end of the feed with `auto`
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="feedRequest"),
+    dash.Output(_feed_id("request", dash.MATCH), "data"),
+    dash.Input(_feed_id("more", dash.MATCH), "n_clicks"),
+    dash.Input(_feed_id("state", dash.MATCH), "data"),
+    dash.State(_feed_id("state", dash.MATCH), "id"),
+)
+
+
+@dash.callback(
+    dash.Output(_feed_id("items", dash.MATCH), "children"),
+    dash.Output(_feed_id("state", dash.MATCH), "data"),
+    dash.Output(_feed_id("footer", dash.MATCH), "className"),
+    dash.Input(_feed_id("request", dash.MATCH), "data"),
+    dash.State(_feed_id("state", dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _load_page(
+    request: Optional[Dict[str, Any]], state: Dict[str, Any]
+) -> Tuple[dash.Patch, Dict[str, Any], str]:
+    """Append the page following the feed's cursor."""
+    # Ignore requests for a page already appended
+    if not request or state["cursor"] is None or request["cursor"] != state["cursor"]:
+        raise PreventUpdate
+
+    source = FeedSource.get(state["source"])
+    try:
+        page = source.page(state["cursor"], state["page_size"])
+    except ValueError:
+        raise PreventUpdate from None
+
+    items = dash.Patch()
+    items.extend(source.render(page.items))
+    return items, {**state, "cursor": page.cursor}, _footer_class(page.cursor)
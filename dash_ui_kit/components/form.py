@@ -0,0 +1,184 @@
+"""Form container that submits all of its fields in one callback payload."""
+
+from typing import Any, Dict, List, Optional
+
+import dash
+from dash import ClientsideFunction, dcc, html
+
+from dash_ui_kit.components.input import input_source_id
+from dash_ui_kit.components.select import select_dropdown_id
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.types import Children
+
+
+def form_field_id(form: ComponentId, name: str) -> Dict[str, Any]:
+    """
+    Id for a field (``Input``, ``Select`` or any component with a ``value``)
+    collected by a ``Form``.
+
+    Kit components that wrap their field (gated or validated ``Input``,
+    server-searched ``Select``) are collected too: the element carrying the
+    ``value`` keeps this id, stringified, as its ``id`` key.
+
+    Args:
+        form: Id of the form
+        name: Field name, used as the key in the submitted values
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id for the field
+    """
+    return {"type": "duk-form-field", "form": stringify_id(form), "name": name}
+
+
+def form_submit_id(form: ComponentId) -> Dict[str, Any]:
+    """
+    Id for the button submitting a ``Form``.
+
+    Args:
+        form: Id of the form
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id for the submit button
+    """
+    return {"type": "duk-form-submit", "form": stringify_id(form)}
+
+
+def form_values_id(form: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the store receiving a ``Form``'s submitted values.
+
+    Its ``data`` is a dict of field name to value, holding only the fields
+    changed since the previous submission (or every field with
+    ``changed_only=False``).
+
+    Args:
+        form: Id of the form
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the values ``dcc.Store``
+    """
+    return {"type": "duk-form-values", "form": stringify_id(form)}
+
+
+def form_state_id(form: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the store holding every field value as of the last submission.
+
+    The store stays in the browser; use it as a ``State`` when a callback
+    needs the complete form alongside the changed fields.
+
+    Args:
+        form: Id of the form
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the state ``dcc.Store``
+    """
+    return {"type": "duk-form-state", "form": stringify_id(form)}
+
+
+def _form_config_id(form: Any) -> Dict[str, Any]:
+    return {"type": "duk-form-config", "form": stringify_id(form)}
+
+
+# Ids of the elements carrying the value of fields wrapped by kit components
+_WRAPPED_FIELD_IDS = (input_source_id, select_dropdown_id)
+
+
+def Form(
+    children: Children = None,
+    id: Optional[ComponentId] = None,
+    changed_only: bool = True,
+    initial: Optional[Dict[str, Any]] = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A form container whose fields are submitted together in one payload.
+
+    Fields are identified with ``form_field_id(form, name)`` and submitted
+    by a button with id ``form_submit_id(form)``. On click, field values are
+    gathered and diffed in the browser, and only the changed fields are
+    written to the store ``form_values_id(form)``; if nothing changed no
+    request is made at all. One callback listening to that store replaces a
+    ``State`` per field and per-field validation callbacks.
+
+    Args:
+        children: Form content (InputGroup, Label, Input, Select, Button...)
+        id: Form id, used to build the field, submit and store ids
+        changed_only: Submit only fields changed since the last submission.
+            The first submission includes every field that differs from
+            ``initial``.
+        initial: Field values the form starts from, by name
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Form container holding the children and its stores
+
+    Example:
+        ```python
+        from dash_ui_kit import Form, form_field_id, form_submit_id, form_values_id
+
+        Form(
+            [
+                InputGroup([
+                    Label("Email"),
+                    Input(id=form_field_id("signup", "email"), type="email"),
+                ]),
+                Select(id=form_field_id("signup", "plan"), options=plans),
+                Button("Save", id=form_submit_id("signup")),
+            ],
+            id="signup",
+        )
+
+        @callback(Output("status", "children"), Input(form_values_id("signup"), "data"))
+        def save(changes):
+            # e.g. {"email": "new@example.com"}
+            ...
+        ```
+    """
+    if id is None:
+        raise ValueError("Form needs an id to build its field and store ids")
+
+    if children is None:
+        content: List[Any] = []
+    elif isinstance(children, (list, tuple)):
+        content = list(children)
+    else:
+        content = [children]
+
+    return html.Div(
+        content
+        + [
+            dcc.Store(id=_form_config_id(id), data={"changed_only": changed_only}),
+            dcc.Store(id=form_state_id(id), data=initial or {}),
+            dcc.Store(id=form_values_id(id)),
+        ],
+        className=cn("duk-form", className),
+        **kwargs,
+    )
+
+
+# Gather and diff field values clientside (assets/scripts/form.js) so only
+# changed fields are sent, in a single request per submission. Wrapped
+# fields of every form are passed along and filtered by their parsed id.
+dash.clientside_callback(
+    ClientsideFunction(namespace="dash_ui_kit", function_name="collectForm"),
+    dash.Output(form_values_id(dash.MATCH), "data"),
+    dash.Output(form_state_id(dash.MATCH), "data"),
+    dash.Input(form_submit_id(dash.MATCH), "n_clicks"),
+    dash.State(
+        {"type": "duk-form-field", "form": dash.MATCH, "name": dash.ALL}, "value"
+    ),
+    dash.State({"type": "duk-form-field", "form": dash.MATCH, "name": dash.ALL}, "id"),
+    dash.State(_form_config_id(dash.MATCH), "data"),
+    dash.State(form_state_id(dash.MATCH), "data"),
+    dash.State(_form_config_id(dash.MATCH), "id"),
+    *[
+        dash.State(field_id(dash.ALL), prop)
+        for field_id in _WRAPPED_FIELD_IDS
+        for prop in ("value", "id")
+    ],
+    prevent_initial_call=True,
+)
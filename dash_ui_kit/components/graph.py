@@ -0,0 +1,294 @@
+"""Graph component resampling large traces on the server as users zoom."""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import dash
+import plotly.graph_objects as go
+import plotly.io as pio
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.themes import figures  # noqa: F401 - registers "dash_ui_kit"
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.downsample import minmax_indices
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+# Trace types drawn as lines or markers along x, which can be resampled
+_RESAMPLED_TYPES = ("scatter", "scattergl")
+
+# Full-resolution traces per page view, least recently used evicted first
+# once they hold more than _MEMORY_LIMIT bytes
+_MEMORY_LIMIT = 256 * 1024 * 1024
+_sessions: "OrderedDict[str, _Session]" = OrderedDict()
+_session_bytes = 0
+_lock = threading.Lock()
+
+# Estimated bytes per value of object arrays (such as date strings), which
+# only hold references
+_OBJECT_ITEM_BYTES = 64
+
+
+class _Series(NamedTuple):
+    """Full-resolution data of one resampled trace."""
+
+    trace: int
+    axis: str
+    positions: Any
+    x: Any
+    y: Any
+
+
+class _Session(NamedTuple):
+    """Resampled traces of one page view, kept on the server."""
+
+    series: List[_Series]
+    points: int
+    size: int
+
+
+def _nbytes(series: List[_Series]) -> int:
+    """Approximate memory held by the full data of resampled traces."""
+    total = 0
+    for item in series:
+        for values in (item.positions, item.x, item.y):
+            total += values.nbytes
+            if values.dtype.kind == "O":
+                total += values.size * _OBJECT_ITEM_BYTES
+    return total
+
+
+def _keep_session(token: str, series: List[_Series], points: int) -> None:
+    """Keep the full data of a page view, evicting the least recent ones."""
+    global _session_bytes
+    session = _Session(series, points, _nbytes(series))
+    with _lock:
+        _sessions[token] = session
+        _session_bytes += session.size
+        # The newest page view is kept even when it alone exceeds the limit
+        while _session_bytes > _MEMORY_LIMIT and len(_sessions) > 1:
+            _, evicted = _sessions.popitem(last=False)
+            _session_bytes -= evicted.size
+
+
+def graph_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the ``dcc.Graph`` inside a ``Graph``.
+
+    Args:
+        id: Id passed to ``Graph``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the ``dcc.Graph``
+    """
+    return {"type": "duk-graph", "id": stringify_id(id)}
+
+
+def _graph_session_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-graph-session", "id": stringify_id(id)}
+
+
+def _positions(x: Any) -> Optional[Any]:
+    """X values as ascending floats, or None if they can't be resampled."""
+    if x.dtype.kind == "O":
+        try:
+            x = x.astype("datetime64[ns]")
+        except (TypeError, ValueError):
+            return None
+    if x.dtype.kind in "mM":
+        positions = x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    elif x.dtype.kind in "biuf":
+        positions = x.astype(float)
+    else:
+        return None
+    if len(positions) > 1 and (np.diff(positions) < 0).any():
+        return None
+    return positions
+
+
+def _to_position(value: Any) -> float:
+    """A value of a relayout range (number or date string) as a float."""
+    if isinstance(value, str):
+        stamp = np.datetime64(value.strip().replace(" ", "T"), "ns")
+        return float(stamp.astype(np.int64))
+    return float(value)
+
+
+def _resample(
+    series: _Series, points: int, bounds: Optional[Tuple[float, float]] = None
+) -> Tuple[Any, Any]:
+    """The series' x and y, reduced to ``points`` within ``bounds``."""
+    start, stop = 0, len(series.y)
+    if bounds is not None:
+        low, high = sorted(bounds)
+        # One point beyond each edge, so lines run to the edges of the plot
+        start = max(int(np.searchsorted(series.positions, low)) - 1, 0)
+        stop = min(int(np.searchsorted(series.positions, high, "right")) + 1, stop)
+    kept = minmax_indices(series.y[start:stop], points // 2) + start
+    return series.x[kept], series.y[kept]
+
+
+def _split_figure(figure: Any, points: int) -> Tuple[go.Figure, List[_Series]]:
+    """Resample the long traces of a figure, keeping their full data."""
+    figure = go.Figure(figure)
+    series = []
+    for index, trace in enumerate(figure.data):
+        if trace.type not in _RESAMPLED_TYPES or trace.y is None:
+            continue
+        y = np.asarray(trace.y, dtype=float)
+        if len(y) <= points:
+            continue
+        x = np.arange(len(y)) if trace.x is None else np.asarray(trace.x)
+        positions = _positions(x)
+        if positions is None or len(x) != len(y):
+            continue
+
+        present = ~np.isnan(y)
+        if not present.all():
+            x, y, positions = x[present], y[present], positions[present]
+        axis = "xaxis" + (trace.xaxis or "x")[1:]
+        item = _Series(index, axis, positions, x, y)
+        trace.x, trace.y = _resample(item, points)
+        series.append(item)
+    return figure, series
+
+
+def Graph(
+    id: ComponentId,
+    figure: Any,
+    points: int = 1000,
+    template: Optional[str] = "dash_ui_kit",
+    config: Optional[Dict[str, Any]] = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A chart that stays fast with millions of points.
+
+    Line and marker traces (``scatter`` and ``scattergl``) longer than
+    ``points`` are sent to the browser reduced by min-max bucketing: the
+    lowest and highest point of each bucket, so no spike disappears. Their
+    full data stays on the server for this page view; when the user zooms
+    or pans, a callback resamples the visible range from it and patches
+    just those traces, so detail appears as the user zooms in.
+
+    Full-resolution data is kept in memory per page view. Page views of
+    every user share a budget of 256 MB per process; beyond it, the data
+    of the least recently zoomed views is evicted, and those charts keep
+    their initial resolution. With several worker processes, use sticky
+    sessions (or a single worker) so zooms reach the process holding the
+    data; otherwise the chart keeps its initial resolution as well.
+
+    Traces whose x values aren't numbers or dates in ascending order are
+    sent as they are. Rebuild the ``Graph`` to show a new figure.
+
+    Args:
+        id: Unique identifier, used to build the ids of the graph's parts
+        figure: Plotly figure or figure dict
+        points: Maximum points of each resampled trace, about twice the
+            chart's width in pixels
+        template: Name of the Plotly template to apply (the kit's theme by
+            default); None keeps the figure's own template
+        config: ``dcc.Graph`` config
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: The ``dcc.Graph`` (id ``graph_id(id)``) and its store
+
+    Example:
+        ```python
+        import plotly.graph_objects as go
+        from dash_ui_kit import Graph
+
+        figure = go.Figure(go.Scattergl(x=df["time"], y=df["value"]))
+        Graph(id="sensor", figure=figure)
+        ```
+    """
+    if np is None:
+        raise ImportError("Graph needs NumPy: pip install 'dash-ui-kit[data]'")
+    if points < 2:
+        raise ValueError("points must be at least 2")
+
+    figure, series = _split_figure(figure, points)
+    if template is not None:
+        figure.update_layout(template=pio.templates[template])
+
+    token = None
+    if series:
+        token = uuid.uuid4().hex
+        _keep_session(token, series, points)
+
+    return html.Div(
+        [
+            dcc.Graph(
+                id=graph_id(id),
+                figure=figure,
+                config=config or {},
+                className="duk-graph__chart",
+            ),
+            dcc.Store(id=_graph_session_id(id), data={"token": token}),
+        ],
+        className=cn("duk-graph", className),
+        **kwargs,
+    )
+
+
+def _relayout_ranges(
+    relayout: Dict[str, Any],
+) -> Dict[str, Optional[Tuple[float, float]]]:
+    """X ranges set by a relayout event by axis; None for reset axes."""
+    ranges: Dict[str, Optional[Tuple[float, float]]] = {}
+    for key, value in relayout.items():
+        axis, _, prop = key.partition(".")
+        if not axis.startswith("xaxis"):
+            continue
+        if prop == "autorange" and value:
+            ranges[axis] = None
+        elif prop == "range":
+            ranges[axis] = (_to_position(value[0]), _to_position(value[1]))
+        elif prop in ("range[0]", "range[1]"):
+            start = relayout.get(f"{axis}.range[0]")
+            end = relayout.get(f"{axis}.range[1]")
+            if start is not None and end is not None:
+                ranges[axis] = (_to_position(start), _to_position(end))
+    return ranges
+
+
+@dash.callback(
+    dash.Output(graph_id(dash.MATCH), "figure"),
+    dash.Input(graph_id(dash.MATCH), "relayoutData"),
+    dash.State(_graph_session_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _resample_graph(
+    relayout: Optional[Dict[str, Any]], session: Optional[Dict[str, Any]]
+) -> dash.Patch:
+    """Resample the traces of the zoomed or panned axes."""
+    if not relayout or not session or not session.get("token"):
+        raise PreventUpdate
+    with _lock:
+        kept = _sessions.get(session["token"])
+        if kept is not None:
+            _sessions.move_to_end(session["token"])
+    if kept is None:
+        raise PreventUpdate
+    ranges = _relayout_ranges(relayout)
+    zoomed = [item for item in kept.series if item.axis in ranges]
+    if not zoomed:
+        raise PreventUpdate
+
+    patch = dash.Patch()
+    for item in zoomed:
+        # The number of points comes from the server, never from the browser
+        x, y = _resample(item, kept.points, ranges[item.axis])
+        patch["data"][item.trace]["x"] = x
+        patch["data"][item.trace]["y"] = y
+    return patch
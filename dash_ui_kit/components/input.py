@@ -1,13 +1,18 @@
 """Input component with label and error state support."""
 
-from typing import Any, Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
-from dash import dcc, html
+import dash
+from dash import ClientsideFunction, dcc, html
 
+from dash_ui_kit.cache.interning import internable
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
 from dash_ui_kit.utils.types import Children, InputType
+from dash_ui_kit.utils.validation import Validator
 
 
+@internable
 def InputGroup(
     children: Children = None,
     id: Optional[str] = None,
@@ -35,11 +40,13 @@ def InputGroup(
         ])
         ```
     """
-    return html.Div(
-        children, id=id, className=cn("duk-input-group", className), **kwargs
-    )
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.Div(children, className=cn("duk-input-group", className), **kwargs)
 
 
+@internable
 def Label(
     children: Children = None,
     id: Optional[str] = None,
@@ -60,24 +67,96 @@ def Label(
     Returns:
         html.Label: Styled label
     """
+    if id is not None:
+        kwargs["id"] = id
+
     return html.Label(
-        children, id=id, htmlFor=htmlFor, className=cn("duk-label", className), **kwargs
+        children, htmlFor=htmlFor, className=cn("duk-label", className), **kwargs
     )
 
 
+def input_source_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the text field rendered by a gated ``Input``.
+
+    Args:
+        id: Id passed to ``Input``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the inner ``dcc.Input``
+    """
+    return {"type": "duk-input", "id": stringify_id(id)}
+
+
+def input_value_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the store holding the gated value of an ``Input``.
+
+    Callbacks should listen to its ``data`` prop instead of the field's
+    ``value`` when ``throttle_ms``, ``min_length`` or ``suppress_unchanged``
+    are used.
+
+    Args:
+        id: Id passed to ``Input``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the value ``dcc.Store``
+    """
+    return {"type": "duk-input-value", "id": stringify_id(id)}
+
+
+def input_error_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the ``InputError`` rendered by a validated ``Input``.
+
+    Args:
+        id: Id passed to ``Input``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the error message
+    """
+    return {"type": "duk-input-error", "id": stringify_id(id)}
+
+
+def _input_config_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-input-config", "id": stringify_id(id)}
+
+
+def _input_rules_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-input-rules", "id": stringify_id(id)}
+
+
 def Input(
-    id: Optional[str] = None,
+    id: Optional[ComponentId] = None,
     type: InputType = "text",
     value: str = "",
     placeholder: str = "",
     disabled: bool = False,
     error: bool = False,
     className: str = "",
+    debounce_ms: Optional[int] = None,
+    throttle_ms: Optional[int] = None,
+    min_length: Optional[int] = None,
+    suppress_unchanged: bool = False,
+    validate: Optional[Validator] = None,
     **kwargs: Any
-) -> dcc.Input:
+) -> Any:
     """
     Text input component with various types.
 
+    By default every keystroke updates ``value`` and fires its callbacks.
+    ``debounce_ms`` delays updates until typing pauses, using the debounce
+    built into ``dcc.Input``. ``throttle_ms``, ``min_length`` and
+    ``suppress_unchanged`` are applied in the browser before anything is
+    sent: the field is then wrapped with a store whose ``data`` receives the
+    accepted values, addressed with ``input_value_id(id)``.
+
+    ``validate`` checks every value in the browser: the field gets the
+    ``duk-input--error`` class and an ``InputError`` rendered after it (id
+    ``input_error_id(id)``) shows the message of the first failing rule.
+    Validated inputs are wrapped like gated ones; a ``Form`` still collects
+    them by their ``form_field_id``.
+
     Args:
         id: Unique identifier for Dash callbacks
         type: Input type (text, email, password, number, etc.)
@@ -86,10 +165,19 @@ def Input(
         disabled: Whether input is disabled
         error: Whether input is in error state
         className: Additional CSS classes
+        debounce_ms: Only send the value once typing has paused for this many
+            milliseconds
+        throttle_ms: Send at most one value per this many milliseconds (the
+            latest value is always sent at the end of the window)
+        min_length: Don't send non-empty values shorter than this
+        suppress_unchanged: Don't send a value equal to the last one sent
+        validate: Rules checked clientside on every change. Reuse the same
+            ``Validator`` on the server to check the submitted value.
         **kwargs: Additional props passed to dcc.Input
 
     Returns:
-        dcc.Input: Styled Dash input component
+        dcc.Input: Styled Dash input component, or an ``html.Div`` holding
+        the field and its value store when values are gated clientside
 
     Example:
         ```python
@@ -104,6 +192,17 @@ def Input(
 
         # Input with error
         Input(id="email", error=True)
+
+        # Search box sending at most 2 values per second, 3+ characters
+        Input(id="search", throttle_ms=500, min_length=3, suppress_unchanged=True)
+
+        @callback(Output("results", "children"), Input(input_value_id("search"), "data"))
+        def search(query):
+            ...
+
+        # Validated in the browser, and again on submission
+        email_rules = Validator(required=True, email=True)
+        Input(id="email", type="email", validate=email_rules)
         ```
     """
     base_classes = "duk-input"
@@ -111,20 +210,67 @@ def Input(
 
     input_classes = cn(base_classes, error_class, className)
 
-    return dcc.Input(
-        id=id,
-        type=type,
-        value=value,
-        placeholder=placeholder,
-        disabled=disabled,
-        className=input_classes,
-        **kwargs,
-    )
+    if debounce_ms is not None:
+        kwargs["debounce"] = debounce_ms / 1000
 
+    gated = throttle_ms is not None or min_length is not None or suppress_unchanged
+    if not gated and validate is None:
+        if id is not None:
+            kwargs["id"] = id
 
+        return dcc.Input(
+            type=type,
+            value=value,
+            placeholder=placeholder,
+            disabled=disabled,
+            className=input_classes,
+            **kwargs,
+        )
+
+    if id is None:
+        raise ValueError(
+            "Input needs an id when throttle_ms, min_length, suppress_unchanged "
+            "or validate is set"
+        )
+
+    config = {
+        "throttle_ms": throttle_ms,
+        "min_length": min_length,
+        "suppress_unchanged": suppress_unchanged,
+    }
+
+    children = [
+        dcc.Input(
+            id=input_source_id(id),
+            type=type,
+            value=value,
+            placeholder=placeholder,
+            disabled=disabled,
+            className=input_classes,
+            **kwargs,
+        ),
+        dcc.Store(id=_input_config_id(id), data=config),
+        dcc.Store(id=input_value_id(id), data=value),
+    ]
+    if validate is not None:
+        children += [
+            dcc.Store(
+                id=_input_rules_id(id),
+                data={
+                    "rules": list(validate.rules),
+                    "className": cn(base_classes, className),
+                },
+            ),
+            InputError(id=input_error_id(id)),
+        ]
+
+    return html.Div(children, className="duk-input-wrapper")
+
+
+@internable
 def InputError(
     children: Children = None,
-    id: Optional[str] = None,
+    id: Optional[ComponentId] = None,
     className: str = "",
     **kwargs: Any
 ) -> html.P:
@@ -140,6 +286,32 @@ def InputError(
     Returns:
         html.P: Styled error message
     """
-    return html.P(
-        children, id=id, className=cn("duk-input-error", className), **kwargs
-    )
+    if id is not None:
+        kwargs["id"] = id
+
+    return html.P(children, className=cn("duk-input-error", className), **kwargs)
+
+
+# Gate field values clientside (assets/scripts/input.js) before they reach
+# the value store, so suppressed keystrokes never cause a server request.
+dash.clientside_callback(
+    ClientsideFunction(namespace="dash_ui_kit", function_name="gateInput"),
+    dash.Output(input_value_id(dash.MATCH), "data"),
+    dash.Input(input_source_id(dash.MATCH), "value"),
+    dash.State(_input_config_id(dash.MATCH), "data"),
+    dash.State(input_value_id(dash.MATCH), "data"),
+    dash.State(input_source_id(dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
+
+
+# Validate field values clientside (assets/scripts/validation.js). The error
+# message comes first so the callback only resolves for validated inputs.
+dash.clientside_callback(
+    ClientsideFunction(namespace="dash_ui_kit", function_name="validateInput"),
+    dash.Output(input_error_id(dash.MATCH), "children"),
+    dash.Output(input_source_id(dash.MATCH), "className"),
+    dash.Input(input_source_id(dash.MATCH), "value"),
+    dash.State(_input_rules_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
@@ -1,17 +1,49 @@
 """Select/Dropdown component wrapper."""
 
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from dash import dcc
+import dash
+from dash import dcc, html
 
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.options import is_columnar, options_from_columns, split_columns
+from dash_ui_kit.utils.search import OptionIndex
 
 OptionType = dict[str, Any]
 
 
+def select_dropdown_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the dropdown rendered by a server-searched ``Select``.
+
+    Callbacks read the selected ``value`` from this id when ``options`` is
+    an ``OptionIndex``.
+
+    Args:
+        id: Id passed to ``Select``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the inner ``dcc.Dropdown``
+    """
+    return {"type": "duk-select", "id": stringify_id(id)}
+
+
+def _select_config_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-select-config", "id": stringify_id(id)}
+
+
+def _with_selected(
+    options: List[OptionType], selected: List[OptionType]
+) -> List[OptionType]:
+    """Append the selected options missing from a page of results."""
+    shown = {option["value"] for option in options}
+    return options + [option for option in selected if option["value"] not in shown]
+
+
 def Select(
-    id: Optional[str] = None,
-    options: Optional[List[OptionType]] = None,
+    id: Optional[ComponentId] = None,
+    options: Union[List[OptionType], OptionIndex, Any, None] = None,
     value: Union[str, int, List[Union[str, int]], None] = None,
     multi: bool = False,
     searchable: bool = True,
@@ -19,14 +51,29 @@ def Select(
     placeholder: str = "Select...",
     disabled: bool = False,
     className: str = "",
+    page_size: int = 50,
+    sort_options: bool = False,
     **kwargs: Any
-) -> dcc.Dropdown:
+) -> Any:
     """
     A styled dropdown/select component based on dcc.Dropdown.
 
+    With an ``OptionIndex`` as ``options`` the browser only ever holds one
+    page of options: typing runs a server-side search returning the best
+    ``page_size`` matches (plus the selected options). The dropdown is then
+    wrapped with its configuration and addressed with
+    ``select_dropdown_id(id)``.
+
+    Columnar ``options`` (a NumPy array, a pandas Series, a one- or
+    two-column DataFrame, or a ``(labels, values)`` pair of sequences) are
+    converted with ``options_from_columns``: deduplicated, stripped of
+    missing values, optionally sorted, sent in the most compact form and
+    cached by content.
+
     Args:
         id: Unique identifier for Dash callbacks
-        options: List of option dictionaries with 'label' and 'value' keys
+        options: List of option dictionaries with 'label' and 'value' keys,
+            columnar data, or an ``OptionIndex`` searched on the server
         value: Currently selected value(s)
         multi: Whether to allow multiple selections
         searchable: Whether the dropdown is searchable
@@ -34,10 +81,14 @@ def Select(
         placeholder: Placeholder text
         disabled: Whether dropdown is disabled
         className: Additional CSS classes
+        page_size: Number of matches sent per search with an ``OptionIndex``
+        sort_options: Sort columnar options by label
         **kwargs: Additional props passed to dcc.Dropdown
 
     Returns:
-        dcc.Dropdown: Styled Dash dropdown component
+        dcc.Dropdown: Styled Dash dropdown component, or an ``html.Div``
+        holding the dropdown and its configuration when searched on the
+        server
 
     Example:
         ```python
@@ -65,13 +116,59 @@ def Select(
             multi=True,
             placeholder="Select tags"
         )
+
+        # Options straight from a DataFrame (labels, values)
+        Select(id="customer", options=df[["name", "id"]], sort_options=True)
+
+        # 200k SKUs searched on the server
+        skus = OptionIndex(sku_options, name="skus")
+        Select(id="sku", options=skus)
+
+        @callback(Output("detail", "children"), Input(select_dropdown_id("sku"), "value"))
+        def show(sku):
+            ...
         ```
     """
     base_classes = "duk-select"
     select_classes = cn(base_classes, className)
 
+    if isinstance(options, OptionIndex):
+        if id is None:
+            raise ValueError("Select needs an id when options is an OptionIndex")
+
+        return html.Div(
+            [
+                dcc.Dropdown(
+                    id=select_dropdown_id(id),
+                    options=_with_selected(
+                        options.search("", limit=page_size).options,
+                        options.lookup(value),
+                    ),
+                    value=value,
+                    multi=multi,
+                    searchable=True,
+                    clearable=clearable,
+                    placeholder=placeholder,
+                    disabled=disabled,
+                    className=select_classes,
+                    **kwargs,
+                ),
+                dcc.Store(
+                    id=_select_config_id(id),
+                    data={"source": options.name, "page_size": page_size},
+                ),
+            ],
+            className="duk-select-wrapper",
+        )
+
+    if is_columnar(options):
+        labels, values = split_columns(options)
+        options = options_from_columns(labels, values, sort=sort_options, compact=True)
+
+    if id is not None:
+        kwargs["id"] = id
+
     return dcc.Dropdown(
-        id=id,
         options=options or [],
         value=value,
         multi=multi,
@@ -82,3 +179,23 @@ def Select(
         className=select_classes,
         **kwargs,
     )
+
+
+@dash.callback(
+    dash.Output(select_dropdown_id(dash.MATCH), "options"),
+    dash.Input(select_dropdown_id(dash.MATCH), "search_value"),
+    dash.State(select_dropdown_id(dash.MATCH), "value"),
+    dash.State(_select_config_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _search_options(
+    search_value: Optional[str], value: Any, config: Dict[str, Any]
+) -> List[OptionType]:
+    """Send the best matches for the typed text, keeping selected options."""
+    try:
+        index = OptionIndex.get(config["source"])
+    except KeyError:
+        # Not built in this worker process; offer nothing rather than fail
+        return []
+    page = index.search(search_value, limit=config["page_size"])
+    return _with_selected(page.options, index.lookup(value))
@@ -0,0 +1,257 @@
+"""Skeleton placeholders shaped like the kit's components."""
+
+from typing import Any, List, Literal, Optional, Union
+
+from dash import html
+
+from dash_ui_kit.cache.interning import internable
+from dash_ui_kit.components.badge import SizeType as BadgeSizeType
+from dash_ui_kit.components.badge import VariantType as BadgeVariantType
+from dash_ui_kit.components.badge import badge_class_name
+from dash_ui_kit.components.button import SizeType as ButtonSizeType
+from dash_ui_kit.components.button import VariantType as ButtonVariantType
+from dash_ui_kit.components.button import button_class_name
+from dash_ui_kit.components.card import VariantType as CardVariantType
+from dash_ui_kit.components.card import card_class_name
+from dash_ui_kit.utils.classnames import cn
+
+ShapeType = Literal["text", "rect", "circle"]
+LengthType = Union[str, int, None]
+
+# Width of the last line of a paragraph, so it reads as text
+_LAST_LINE_WIDTH = "60%"
+
+
+def _length(value: LengthType) -> Optional[str]:
+    return f"{value}px" if isinstance(value, int) else value
+
+
+def _style(width: LengthType, height: LengthType, kwargs: dict) -> dict:
+    style = {"width": _length(width), "height": _length(height)}
+    style = {key: value for key, value in style.items() if value is not None}
+    return {**style, **kwargs.pop("style", {})}
+
+
+@internable
+def Skeleton(
+    shape: ShapeType = "text",
+    width: LengthType = None,
+    height: LengthType = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A shimmering placeholder block.
+
+    The animation is pure CSS and the placeholder is hidden from assistive
+    technologies; render it where content will arrive, then replace it.
+
+    Args:
+        shape: Placeholder shape
+            - "text": One line of text, as tall as the surrounding font
+            - "rect": Block with rounded corners
+            - "circle": Circle, for avatars and icons
+        width: CSS width (pixels if an int); full width by default
+        height: CSS height (pixels if an int)
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Placeholder block
+
+    Example:
+        ```python
+        from dash_ui_kit import Skeleton
+
+        Skeleton(shape="circle", width=40, height=40)
+        Skeleton(width="60%")
+        ```
+    """
+    return html.Div(
+        className=cn("duk-skeleton", f"duk-skeleton--{shape}", className),
+        style=_style(width, height, kwargs),
+        **{"aria-hidden": "true"},
+        **kwargs,
+    )
+
+
+@internable
+def SkeletonText(lines: int = 3, className: str = "", **kwargs: Any) -> html.Div:
+    """
+    A paragraph of placeholder lines, the last one shorter.
+
+    Args:
+        lines: Number of lines
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Placeholder paragraph
+
+    Example:
+        ```python
+        from dash_ui_kit import LazyCard, SkeletonText
+
+        LazyCard(id="revenue", header=header, load=build_revenue,
+                 placeholder=SkeletonText(lines=4))
+        ```
+    """
+    return html.Div(
+        [
+            Skeleton(
+                width=_LAST_LINE_WIDTH if line == lines - 1 and lines > 1 else None
+            )
+            for line in range(lines)
+        ],
+        className=cn("duk-skeleton-text", className),
+        **kwargs,
+    )
+
+
+@internable
+def SkeletonButton(
+    variant: ButtonVariantType = "default",
+    size: ButtonSizeType = "md",
+    width: LengthType = "6rem",
+    className: str = "",
+    **kwargs: Any
+) -> html.Span:
+    """
+    A placeholder with the exact size of a ``Button``.
+
+    Uses the button's own variant and size classes, so swapping in the real
+    button causes no layout shift.
+
+    Args:
+        variant: Variant of the button it stands for
+        size: Size of the button it stands for
+        width: CSS width (pixels if an int)
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Span
+
+    Returns:
+        html.Span: Placeholder button
+    """
+    return html.Span(
+        className=button_class_name(
+            variant, size, cn("duk-skeleton", "duk-skeleton--button", className)
+        ),
+        style=_style(width, None, kwargs),
+        **{"aria-hidden": "true"},
+        **kwargs,
+    )
+
+
+@internable
+def SkeletonBadge(
+    variant: BadgeVariantType = "default",
+    size: BadgeSizeType = "md",
+    width: LengthType = "3rem",
+    className: str = "",
+    **kwargs: Any
+) -> html.Span:
+    """
+    A placeholder with the exact size of a ``Badge``.
+
+    Args:
+        variant: Variant of the badge it stands for
+        size: Size of the badge it stands for
+        width: CSS width (pixels if an int)
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Span
+
+    Returns:
+        html.Span: Placeholder badge
+    """
+    return html.Span(
+        # A non-breaking space gives the badge its line height
+        "\u00a0",
+        className=badge_class_name(
+            variant, size, cn("duk-skeleton", "duk-skeleton--badge", className)
+        ),
+        style=_style(width, None, kwargs),
+        **{"aria-hidden": "true"},
+        **kwargs,
+    )
+
+
+@internable
+def SkeletonCard(
+    variant: CardVariantType = "default",
+    lines: int = 3,
+    description: bool = True,
+    footer: bool = False,
+    height: LengthType = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A placeholder card with the same header, content and footer sections
+    as a ``Card``.
+
+    Args:
+        variant: Variant of the card it stands for
+        lines: Number of text lines in the content
+        description: Show a description line under the title
+        footer: Show a footer with a button placeholder
+        height: CSS min-height (pixels if an int), to match the real card
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Placeholder card
+
+    Example:
+        ```python
+        from dash_ui_kit import SkeletonCard
+
+        # Replaced by the real card when its callback returns
+        html.Div(SkeletonCard(lines=4, footer=True), id="revenue-card")
+        ```
+    """
+    header = [Skeleton(className="duk-skeleton--title", width="50%")]
+    if description:
+        header.append(Skeleton(width="80%"))
+
+    children = [
+        html.Div(header, className="duk-card-header"),
+        html.Div(SkeletonText(lines), className="duk-card-content"),
+    ]
+    if footer:
+        children.append(html.Div(SkeletonButton(), className="duk-card-footer"))
+
+    style = {"minHeight": _length(height)} if height is not None else {}
+    return html.Div(
+        children,
+        className=card_class_name(variant, cn("duk-skeleton-card", className)),
+        style={**style, **kwargs.pop("style", {})},
+        **{"aria-busy": "true"},
+        **kwargs,
+    )
+
+
+def SkeletonRows(columns: int, rows: int = 5) -> List[html.Tr]:
+    """
+    Placeholder table rows, for the body of a table while it loads.
+
+    Args:
+        columns: Number of cells per row
+        rows: Number of rows
+
+    Returns:
+        List[html.Tr]: Rows of placeholder cells
+
+    Example:
+        ```python
+        from dash_ui_kit import SkeletonRows
+
+        html.Tbody(SkeletonRows(columns=4, rows=10), id="orders-body")
+        ```
+    """
+    return [
+        html.Tr(
+            [html.Td(Skeleton()) for _ in range(columns)],
+            className="duk-skeleton-row",
+        )
+        for _ in range(rows)
+    ]
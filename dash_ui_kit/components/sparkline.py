@@ -0,0 +1,128 @@
+"""Sparkline component: a small, downsampled trend line."""
+
+from typing import Any, Literal, Optional
+from urllib.parse import quote
+
+from dash import html
+
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.downsample import MethodType, downsample
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+VariantType = Literal["default", "muted", "destructive"]
+
+
+def _sparkline_svg(
+    x: Any, y: Any, width: int, height: int, stroke_width: float, fill: bool
+) -> str:
+    """SVG drawing the series in black, to be used as a CSS mask."""
+    if x.dtype.kind in "mM":
+        x = x.astype("datetime64[ns]").astype("int64")
+    x = x.astype(float)
+    low, high = float(y.min()), float(y.max())
+    xs = (x - x[0]) / (float(x[-1] - x[0]) or 1.0) * width
+    if high > low:
+        # Inset by half the stroke so peaks aren't clipped
+        ys = stroke_width / 2 + (high - y) / (high - low) * (height - stroke_width)
+    else:
+        ys = np.full(len(y), height / 2)
+    line = "L".join(map("{:.1f},{:.1f}".format, xs.tolist(), ys.tolist()))
+
+    shapes = []
+    if fill:
+        shapes.append(
+            f"<path d='M{line}L{width},{height}L0,{height}Z' opacity='0.15'/>"
+        )
+    shapes.append(
+        f"<path d='M{line}' fill='none' stroke='black' "
+        f"stroke-width='{stroke_width}' stroke-linecap='round' "
+        "stroke-linejoin='round' vector-effect='non-scaling-stroke'/>"
+    )
+    return (
+        "<svg xmlns='http://www.w3.org/2000/svg' "
+        f"viewBox='0 0 {width} {height}' preserveAspectRatio='none'>"
+        f"{''.join(shapes)}</svg>"
+    )
+
+
+def Sparkline(
+    data: Any,
+    x: Any = None,
+    width: int = 120,
+    height: int = 32,
+    method: MethodType = "lttb",
+    variant: VariantType = "default",
+    fill: bool = False,
+    stroke_width: float = 1.5,
+    label: Optional[str] = None,
+    id: Optional[str] = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A small trend line for cards and table cells.
+
+    The series is downsampled on the server to one point per pixel of
+    ``width`` (see ``downsample``), so a 100,000-point series is sent to
+    the browser as about 120 points. The line is an inline SVG used as a
+    CSS mask, colored by the theme, with no chart library or callback
+    involved. Downsampled series are cached by content hash, so rendering
+    the same data again skips the work.
+
+    Args:
+        data: Values, as a sequence, NumPy array or pandas Series
+        x: Positions of the values (numbers or datetimes), ascending;
+            evenly spaced by default
+        width: Width in pixels, and the number of points drawn
+        height: Height in pixels
+        method: Downsampling algorithm
+            - "lttb": Keeps the visual shape of the line
+            - "minmax": Keeps every peak and trough
+        variant: Color of the line
+            - "default": Primary color
+            - "muted": Muted text color
+            - "destructive": Error color
+        fill: Shade the area under the line
+        stroke_width: Line width in pixels
+        label: Accessible description, such as "Revenue, last 30 days"
+        id: Unique identifier for Dash callbacks
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Styled sparkline
+
+    Example:
+        ```python
+        from dash_ui_kit import Sparkline
+
+        Sparkline(df["revenue"], x=df["date"], width=160, fill=True,
+                  label="Revenue, last 90 days")
+        ```
+    """
+    if width < 2 or height < 1:
+        raise ValueError("Sparklines need a width of 2 and a height of 1 or more")
+
+    x_values, y_values = downsample(data, x, points=width, method=method)
+    style = {"width": f"{width}px", "height": f"{height}px"}
+    if len(y_values) > 1:
+        svg = _sparkline_svg(x_values, y_values, width, height, stroke_width, fill)
+        mask = f'url("data:image/svg+xml,{quote(svg)}")'
+        style.update({"maskImage": mask, "WebkitMaskImage": mask})
+    style.update(kwargs.pop("style", None) or {})
+
+    if id is not None:
+        kwargs["id"] = id
+    if label is not None:
+        kwargs["aria-label"] = label
+
+    return html.Div(
+        className=cn("duk-sparkline", f"duk-sparkline--{variant}", className),
+        style=style,
+        role="img",
+        **kwargs,
+    )
@@ -0,0 +1,219 @@
+"""Stat card component for KPIs, and a builder for many of them."""
+
+from typing import Any, List, Literal, Mapping, Optional, Union, cast
+
+from dash import html
+
+from dash_ui_kit.cache.interning import internable
+from dash_ui_kit.components.card import (
+    Card,
+    CardContent,
+    CardDescription,
+    CardHeader,
+    CardTitle,
+)
+from dash_ui_kit.components.card import VariantType as CardVariantType
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.formatting import format_numbers, percent_change
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+TrendType = Literal["up", "down", "neutral"]
+
+
+def _missing(item: Any) -> bool:
+    """Whether a cell is missing: None, NaN, or pandas' NA and NaT."""
+    if pd is not None:
+        return bool(pd.isna(item))
+    return item is None or item != item
+
+
+@internable
+def StatCard(
+    title: str,
+    value: Union[str, int, float],
+    description: Optional[str] = None,
+    delta: Optional[str] = None,
+    trend: Optional[TrendType] = None,
+    id: Optional[str] = None,
+    variant: CardVariantType = "default",
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A card showing one KPI: its title, value and change.
+
+    Args:
+        title: Name of the KPI
+        value: Value shown large; numbers get thousands separators
+        description: Text under the title
+        delta: Change shown under the value, such as "+20.1% from last month"
+        trend: Direction of the change, which colors ``delta``
+            - "up": Increase
+            - "down": Decrease
+            - "neutral": No change
+        id: Unique identifier for Dash callbacks
+        variant: Visual style variant, as for ``Card``
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: Styled card
+
+    Example:
+        ```python
+        from dash_ui_kit import StatCard
+
+        StatCard(
+            "Total Users",
+            12345,
+            description="Active users this month",
+            delta="+20.1% from last month",
+            trend="up",
+        )
+        ```
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = f"{value:,}"
+
+    header = [CardTitle(title, className="duk-stat-card__title")]
+    if description is not None:
+        header.append(CardDescription(description))
+
+    content = [html.P(value, className="duk-stat-card__value")]
+    if delta is not None:
+        content.append(
+            html.P(
+                delta,
+                className=cn(
+                    "duk-stat-card__delta", trend and f"duk-stat-card__delta--{trend}"
+                ),
+            )
+        )
+
+    return Card(
+        [CardHeader(header), CardContent(content)],
+        id=id,
+        variant=variant,
+        className=cn("duk-stat-card", className),
+        **kwargs,
+    )
+
+
+def stat_cards_from_frame(
+    data: Any,
+    title: str = "title",
+    value: str = "value",
+    previous: Optional[str] = None,
+    description: Optional[str] = None,
+    decimals: int = 0,
+    compact: bool = False,
+    prefix: str = "",
+    suffix: str = "",
+    delta_label: str = "from last period",
+    variant: CardVariantType = "default",
+    className: str = "",
+) -> List[html.Div]:
+    """
+    Build one ``StatCard`` per row of a table of KPIs.
+
+    Number formatting, percent changes and trends are computed for all rows
+    at once with NumPy (see ``format_numbers`` and ``percent_change``), then
+    the cards are built in a single pass, so hundreds of KPIs take
+    milliseconds.
+
+    Args:
+        data: A pandas DataFrame, or a mapping of column names to sequences
+        title: Column with the KPI names
+        value: Column with the current values
+        previous: Column with the values to compare with; no change is
+            shown without it, or where it is missing or zero
+        description: Column with the text under each title
+        decimals: Digits after the decimal point of the values
+        compact: Abbreviate large values (``12.3K``, ``4.5M``)
+        prefix: Text before each value (such as ``"$"``)
+        suffix: Text after each value
+        delta_label: Text after each percent change
+        variant: Visual style variant of the cards
+        className: Additional CSS classes of the cards
+
+    Returns:
+        List[html.Div]: The cards, in row order
+
+    Example:
+        ```python
+        import pandas as pd
+        from dash_ui_kit import stat_cards_from_frame
+
+        kpis = pd.DataFrame({
+            "title": ["Total Users", "Revenue", "Orders"],
+            "value": [12345, 45231, 573],
+            "previous": [10280, 39264, 528],
+        })
+        html.Div(
+            stat_cards_from_frame(kpis, previous="previous",
+                                  delta_label="from last month"),
+            className="grid grid-cols-3 gap-4",
+        )
+        ```
+    """
+    if np is None:
+        raise ImportError(
+            "stat_cards_from_frame needs NumPy: pip install 'dash-ui-kit[data]'"
+        )
+    if not (pd is not None and isinstance(data, pd.DataFrame)) and not isinstance(
+        data, Mapping
+    ):
+        raise TypeError("stat_cards_from_frame needs a DataFrame or a mapping")
+
+    titles = [str(item) for item in data[title]]
+    values = format_numbers(
+        data[value], decimals=decimals, compact=compact, prefix=prefix, suffix=suffix
+    )
+    count = len(titles)
+    descriptions: List[Optional[str]] = [None] * count
+    if description is not None:
+        descriptions = [
+            None if _missing(item) else str(item) for item in data[description]
+        ]
+
+    deltas: List[Optional[str]] = [None] * count
+    trends: List[Optional[TrendType]] = [None] * count
+    if previous is not None:
+        change = percent_change(data[value], data[previous])
+        known = ~np.isnan(change)
+        # Adding 0.0 turns the -0.0 of small decreases into 0.0
+        rounded = np.round(np.where(known, change, 0.0), 1) + 0.0
+        text = np.where(rounded == 0, "0.0%", np.char.mod("%+.1f%%", rounded))
+        trend = np.where(rounded > 0, "up", np.where(rounded < 0, "down", "neutral"))
+        deltas = [
+            f"{item} {delta_label}" if keep else None
+            for item, keep in zip(text.tolist(), known.tolist())
+        ]
+        trends = [
+            cast(TrendType, item) if keep else None
+            for item, keep in zip(trend.tolist(), known.tolist())
+        ]
+
+    return [
+        StatCard(
+            card_title,
+            card_value,
+            description=card_description,
+            delta=card_delta,
+            trend=card_trend,
+            variant=variant,
+            className=className,
+        )
+        for card_title, card_value, card_description, card_delta, card_trend in zip(
+            titles, values, descriptions, deltas, trends
+        )
+    ]
@@ -0,0 +1,332 @@
+"""Data table component paged, sorted and filtered on the server."""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import dash
+from dash import dcc, html
+
+from dash_ui_kit.components.button import Button
+from dash_ui_kit.components.input import Input
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.loaders import load_error
+from dash_ui_kit.utils.tables import TablePage, TableSource
+
+ColumnType = Union[str, Dict[str, str]]
+
+# Milliseconds of typing pause before a filter is applied
+FILTER_DEBOUNCE_MS = 300
+
+
+class _TableConfig(NamedTuple):
+    """What a ``DataTable`` may query, kept on the server."""
+
+    source: str
+    columns: List[Dict[str, str]]
+    page_size: int
+
+
+# Configuration of data tables by table id, so the browser only sends the
+# query and never chooses the source, columns or page size
+_tables: Dict[str, _TableConfig] = {}
+
+
+def table_state_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the store holding a ``DataTable``'s current query.
+
+    Its ``data`` is a dict with ``page``, ``page_size``, ``sort_by``,
+    ``descending``, ``filters`` and ``total`` (rows matching the filters),
+    for callbacks that act on what the table shows, such as exports.
+
+    Args:
+        id: Id passed to ``DataTable``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the ``dcc.Store``
+    """
+    return {"type": "duk-table-state", "id": stringify_id(id)}
+
+
+def _table_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-table-{kind}", "id": stringify_id(id)}
+
+
+def _table_column_id(kind: str, id: ComponentId, column: Any) -> Dict[str, Any]:
+    return {"type": f"duk-table-{kind}", "id": stringify_id(id), "column": column}
+
+
+def _columns(source: TableSource, columns: Optional[Sequence[ColumnType]]) -> List:
+    """Normalize columns to ``{"id", "name"}`` dicts."""
+    result = []
+    for column in columns if columns is not None else source.columns:
+        if isinstance(column, str):
+            column = {"id": column, "name": column}
+        if column["id"] not in source.columns:
+            raise KeyError(f"Column {column['id']!r} not in table {source.name!r}")
+        result.append({"id": column["id"], "name": column.get("name", column["id"])})
+    return result
+
+
+def _cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _body(page: TablePage, columns: List[Dict[str, str]]) -> List[html.Tr]:
+    if not page.rows:
+        return [
+            html.Tr(
+                html.Td("No rows", colSpan=len(columns), className="duk-table__empty")
+            )
+        ]
+    return [
+        html.Tr([html.Td(_cell(row[column["id"]])) for column in columns])
+        for row in page.rows
+    ]
+
+
+def _status(page: TablePage, page_size: int) -> str:
+    if not page.total:
+        return "No rows"
+    start = page.page * page_size
+    return f"{start + 1:,}–{start + len(page.rows):,} of {page.total:,}"
+
+
+def _sort_class(column: str, state: Dict[str, Any]) -> str:
+    if state["sort_by"] != column:
+        return "duk-table__sort"
+    direction = "desc" if state["descending"] else "asc"
+    return f"duk-table__sort duk-table__sort--{direction}"
+
+
+def _next_sort(state: Dict[str, Any], column: str) -> Tuple[Optional[str], bool]:
+    """Ascending, then descending, then unsorted."""
+    if state["sort_by"] != column:
+        return column, False
+    if not state["descending"]:
+        return column, True
+    return None, False
+
+
+def DataTable(
+    id: ComponentId,
+    source: TableSource,
+    columns: Optional[Sequence[ColumnType]] = None,
+    page_size: int = 25,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    filterable: bool = True,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A styled table whose data stays on the server.
+
+    Only the current page is sent to the browser. Clicking a header sorts by
+    that column (ascending, descending, then unsorted), typing in the filter
+    row filters it, and the pager moves between pages; each is answered by
+    one callback querying the ``TableSource``, so the payload is the same
+    for a thousand rows or ten million.
+
+    The source, columns and page size are kept on the server by table id
+    when the table is built, so use ids that are unique per app. Only
+    those columns can be sorted or filtered.
+
+    Args:
+        id: Unique identifier, used to build the ids of the table's parts
+        source: ``TableSource`` holding the rows
+        columns: Columns to show, as names or ``{"id", "name"}`` dicts;
+            all columns of the source by default
+        page_size: Rows per page
+        sort_by: Column sorted by initially
+        descending: Whether the initial sort is descending
+        filterable: Show a filter input under each header
+        className: Additional CSS classes
+        **kwargs: Additional props passed to the outer html.Div
+
+    Returns:
+        html.Div: The table, its pager and the store with its query
+        (``table_state_id(id)``)
+
+    Example:
+        ```python
+        from dash_ui_kit import DataTable, TableSource
+
+        orders = TableSource.cached("orders", load_orders)
+
+        DataTable(
+            id="orders",
+            source=orders,
+            columns=["id", {"id": "customer", "name": "Customer"}, "total"],
+            sort_by="total",
+            descending=True,
+        )
+        ```
+    """
+    if not isinstance(source, TableSource):
+        raise TypeError("DataTable needs a TableSource as source")
+
+    columns = _columns(source, columns)
+    _tables[stringify_id(id)] = _TableConfig(source.name, columns, page_size)
+    page = source.query(page_size=page_size, sort_by=sort_by, descending=descending)
+    state: Dict[str, Any] = {
+        "page": page.page,
+        "page_size": page_size,
+        "sort_by": sort_by,
+        "descending": descending,
+        "filters": {},
+        "total": page.total,
+    }
+
+    header = [
+        html.Tr(
+            [
+                html.Th(
+                    html.Button(
+                        column["name"],
+                        id=_table_column_id("sort", id, column["id"]),
+                        className=_sort_class(column["id"], state),
+                        n_clicks=0,
+                    ),
+                    scope="col",
+                )
+                for column in columns
+            ]
+        )
+    ]
+    if filterable:
+        header.append(
+            html.Tr(
+                [
+                    html.Th(
+                        Input(
+                            id=_table_column_id("filter", id, column["id"]),
+                            placeholder="Filter",
+                            debounce_ms=FILTER_DEBOUNCE_MS,
+                            className="duk-table__filter",
+                        )
+                    )
+                    for column in columns
+                ],
+                className="duk-table__filters",
+            )
+        )
+
+    return html.Div(
+        [
+            html.Div(
+                html.Table(
+                    [
+                        html.Thead(header),
+                        html.Tbody(_body(page, columns), id=_table_id("body", id)),
+                    ],
+                    className="duk-table",
+                ),
+                className="duk-table-scroll",
+            ),
+            html.Div(
+                [
+                    html.Span(
+                        _status(page, page_size),
+                        id=_table_id("status", id),
+                        className="duk-table__status",
+                    ),
+                    Button(
+                        "Previous",
+                        id=_table_id("previous", id),
+                        variant="outline",
+                        size="sm",
+                        disabled=page.page == 0,
+                    ),
+                    Button(
+                        "Next",
+                        id=_table_id("next", id),
+                        variant="outline",
+                        size="sm",
+                        disabled=page.page >= page.page_count - 1,
+                    ),
+                ],
+                className="duk-table__pagination",
+            ),
+            dcc.Store(id=table_state_id(id), data=state),
+        ],
+        className=cn("duk-table-wrapper", className),
+        **kwargs,
+    )
+
+
+def _apply(
+    state: Dict[str, Any],
+    triggered: Dict[str, Any],
+    filters: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Return the query after a header, filter or pager event."""
+    state = {**state, "filters": filters}
+    kind = triggered["type"]
+    if kind == "duk-table-sort":
+        state["sort_by"], state["descending"] = _next_sort(state, triggered["column"])
+        state["page"] = 0
+    elif kind == "duk-table-filter":
+        state["page"] = 0
+    elif kind == "duk-table-previous":
+        state["page"] -= 1
+    elif kind == "duk-table-next":
+        state["page"] += 1
+    return state
+
+
+@dash.callback(
+    dash.Output(_table_id("body", dash.MATCH), "children"),
+    dash.Output(table_state_id(dash.MATCH), "data"),
+    dash.Output(_table_id("status", dash.MATCH), "children"),
+    dash.Output(_table_id("previous", dash.MATCH), "disabled"),
+    dash.Output(_table_id("next", dash.MATCH), "disabled"),
+    dash.Output(_table_column_id("sort", dash.MATCH, dash.ALL), "className"),
+    dash.Input(_table_column_id("sort", dash.MATCH, dash.ALL), "n_clicks"),
+    dash.Input(_table_column_id("filter", dash.MATCH, dash.ALL), "value"),
+    dash.Input(_table_id("previous", dash.MATCH), "n_clicks"),
+    dash.Input(_table_id("next", dash.MATCH), "n_clicks"),
+    dash.State(table_state_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _update_table(
+    sort_clicks: List[int],
+    filter_values: List[Optional[str]],
+    previous_clicks: int,
+    next_clicks: int,
+    state: Dict[str, Any],
+) -> Tuple[Any, ...]:
+    """Query the page for the clicked header, typed filter or pager button."""
+    config = _tables.get(dash.ctx.triggered_id["id"])
+    if config is None:
+        # Built by another worker process
+        error = html.Tr(html.Td(load_error(), colSpan=max(len(sort_clicks), 1)))
+        return ([error],) + (dash.no_update,) * 5
+
+    # Only the table's own columns can be sorted or filtered
+    names = {column["id"] for column in config.columns}
+    filters = {
+        item["id"]["column"]: item.get("value")
+        for item in dash.ctx.inputs_list[1]
+        if item.get("value") and item["id"]["column"] in names
+    }
+    state = _apply(state, dash.ctx.triggered_id, filters)
+    if state["sort_by"] not in names:
+        state["sort_by"] = None
+
+    page = TableSource.get(config.source).query(
+        page=state["page"],
+        page_size=config.page_size,
+        sort_by=state["sort_by"],
+        descending=bool(state["descending"]),
+        filters=filters,
+    )
+    state.update(page=page.page, page_size=config.page_size, total=page.total)
+    return (
+        _body(page, config.columns),
+        state,
+        _status(page, config.page_size),
+        page.page == 0,
+        page.page >= page.page_count - 1,
+        [_sort_class(item["id"]["column"], state) for item in dash.ctx.outputs_list[5]],
+    )
@@ -0,0 +1,222 @@
+"""Tabs component building inactive panels on first activation."""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.loaders import Loader, LoaderRegistry, load_error, new_token
+from dash_ui_kit.utils.types import Children
+
+
+class Tab(NamedTuple):
+    """
+    One tab of ``Tabs``.
+
+    Attributes:
+        label: Text of the tab
+        value: Value identifying the tab (``Tabs`` value when selected)
+        children: Content built up front
+        load: Called without arguments to build the content the first time
+            the tab is activated, instead of ``children``
+        cache_key: Key of the built content in the ``cache`` of ``Tabs``,
+            shared by every user of the app
+        disabled: Whether the tab can be selected
+    """
+
+    label: str
+    value: str
+    children: Children = None
+    load: Optional[Loader] = None
+    cache_key: Optional[str] = None
+    disabled: bool = False
+
+
+# Loaders of lazy tabs by (layout token, tab value) and (tabs id, tab value)
+_loaders = LoaderRegistry()
+
+
+def tabs_id(id: ComponentId) -> Dict[str, Any]:
+    """
+    Id of the ``dcc.Tabs`` rendered by ``Tabs``.
+
+    Callbacks read the selected tab from its ``value``.
+
+    Args:
+        id: Id passed to ``Tabs``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the inner ``dcc.Tabs``
+    """
+    return {"type": "duk-tabs", "id": stringify_id(id)}
+
+
+def _tab_panel_id(id: ComponentId, value: Any) -> Dict[str, Any]:
+    return {"type": "duk-tab-panel", "id": stringify_id(id), "tab": value}
+
+
+def _tabs_loaded_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-tabs-loaded", "id": stringify_id(id)}
+
+
+def _tabs_request_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-tabs-request", "id": stringify_id(id)}
+
+
+def _tabs_token_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-tabs-token", "id": stringify_id(id)}
+
+
+def Tabs(
+    id: ComponentId,
+    tabs: Sequence[Tab],
+    value: Optional[str] = None,
+    cache: Any = None,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    Tabs whose inactive panels are built on demand.
+
+    Only the selected tab is built with the layout. A tab with ``load`` is
+    an empty placeholder until it is first selected; its content is then
+    built by a callback and kept in the browser, so selecting it again
+    costs nothing. Initial layout size and build time scale with one tab
+    rather than all of them.
+
+    With a ``cache`` (such as a ``SharedLayoutCache``), tabs with a
+    ``cache_key`` are built once and reused across users and workers.
+
+    Loaders are kept on the server when the layout is built, under a token
+    stored with the tabs, so every build (and every user) loads its own
+    tabs even when ids repeat, and under the tabs' id, so a worker that
+    built the same layout can load them too. A tab no loader is found for
+    shows an error asking to reload; see ``LoaderRegistry``.
+
+    Args:
+        id: Unique identifier, used to build the ids of the tabs and panels
+        tabs: The ``Tab`` items
+        value: Value of the selected tab; the first enabled tab by default
+        cache: Object with ``get_or_build(key, builder)`` used for tabs with
+            a ``cache_key``
+        className: Additional CSS classes
+        **kwargs: Additional props passed to dcc.Tabs
+
+    Returns:
+        html.Div: The tabs and the stores tracking loaded panels and the
+        loaders' token; the selected tab is the ``value`` of ``tabs_id(id)``
+
+    Example:
+        ```python
+        from dash_ui_kit import Tab, Tabs
+
+        Tabs(
+            id="analytics",
+            tabs=[
+                Tab("Overview", "overview", load=build_overview),
+                Tab("Revenue", "revenue", load=build_revenue),
+                Tab("Cohorts", "cohorts", load=build_cohorts,
+                    cache_key="cohorts-v1"),
+            ],
+            cache=layout_cache,
+        )
+        ```
+    """
+    if not tabs:
+        raise ValueError("Tabs needs at least one Tab")
+    values = [tab.value for tab in tabs]
+    if len(set(values)) != len(values):
+        raise ValueError("Tab values must be unique")
+    if value is None:
+        value = next((tab.value for tab in tabs if not tab.disabled), values[0])
+
+    token = new_token()
+    tab_components = []
+    loaded = []
+    for tab in tabs:
+        content = tab.children
+        if tab.load is None:
+            loaded.append(tab.value)
+        else:
+            for key in ((token, tab.value), (stringify_id(id), tab.value)):
+                _loaders.register(key, tab.load, tab.cache_key, cache)
+            if tab.value == value:
+                content = _loaders.build((token, tab.value))
+                loaded.append(tab.value)
+
+        tab_components.append(
+            dcc.Tab(
+                html.Div(
+                    content,
+                    id=_tab_panel_id(id, tab.value),
+                    className="duk-tab-panel",
+                ),
+                label=tab.label,
+                value=tab.value,
+                disabled=tab.disabled,
+                className="duk-tab",
+                selected_className="duk-tab--selected",
+                disabled_className="duk-tab--disabled",
+            )
+        )
+
+    return html.Div(
+        [
+            dcc.Tabs(
+                tab_components,
+                id=tabs_id(id),
+                value=value,
+                className="duk-tabs",
+                parent_className="duk-tabs-root",
+                content_className="duk-tabs-content",
+                **kwargs,
+            ),
+            dcc.Store(id=_tabs_loaded_id(id), data=loaded),
+            dcc.Store(id=_tabs_request_id(id)),
+            dcc.Store(id=_tabs_token_id(id), data=token),
+        ],
+        className=cn("duk-tabs-wrapper", className),
+    )
+
+
+# Only ask the server for panels that were never loaded
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="tabsRequest"),
+    dash.Output(_tabs_request_id(dash.MATCH), "data"),
+    dash.Input(tabs_id(dash.MATCH), "value"),
+    dash.State(_tabs_loaded_id(dash.MATCH), "data"),
+    dash.State(tabs_id(dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
+
+
+@dash.callback(
+    dash.Output(_tab_panel_id(dash.MATCH, dash.ALL), "children"),
+    dash.Output(_tabs_loaded_id(dash.MATCH), "data"),
+    dash.Input(_tabs_request_id(dash.MATCH), "data"),
+    dash.State(_tabs_loaded_id(dash.MATCH), "data"),
+    dash.State(_tabs_token_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _load_tab(
+    request: Optional[Dict[str, Any]], loaded: List[str], token: str
+) -> Tuple[List[Any], List[str]]:
+    """Build the content of a tab selected for the first time."""
+    if not request or request["value"] in loaded:
+        raise PreventUpdate
+    value = request["value"]
+    key = _loaders.find((token, value), (dash.ctx.triggered_id["id"], value))
+
+    panels = dash.ctx.outputs_list[0]
+    content = load_error() if key is None else _loaders.build(key)
+    return (
+        [
+            content if panel["id"]["tab"] == value else dash.no_update
+            for panel in panels
+        ],
+        # Tabs that failed are requested again when next selected
+        loaded if key is None else loaded + [value],
+    )
@@ -0,0 +1,147 @@
+"""Toaster component showing notifications from a clientside queue."""
+
+import uuid
+from typing import Any, Dict, Literal, Optional
+
+import dash
+from dash import dcc, html
+
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+
+VariantType = Literal["default", "destructive"]
+PositionType = Literal["top-left", "top-right", "bottom-left", "bottom-right"]
+
+
+def toaster_id(id: ComponentId = "toaster") -> Dict[str, Any]:
+    """
+    Id of the store a callback writes to show toasts in a ``Toaster``.
+
+    Write one ``toast(...)`` or a list of them to its ``data``.
+
+    Args:
+        id: Id passed to ``Toaster``
+
+    Returns:
+        Dict[str, Any]: Pattern-matching id of the ``dcc.Store``
+    """
+    return {"type": "duk-toaster", "id": stringify_id(id)}
+
+
+def _toaster_stack_id(id: ComponentId) -> Dict[str, Any]:
+    return {"type": "duk-toaster-stack", "id": stringify_id(id)}
+
+
+def toast(
+    message: str,
+    title: Optional[str] = None,
+    variant: VariantType = "default",
+    duration: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Describe a toast, to write to the store of a ``Toaster``.
+
+    Each toast gets a unique key, so showing the same message twice shows
+    two toasts.
+
+    Args:
+        message: Text of the toast
+        title: Bold first line
+        variant: Visual style variant
+            - "default": Neutral notification
+            - "destructive": Error notification
+        duration: Milliseconds before it is dismissed; the ``Toaster``'s
+            default if None, never if 0
+
+    Returns:
+        Dict[str, Any]: JSON description of the toast
+
+    Example:
+        ```python
+        from dash_ui_kit import toast, toaster_id
+
+        @callback(Output(toaster_id(), "data"), Input("save", "n_clicks"),
+                  prevent_initial_call=True)
+        def save(n_clicks):
+            save_report()
+            return toast("Report saved", title="Done")
+        ```
+    """
+    return {
+        "key": uuid.uuid4().hex,
+        "message": message,
+        "title": title,
+        "variant": variant,
+        "duration": duration,
+    }
+
+
+def Toaster(
+    id: ComponentId = "toaster",
+    max_visible: int = 3,
+    duration: int = 5000,
+    position: PositionType = "bottom-right",
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A stack of toasts managed in the browser.
+
+    A callback shows toasts by writing ``toast(...)`` (or a list of them) to
+    the store ``toaster_id(id)``. Queueing, stacking and auto-dismissal all
+    happen in the browser: at most ``max_visible`` toasts are shown, the rest
+    wait in a queue, and each toast closes itself after its duration (paused
+    while hovered). No callback is needed to clear them, and showing a toast
+    never rewrites the layout.
+
+    Add one ``Toaster`` to the app layout.
+
+    Args:
+        id: Unique identifier, used to build the id of its store
+        max_visible: Maximum number of toasts shown at once
+        duration: Default milliseconds before a toast is dismissed; 0 keeps
+            toasts until closed
+        position: Corner of the viewport the toasts stack in
+        className: Additional CSS classes
+        **kwargs: Additional props passed to html.Div
+
+    Returns:
+        html.Div: The toast stack and its store
+
+    Example:
+        ```python
+        from dash_ui_kit import Toaster
+
+        app.layout = html.Div([page_content, Toaster()])
+        ```
+    """
+    if max_visible < 1:
+        raise ValueError("max_visible must be at least 1")
+
+    return html.Div(
+        [
+            html.Div(
+                id=_toaster_stack_id(id),
+                className="duk-toaster__stack",
+                role="region",
+                **{"aria-live": "polite", "aria-label": "Notifications"},
+            ),
+            dcc.Store(id=toaster_id(id)),
+        ],
+        className=cn("duk-toaster", f"duk-toaster--{position}", className),
+        **{
+            "data-duk-max-visible": str(max_visible),
+            "data-duk-duration": str(duration),
+        },
+        **kwargs,
+    )
+
+
+# Queues and shows toasts; the stack's className is left unchanged
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="toasterShow"),
+    dash.Output(_toaster_stack_id(dash.MATCH), "className"),
+    dash.Input(toaster_id(dash.MATCH), "data"),
+    dash.State(toaster_id(dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
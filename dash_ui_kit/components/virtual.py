@@ -0,0 +1,310 @@
+"""Virtualized list and grid components rendering row data from a template."""
+
+from typing import Any, Dict, Optional, Union
+
+import dash
+from dash import dcc, html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.ids import ComponentId, stringify_id
+from dash_ui_kit.utils.sources import RowSource
+from dash_ui_kit.utils.templates import render_template
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+
+def _virtual_id(kind: str, id: ComponentId) -> Dict[str, Any]:
+    return {"type": f"duk-virtual-{kind}", "id": stringify_id(id)}
+
+
+def _virtual_spacer_id(id: ComponentId) -> Dict[str, Any]:
+    return _virtual_id("spacer", id)
+
+
+def _virtual_page_id(id: ComponentId) -> Dict[str, Any]:
+    return _virtual_id("page", id)
+
+
+def _virtual_window_id(id: ComponentId) -> Dict[str, Any]:
+    return _virtual_id("window", id)
+
+
+def _virtual_config_id(id: ComponentId) -> Dict[str, Any]:
+    return _virtual_id("config", id)
+
+
+def _virtual_trigger_id(id: ComponentId) -> Dict[str, Any]:
+    return _virtual_id("trigger", id)
+
+
+def _first_page(data: Any, window: int) -> Dict[str, Any]:
+    """Rows sent with the layout: a first window, or all inline rows."""
+    if isinstance(data, RowSource):
+        return {"start": 0, "rows": data.rows(0, window), "total": len(data)}
+    if pd is not None and isinstance(data, pd.DataFrame):
+        rows = data.to_dict("records")
+    else:
+        rows = list(data)
+    return {"start": 0, "rows": rows, "total": len(rows)}
+
+
+def _virtual_view(
+    id: ComponentId,
+    block: str,
+    items: str,
+    template: Any,
+    data: Any,
+    item_height: int,
+    height: Union[int, str],
+    window: int,
+    overscan: int,
+    className: str,
+    attributes: Dict[str, str],
+    style: Dict[str, str],
+    kwargs: Dict[str, Any],
+) -> html.Div:
+    """Scrolling viewport shared by ``VirtualList`` and ``CardGrid``."""
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    page = _first_page(data, window)
+    remote = isinstance(data, RowSource)
+    style = {
+        "height": f"{height}px" if isinstance(height, int) else height,
+        **style,
+        **kwargs.pop("style", {}),
+    }
+
+    return html.Div(
+        [
+            # Sized for one item per line; the script corrects it on load
+            html.Div(
+                id=_virtual_spacer_id(id),
+                className=f"{block}__spacer",
+                style={"height": f"{page['total'] * item_height}px"},
+            ),
+            html.Div(className=f"{block}__{items}"),
+            dcc.Store(id=_virtual_page_id(id), data=page),
+            dcc.Store(id=_virtual_window_id(id)),
+            dcc.Store(
+                id=_virtual_config_id(id),
+                data={"source": data.name if remote else None, "window": window},
+            ),
+            html.Div(id=_virtual_trigger_id(id), hidden=True),
+        ],
+        id={"type": block, "id": stringify_id(id)},
+        className=cn(block, className),
+        style=style,
+        **{
+            "data-duk-template": render_template(template),
+            "data-duk-row-height": str(item_height),
+            "data-duk-window": str(window),
+            "data-duk-overscan": str(overscan),
+            "data-duk-remote": "true" if remote else "false",
+            **attributes,
+        },
+        **kwargs,
+    )
+
+
+def VirtualList(
+    id: ComponentId,
+    template: Any,
+    data: Any = (),
+    row_height: int = 40,
+    height: Union[int, str] = 480,
+    window: int = 100,
+    overscan: int = 10,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A scrolling list that only renders the rows in view.
+
+    Rows are data, not components: ``template`` is rendered once to HTML
+    with ``{field}`` placeholders, and the browser fills it with each row's
+    fields. Only the visible rows (plus ``overscan``) exist in the DOM, in
+    a pool of elements reused while scrolling.
+
+    With a ``RowSource`` as ``data`` the layout carries only the first
+    ``window`` rows; further windows are fetched from the server as the
+    user scrolls, and rows far from the view are dropped again, so neither
+    the payload nor the browser's memory grows with the list.
+
+    Args:
+        id: Unique identifier, required to route window requests
+        template: Kit or ``dash.html`` components describing one row, with
+            ``{field}`` placeholders in text and attributes
+        data: Row dicts or a DataFrame sent with the layout, or a
+            ``RowSource`` served a window at a time
+        row_height: Height of every row in pixels
+        height: Height of the scrolling viewport (pixels or any CSS length)
+        window: Number of rows per server request
+        overscan: Rows rendered above and below the viewport
+        className: Additional CSS classes
+        **kwargs: Additional props passed to the outer html.Div
+
+    Returns:
+        html.Div: The scrolling viewport and the stores driving it
+
+    Example:
+        ```python
+        from dash import html
+        from dash_ui_kit import Badge, RowSource, VirtualList
+
+        events = RowSource.cached("events", load_events)  # 50k rows
+
+        VirtualList(
+            id="events",
+            data=events,
+            template=html.Div(
+                [Badge("{level}", variant="{variant}"), html.Span("{message}")],
+                className="flex items-center gap-2",
+            ),
+            row_height=36,
+        )
+        ```
+    """
+    return _virtual_view(
+        id,
+        "duk-virtual-list",
+        "rows",
+        template,
+        data,
+        row_height,
+        height,
+        window,
+        overscan,
+        className,
+        {},
+        {},
+        kwargs,
+    )
+
+
+def CardGrid(
+    id: ComponentId,
+    template: Any,
+    data: Any = (),
+    card_height: int = 200,
+    min_card_width: int = 240,
+    gap: int = 16,
+    height: Union[int, str] = 600,
+    window: int = 120,
+    overscan: int = 2,
+    className: str = "",
+    **kwargs: Any
+) -> html.Div:
+    """
+    A scrolling grid of cards that only renders the cards in view.
+
+    Works like ``VirtualList``, laid out with CSS grid: ``template`` (for
+    example a ``Card`` with a ``CardHeader`` and ``CardContent``) is filled
+    with each row's fields, and as many columns of at least
+    ``min_card_width`` as fit are shown. Only the lines of cards in view
+    (plus ``overscan`` lines) exist in the DOM, in a pool of elements reused
+    while scrolling, so DOM size and memory stay the same for 500 or
+    50,000 cards.
+
+    Args:
+        id: Unique identifier, required to route window requests
+        template: Kit or ``dash.html`` components describing one card, with
+            ``{field}`` placeholders in text and attributes
+        data: Row dicts or a DataFrame sent with the layout, or a
+            ``RowSource`` served a window at a time
+        card_height: Height of every card in pixels
+        min_card_width: Minimum width of a column in pixels
+        gap: Space between cards in pixels
+        height: Height of the scrolling viewport (pixels or any CSS length)
+        window: Number of cards per server request
+        overscan: Lines of cards rendered above and below the viewport
+        className: Additional CSS classes
+        **kwargs: Additional props passed to the outer html.Div
+
+    Returns:
+        html.Div: The scrolling viewport and the stores driving it
+
+    Example:
+        ```python
+        from dash_ui_kit import (
+            CardContent, CardGrid, CardHeader, CardTitle, Card, RowSource
+        )
+
+        assets = RowSource.cached("assets", load_assets)  # 5k rows
+
+        CardGrid(
+            id="assets",
+            data=assets,
+            template=Card([
+                CardHeader(CardTitle("{name}")),
+                CardContent("{location} - {owner}"),
+            ]),
+            card_height=160,
+            min_card_width=260,
+        )
+        ```
+    """
+    return _virtual_view(
+        id,
+        "duk-card-grid",
+        "cells",
+        template,
+        data,
+        card_height,
+        height,
+        window,
+        overscan,
+        className,
+        {
+            "data-duk-layout": "grid",
+            "data-duk-min-width": str(min_card_width),
+            "data-duk-gap": str(gap),
+        },
+        # Lets the grid lay out its cells before the script first runs
+        {
+            "--duk-card-height": f"{card_height}px",
+            "--duk-card-min-width": f"{min_card_width}px",
+            "--duk-card-gap": f"{gap}px",
+        },
+        kwargs,
+    )
+
+
+@dash.callback(
+    dash.Output(_virtual_page_id(dash.MATCH), "data"),
+    dash.Input(_virtual_window_id(dash.MATCH), "data"),
+    dash.State(_virtual_config_id(dash.MATCH), "data"),
+    prevent_initial_call=True,
+)
+def _fetch_window(
+    window: Optional[Dict[str, Any]], config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Send the rows of the window requested by the browser."""
+    if not window or not config.get("source"):
+        raise PreventUpdate
+    source = RowSource.get(config["source"])
+    start = max(int(window["start"]), 0)
+    # Never send more than a couple of windows, whatever the browser asks for
+    stop = min(int(window["end"]), start + 2 * config["window"])
+    return {"start": start, "rows": source.rows(start, stop), "total": len(source)}
+
+
+# Dash < 2.16 has no set_props: the script clicks a hidden trigger instead
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="virtualRequest"),
+    dash.Output(_virtual_window_id(dash.MATCH), "data"),
+    dash.Input(_virtual_trigger_id(dash.MATCH), "n_clicks"),
+    dash.State(_virtual_window_id(dash.MATCH), "id"),
+    prevent_initial_call=True,
+)
+
+dash.clientside_callback(
+    dash.ClientsideFunction(namespace="dash_ui_kit", function_name="virtualPage"),
+    dash.Output(_virtual_spacer_id(dash.MATCH), "style"),
+    dash.Input(_virtual_page_id(dash.MATCH), "data"),
+    dash.State(_virtual_page_id(dash.MATCH), "id"),
+)
@@ -1,5 +1,6 @@
 """Theme configuration and management."""
 
 from dash_ui_kit.themes.default import default_theme
+from dash_ui_kit.themes.figures import figure_template, register_figure_template
 
-__all__ = ["default_theme"]
+__all__ = ["default_theme", "figure_template", "register_figure_template"]
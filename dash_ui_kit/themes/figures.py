@@ -0,0 +1,158 @@
+"""Plotly figure template generated from a theme."""
+
+from typing import Any, Dict, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dash_ui_kit.themes.default import default_theme
+
+FONT_FAMILY = (
+    'ui-sans-serif, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", '
+    'Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif'
+)
+
+# Hue offsets from the primary color of the series colors after the
+# primary and accent colors
+_HUE_STEPS = (90, 135, 180, 225, 270, 315)
+
+
+def _hsl(color: str) -> str:
+    """A theme color ("220 80% 50%") as a Plotly color."""
+    hue, saturation, lightness = color.split()
+    return f"hsl({hue},{saturation},{lightness})"
+
+
+def _rotate(color: str, degrees: int) -> str:
+    hue, saturation, lightness = color.split()
+    return _hsl(f"{(float(hue) + degrees) % 360:g} {saturation} {lightness}")
+
+
+def _px(size: str) -> float:
+    """A theme size ("0.875rem") in pixels."""
+    if size.endswith("rem"):
+        return float(size[:-3]) * 16
+    return float(size.rstrip("px") or 0)
+
+
+def figure_template(theme: Optional[Dict[str, Any]] = None) -> go.layout.Template:
+    """
+    Build a Plotly figure template matching a theme.
+
+    Backgrounds, text, grid lines, hover labels and the colors of series
+    come from the theme's colors, font sizes and margins from its
+    typography and spacing, so charts sit next to kit components without
+    looking foreign.
+
+    Args:
+        theme: Theme dict shaped like ``default_theme``; ``default_theme``
+            if None
+
+    Returns:
+        go.layout.Template: Template for ``layout.template``
+
+    Example:
+        ```python
+        from dash_ui_kit import figure_template
+
+        figure.update_layout(template=figure_template())
+        ```
+    """
+    theme = default_theme if theme is None else theme
+    colors = theme["colors"]
+    typography = theme["typography"]
+    spacing = theme["spacing"]
+
+    foreground = _hsl(colors["foreground"])
+    muted = _hsl(colors["muted_foreground"])
+    border = _hsl(colors["border"])
+    background = _hsl(colors["background"])
+
+    axis = {
+        "gridcolor": border,
+        "linecolor": border,
+        "zerolinecolor": border,
+        "tickcolor": border,
+        "tickfont": {"color": muted, "size": _px(typography["xs"])},
+        "title": {"font": {"color": muted, "size": _px(typography["sm"])}},
+        "automargin": True,
+    }
+    return go.layout.Template(
+        layout={
+            "colorway": [
+                _hsl(colors["primary"]),
+                _hsl(colors["accent"]),
+                *(_rotate(colors["primary"], step) for step in _HUE_STEPS),
+            ],
+            "colorscale": {
+                "sequential": [[0, _hsl(colors["muted"])], [1, _hsl(colors["primary"])]]
+            },
+            "font": {
+                "family": FONT_FAMILY,
+                "size": _px(typography["sm"]),
+                "color": foreground,
+            },
+            "title": {"font": {"size": _px(typography["lg"]), "color": foreground}},
+            "paper_bgcolor": background,
+            "plot_bgcolor": background,
+            "xaxis": axis,
+            "yaxis": axis,
+            "legend": {"bgcolor": "rgba(0,0,0,0)", "font": {"color": foreground}},
+            "hoverlabel": {
+                "bgcolor": background,
+                "bordercolor": border,
+                "font": {"color": foreground, "size": _px(typography["sm"])},
+            },
+            "margin": {
+                "t": _px(spacing["8"]),
+                "r": _px(spacing["4"]),
+                "b": _px(spacing["10"]),
+                "l": _px(spacing["12"]),
+            },
+        },
+        data={
+            "scatter": [go.Scatter(line={"width": 2})],
+            "scattergl": [go.Scattergl(line={"width": 2})],
+            "bar": [go.Bar(marker={"line": {"width": 0}})],
+        },
+    )
+
+
+def register_figure_template(
+    theme: Optional[Dict[str, Any]] = None,
+    name: str = "dash_ui_kit",
+    default: bool = True,
+) -> go.layout.Template:
+    """
+    Register the template of a theme with Plotly, by name.
+
+    The ``"dash_ui_kit"`` template of ``default_theme`` is registered when
+    the kit is imported; register it again after changing the theme. With
+    ``default``, every figure made afterwards (including Plotly Express
+    figures) uses it unless it names another template.
+
+    Args:
+        theme: Theme dict shaped like ``default_theme``; ``default_theme``
+            if None
+        name: Name for ``template=`` and ``plotly.io.templates``
+        default: Also make it Plotly's default template
+
+    Returns:
+        go.layout.Template: The registered template
+
+    Example:
+        ```python
+        from dash_ui_kit import register_figure_template
+
+        register_figure_template()
+        px.line(df, x="date", y="revenue")  # follows the kit's theme
+        ```
+    """
+    template = figure_template(theme)
+    pio.templates[name] = template
+    if default:
+        pio.templates.default = name
+    return template
+
+
+register_figure_template(default=False)
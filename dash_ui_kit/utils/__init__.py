@@ -1,5 +1,38 @@
 """Utility functions for dash-ui-kit."""
 
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.patch import diff_layout, layout_patch
+from dash_ui_kit.utils.downsample import downsample
+from dash_ui_kit.utils.feeds import FeedPage, FeedSource, decode_cursor, encode_cursor
+from dash_ui_kit.utils.formatting import format_numbers, percent_change
+from dash_ui_kit.utils.options import options_from_columns
+from dash_ui_kit.utils.search import OptionIndex, SearchPage
+from dash_ui_kit.utils.serialization import deserialize_layout, serialize_layout
+from dash_ui_kit.utils.sources import RowSource
+from dash_ui_kit.utils.tables import TablePage, TableSource
+from dash_ui_kit.utils.templates import render_template
+from dash_ui_kit.utils.validation import Validator, validate_values
 
-__all__ = ["cn"]
+__all__ = [
+    "FeedPage",
+    "FeedSource",
+    "OptionIndex",
+    "RowSource",
+    "SearchPage",
+    "TablePage",
+    "TableSource",
+    "Validator",
+    "cn",
+    "decode_cursor",
+    "deserialize_layout",
+    "diff_layout",
+    "downsample",
+    "encode_cursor",
+    "format_numbers",
+    "layout_patch",
+    "options_from_columns",
+    "percent_change",
+    "render_template",
+    "serialize_layout",
+    "validate_values",
+]
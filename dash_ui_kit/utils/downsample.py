@@ -0,0 +1,197 @@
+"""Downsample long series to the points a chart can actually show."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Literal, Optional, Tuple
+
+from dash_ui_kit.utils.options import _fingerprint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+MethodType = Literal["lttb", "minmax"]
+
+_CACHE_SIZE = 256
+_cache: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Downsampling needs NumPy: pip install 'dash-ui-kit[data]'")
+
+
+def _column(values: Any) -> Any:
+    if pd is not None and isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy()
+    return np.asarray(values)
+
+
+def _values(y: Any) -> Any:
+    """Values as floats, missing values (None, NaN, pd.NA) as NaN."""
+    if pd is not None and isinstance(y, (pd.Series, pd.Index)):
+        return y.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(y, dtype=float)
+
+
+def _positions(x: Any) -> Any:
+    """X values as floats; datetimes as nanoseconds."""
+    if x.dtype.kind in "mM":
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def lttb_indices(x: Any, y: Any, points: int) -> Any:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; the others are split into
+    ``points - 2`` buckets, and each bucket keeps the point forming the
+    largest triangle with the point kept before it and the average of the
+    next bucket. Bucket averages and areas are NumPy operations; only the
+    walk from bucket to bucket is a Python loop, of ``points`` steps.
+
+    Args:
+        x: X positions as floats, ascending
+        y: Y values as floats, without NaN
+        points: Number of points to keep
+
+    Returns:
+        numpy.ndarray: Ascending indices into ``x`` and ``y``
+    """
+    count = len(y)
+    if points >= count or points < 3:
+        return np.arange(count)
+
+    edges = np.linspace(1, count - 1, points - 1).astype(np.intp)
+    sizes = np.diff(edges)
+    next_x = np.append(np.add.reduceat(x[1:-1], edges[:-1] - 1) / sizes, x[-1])[1:]
+    next_y = np.append(np.add.reduceat(y[1:-1], edges[:-1] - 1) / sizes, y[-1])[1:]
+
+    kept = np.empty(points, dtype=np.intp)
+    kept[0], kept[-1] = 0, count - 1
+    ax, ay = x[0], y[0]
+    for bucket in range(points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        areas = np.abs(
+            (ax - next_x[bucket]) * (y[start:stop] - ay)
+            - (ax - x[start:stop]) * (next_y[bucket] - ay)
+        )
+        index = start + int(areas.argmax())
+        kept[bucket + 1] = index
+        ax, ay = x[index], y[index]
+    return kept
+
+
+def minmax_indices(y: Any, buckets: int) -> Any:
+    """
+    Indices of the lowest and highest point of each of ``buckets`` runs.
+
+    Every peak and trough of the series stays visible. Runs have equal
+    numbers of points and are reduced together as rows of a 2-D array.
+
+    Args:
+        y: Y values as floats, without NaN
+        buckets: Number of runs; at most ``2 * buckets`` points are kept,
+            plus the first and last
+
+    Returns:
+        numpy.ndarray: Ascending indices into ``y``
+    """
+    count = len(y)
+    if buckets < 1 or 2 * buckets >= count:
+        return np.arange(count)
+
+    size = -(-count // buckets)
+    buckets = -(-count // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:count] = y
+    grid = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = np.nanargmin(grid, axis=1) + offsets
+    highs = np.nanargmax(grid, axis=1) + offsets
+    return np.unique(np.concatenate([lows, highs, [0, count - 1]]))
+
+
+def downsample(
+    y: Any,
+    x: Any = None,
+    points: int = 200,
+    method: MethodType = "lttb",
+) -> Tuple[Any, Any]:
+    """
+    Reduce a series to about ``points`` points that keep its shape.
+
+    Missing values are dropped first. Results are cached by a content hash
+    of the series, so rendering the same data again (another user, another
+    callback) skips the work; the returned arrays are read-only.
+
+    Args:
+        y: Values, as a sequence, NumPy array or pandas Series
+        x: Positions of the values (numbers or datetimes), ascending;
+            defaults to 0, 1, 2, ...
+        points: Target number of points, such as the chart's width in pixels
+        method: Algorithm
+            - "lttb": Largest-Triangle-Three-Buckets, the most faithful
+              shape for line charts
+            - "minmax": Lowest and highest point per bucket, keeping every
+              extreme; fastest
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The kept x and y values
+
+    Example:
+        ```python
+        from dash_ui_kit import downsample
+
+        x, y = downsample(df["latency"], df["time"], points=300)
+        ```
+    """
+    _require_numpy()
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"Unknown downsampling method: {method!r}")
+    if points < 2:
+        raise ValueError("points must be at least 2")
+
+    key: Optional[Hashable] = _fingerprint(y)
+    if key is not None and x is not None:
+        x_key = _fingerprint(x)
+        key = None if x_key is None else (key, x_key)
+    if key is not None:
+        key = (key, points, method)
+        with _lock:
+            result = _cache.get(key)
+            if result is not None:
+                _cache.move_to_end(key)
+                return result
+
+    values = _values(y)
+    x_values = np.arange(len(values)) if x is None else _column(x)
+    if len(x_values) != len(values):
+        raise ValueError("x and y must have the same length")
+
+    present = ~np.isnan(values)
+    if not present.all():
+        values, x_values = values[present], x_values[present]
+
+    if method == "lttb":
+        kept = lttb_indices(_positions(x_values), values, points)
+    else:
+        kept = minmax_indices(values, points // 2)
+    result = (x_values[kept], values[kept])
+    for array in result:
+        array.flags.writeable = False
+
+    if key is not None:
+        with _lock:
+            _cache[key] = result
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return result
@@ -0,0 +1,157 @@
+"""Feeds of items kept on the server and served a page at a time by cursor."""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from dash_ui_kit.utils.registry import NamedSource
+
+# Largest page a feed serves, whatever the browser asks for
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(position: Any) -> str:
+    """
+    Encode a feed position as an opaque, URL-safe cursor.
+
+    Args:
+        position: JSON-serializable position, such as the key of the last
+            item shown
+
+    Returns:
+        str: The cursor
+    """
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Any:
+    """
+    Decode a cursor made by ``encode_cursor``.
+
+    Args:
+        cursor: The cursor; None for the start of the feed
+
+    Returns:
+        Any: The position, or None for the start of the feed
+
+    Raises:
+        ValueError: If the cursor was not made by ``encode_cursor``
+    """
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid feed cursor {cursor!r}") from None
+
+
+class FeedPage(NamedTuple):
+    """
+    One page of a feed.
+
+    Attributes:
+        items: Items of the page
+        cursor: Cursor of the next page; None at the end of the feed
+    """
+
+    items: List[Any]
+    cursor: Optional[str]
+
+
+class FeedSource(NamedSource):
+    """
+    Items served to ``InfiniteFeed`` a page at a time, each page starting
+    where the previous one ended.
+
+    ``fetch(after, limit)`` returns up to ``limit`` items following
+    ``after``. With ``key``, ``after`` is the key of the last item already
+    shown (None for the first page), which suits queries such as
+    ``WHERE id < :after ORDER BY id DESC LIMIT :limit`` and stays correct
+    when new items arrive at the top. Without ``key``, ``after`` is the
+    number of items already shown.
+
+    The position is sent to the browser as an opaque cursor (see
+    ``encode_cursor``); page sizes are capped at ``max_page_size``. A page
+    shorter than asked for ends the feed; when the last page is exactly
+    full, one more request returns no items and ends it.
+
+    Args:
+        fetch: Called with ``(after, limit)`` to get the next items
+        name: Name of the source, unique per app
+        key: Returns the position of an item (JSON-serializable)
+        render: Turns an item into a component; items are used as they
+            are by default
+        max_page_size: Largest page served
+
+    Example:
+        ```python
+        from dash_ui_kit import FeedSource, InfiniteFeed
+
+        def fetch(after, limit):
+            return db.activity(before_id=after, limit=limit)
+
+        activity = FeedSource(
+            fetch, "activity", key=lambda event: event["id"], render=event_row
+        )
+        InfiniteFeed(id="activity", source=activity, page_size=20)
+        ```
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Any, int], Sequence[Any]],
+        name: str,
+        key: Optional[Callable[[Any], Any]] = None,
+        render: Optional[Callable[[Any], Any]] = None,
+        max_page_size: int = MAX_PAGE_SIZE,
+    ) -> None:
+        if max_page_size < 1:
+            raise ValueError("max_page_size must be at least 1")
+        self._fetch = fetch
+        self._key = key
+        self._render = render
+        self.max_page_size = max_page_size
+        self._register(name)
+
+    def page(self, cursor: Optional[str] = None, limit: int = 20) -> FeedPage:
+        """
+        Return the page starting at ``cursor``.
+
+        Args:
+            cursor: Cursor of a previous ``FeedPage``; None for the first page
+            limit: Number of items, capped at ``max_page_size``
+
+        Returns:
+            FeedPage: The items and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        limit = min(max(limit, 1), self.max_page_size)
+        after = decode_cursor(cursor)
+        if self._key is None:
+            after = after or 0
+            if not isinstance(after, int) or after < 0:
+                raise ValueError(f"Invalid feed cursor {cursor!r}")
+
+        # fetch is never asked for more than the capped page; a full page
+        # may be followed by more items, a shorter one ends the feed
+        items = list(self._fetch(after, limit))[:limit]
+
+        next_cursor = None
+        if len(items) == limit:
+            position = after + len(items) if self._key is None else self._key(items[-1])
+            next_cursor = encode_cursor(position)
+        return FeedPage(items, next_cursor)
+
+    def render(self, items: Sequence[Any]) -> List[Any]:
+        """Turn items into components with the source's ``render``."""
+        if self._render is None:
+            return list(items)
+        return [self._render(item) for item in items]
+
+    def __repr__(self) -> str:
+        return f"FeedSource({self.name!r})"
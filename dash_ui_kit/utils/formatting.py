@@ -0,0 +1,115 @@
+"""Vectorized number formatting for KPI values and their changes."""
+
+from typing import Any, List
+
+from dash_ui_kit.utils.options import _as_array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+# Shown in place of missing numbers
+MISSING = "—"
+
+_COMPACT_STEPS = (1e3, 1e6, 1e9, 1e12)
+_COMPACT_UNITS = ("K", "M", "B", "T")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Number formatting needs NumPy: pip install 'dash-ui-kit[data]'"
+        )
+
+
+def _floats(values: Any) -> Any:
+    """Values as a float array, missing values (None, NaN, pd.NA) as NaN."""
+    if pd is not None and isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(_as_array(values), dtype=float)
+
+
+def format_numbers(
+    values: Any,
+    decimals: int = 0,
+    compact: bool = False,
+    prefix: str = "",
+    suffix: str = "",
+) -> List[str]:
+    """
+    Format many numbers at once.
+
+    Scaling, rounding and the choice of compact units are NumPy operations
+    over the whole column; only the final ``format`` runs per value.
+
+    Args:
+        values: Numbers, as a sequence, NumPy array or pandas Series
+        decimals: Digits after the decimal point
+        compact: Abbreviate large numbers (``12.3K``, ``4.5M``)
+        prefix: Text before the number, after the sign (such as ``"$"``)
+        suffix: Text after the number (such as ``"%"``)
+
+    Returns:
+        List[str]: Formatted numbers with thousands separators; missing
+        values (None, NaN) as an em dash
+
+    Example:
+        ```python
+        format_numbers([12345, 45231.5, None], prefix="$")
+        # ['$12,345', '$45,232', '—']
+        format_numbers([1520, 2_400_000], decimals=1, compact=True)
+        # ['1.5K', '2.4M']
+        ```
+    """
+    _require_numpy()
+    numbers = _floats(values)
+    missing = np.isnan(numbers)
+    magnitudes = np.abs(np.where(missing, 0.0, numbers))
+
+    units = np.full(len(numbers), "", dtype=object)
+    if compact and len(numbers):
+        steps = np.array(_COMPACT_STEPS)
+        step = np.searchsorted(steps, magnitudes, side="right") - 1
+        # 999,960 rounds to 1,000.0K: move such values up a unit
+        scaled = np.round(magnitudes / steps[step.clip(0)], decimals)
+        step = np.where((scaled >= 1000) & (step < len(steps) - 1), step + 1, step)
+        scaled = magnitudes / steps[step.clip(0)]
+        magnitudes = np.where(step >= 0, scaled, magnitudes)
+        units = np.where(
+            step >= 0, np.array(_COMPACT_UNITS, dtype=object)[step.clip(0)], ""
+        )
+
+    magnitudes = np.round(magnitudes, decimals)
+    signs = np.where((numbers < 0) & (magnitudes > 0), "-", "")
+    spec = f",.{decimals}f"
+    return [
+        MISSING if absent else f"{sign}{prefix}{format(number, spec)}{unit}{suffix}"
+        for absent, sign, number, unit in zip(
+            missing.tolist(), signs.tolist(), magnitudes.tolist(), units.tolist()
+        )
+    ]
+
+
+def percent_change(current: Any, previous: Any) -> Any:
+    """
+    Percent change from ``previous`` to ``current``, element-wise.
+
+    Args:
+        current: Current values
+        previous: Values to compare with
+
+    Returns:
+        numpy.ndarray: Changes in percent; NaN where ``previous`` is zero or
+        either value is missing
+    """
+    _require_numpy()
+    current, previous = _floats(current), _floats(previous)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (current - previous) / np.abs(previous) * 100
+    return np.where(previous == 0, np.nan, change)
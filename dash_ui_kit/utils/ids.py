@@ -0,0 +1,23 @@
+"""Helpers for Dash component ids."""
+
+import json
+from typing import Any, Dict, Union
+
+ComponentId = Union[str, Dict[str, Any]]
+
+
+def stringify_id(component_id: ComponentId) -> str:
+    """
+    Return the DOM id Dash renders for a component id.
+
+    Dictionary (pattern-matching) ids are rendered as JSON with sorted keys.
+
+    Args:
+        component_id: String or dictionary id
+
+    Returns:
+        str: The element's ``id`` attribute in the browser
+    """
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(",", ":"))
+    return component_id
@@ -0,0 +1,117 @@
+"""Functions building deferred content, kept on the server by key."""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from dash import html
+
+Loader = Callable[[], Any]
+
+
+def new_token() -> str:
+    """
+    Token identifying the deferred content of one layout build.
+
+    Components register their loaders under it and keep it in the layout,
+    so a callback builds the content of the layout the browser received
+    rather than that of the last layout built.
+    """
+    return uuid.uuid4().hex
+
+
+def load_error() -> html.Div:
+    """Shown in place of deferred content that no loader can build."""
+    return html.Div(
+        "This content couldn't be loaded. Reload the page to try again.",
+        className="duk-load-error",
+        role="alert",
+    )
+
+
+class LoaderRegistry:
+    """
+    Loaders of deferred content, registered when a layout is built and
+    called later by a callback.
+
+    The browser only sends the key of the content it needs, never a
+    reference to code. Components register each loader twice: under a
+    ``new_token()`` made per layout build, so every build gets entries of
+    its own, and under a key made from the component id alone, which every
+    worker building the same layout registers too. Callbacks ``find`` the
+    first and fall back to the second; the least recently used entries are
+    dropped beyond ``max_entries``.
+
+    Loaders live in the process that built the layout. A request reaching
+    another worker (without sticky sessions, or for a layout built by
+    another worker and shared through a cache) gets the content of the last
+    layout that worker built with the same id, or ``load_error()`` if it
+    built none. Layouts whose deferred content differs per user need
+    sticky sessions.
+
+    Args:
+        max_entries: Maximum number of loaders kept
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._loaders: OrderedDict[Hashable, Tuple[Loader, Optional[str], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        key: Hashable,
+        load: Loader,
+        cache_key: Optional[str] = None,
+        cache: Any = None,
+    ) -> None:
+        """
+        Register the loader of a piece of content.
+
+        Args:
+            key: Key sent by the browser to request the content
+            load: Called without arguments to build the content
+            cache_key: Key of the built content in ``cache``
+            cache: Object with ``get_or_build(key, builder)``, such as a
+                ``SharedLayoutCache``
+        """
+        with self._lock:
+            self._loaders[key] = (load, cache_key, cache)
+            self._loaders.move_to_end(key)
+            while len(self._loaders) > self.max_entries:
+                self._loaders.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._loaders
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def find(self, *keys: Hashable) -> Optional[Hashable]:
+        """
+        The first of ``keys`` with a loader registered in this process.
+
+        Returns:
+            Optional[Hashable]: The key, or None if none is registered
+        """
+        return next((key for key in keys if key in self._loaders), None)
+
+    def build(self, key: Hashable) -> Any:
+        """
+        Build the content registered under ``key``.
+
+        Raises:
+            KeyError: If nothing was registered under ``key`` in this process,
+                or it was dropped since
+        """
+        with self._lock:
+            load, cache_key, cache = self._loaders[key]
+            self._loaders.move_to_end(key)
+        if cache is not None and cache_key is not None:
+            return cache.get_or_build(cache_key, load)
+        return load()
@@ -0,0 +1,326 @@
+"""Build dropdown options from columnar data."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+OptionType = Dict[str, Any]
+Options = Union[List[OptionType], List[Any], Dict[str, Any]]
+
+_CACHE_SIZE = 128
+_cache: "OrderedDict[Hashable, Options]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def is_columnar(source: Any) -> bool:
+    """
+    Return True if ``source`` is columnar option data rather than a list of
+    option dicts: a NumPy array, a pandas Series, Index or DataFrame, or a
+    ``(labels, values)`` pair of sequences.
+    """
+    if isinstance(source, tuple) and len(source) == 2:
+        return all(_is_sequence(column) for column in source)
+    if np is not None and isinstance(source, np.ndarray):
+        return True
+    return pd is not None and isinstance(source, (pd.Series, pd.Index, pd.DataFrame))
+
+
+def _is_sequence(value: Any) -> bool:
+    return not isinstance(value, (str, bytes, dict)) and hasattr(value, "__len__")
+
+
+def split_columns(source: Any) -> Tuple[Any, Any]:
+    """
+    Split columnar option data into (labels, values).
+
+    A DataFrame provides labels from its first column and values from its
+    second; a single column (or a one-column DataFrame) is used for both.
+    """
+    if isinstance(source, tuple):
+        return source
+    if pd is not None and isinstance(source, pd.DataFrame):
+        if source.shape[1] == 1:
+            column = source.iloc[:, 0]
+            return column, column
+        if source.shape[1] == 2:
+            return source.iloc[:, 0], source.iloc[:, 1]
+        raise ValueError(
+            "A DataFrame of options needs one column, or two columns "
+            f"(labels, values); got {source.shape[1]}"
+        )
+    return source, source
+
+
+def _as_array(column: Any) -> Any:
+    """Convert a column to a NumPy array of JSON-friendly values."""
+    if pd is not None and isinstance(column, (pd.Series, pd.Index)):
+        if column.dtype.kind in "mM":
+            return column.astype(str).to_numpy()
+        array = column.to_numpy()
+    else:
+        array = np.asarray(column)
+    if array.dtype.kind in "mM":
+        array = array.astype(str)
+    return array
+
+
+def _digest_values(values: List[Any]) -> Optional[str]:
+    """
+    Content digest of a list of plain values, or None if it has other values.
+
+    Equal values of different types (``1``, ``1.0``, ``True``, ``"1"``) give
+    different digests.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        # Much faster than encoding strings one by one; only unambiguous if
+        # no string contains the separator
+        joined = "\x00".join(values)
+    except TypeError:
+        joined = None
+    if joined is not None and joined.count("\x00") == max(len(values) - 1, 0):
+        digest.update(b"s")
+        digest.update(joined.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    try:
+        encoded = json.dumps(values, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    digest.update(b"j")
+    digest.update(encoded.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def _fingerprint(column: Any) -> Optional[Hashable]:
+    """Content hash of a column, or None if it can't be hashed cheaply."""
+    if pd is not None and isinstance(column, (pd.Series, pd.Index)):
+        array = column.to_numpy()
+    elif np is not None and isinstance(column, np.ndarray):
+        array = column
+    else:
+        try:
+            values = list(column)
+        except TypeError:
+            return None
+        digest = _digest_values(values)
+        return None if digest is None else ("sequence", len(values), digest)
+
+    if array.dtype.kind != "O":
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(array).tobytes(), digest_size=16
+        ).hexdigest()
+    else:
+        digest = _digest_values(array.tolist())
+        if digest is None:
+            return None
+    return ("array", str(column.dtype), array.shape, digest)
+
+
+def _present(array: Any) -> Any:
+    """Mask of non-missing entries (None, NaN, NaT)."""
+    if pd is not None:
+        return ~pd.isna(array)
+    if array.dtype.kind in "fc":
+        return ~np.isnan(array)
+    if array.dtype.kind == "O":
+        return np.array([value is not None for value in array.tolist()], dtype=bool)
+    return np.ones(len(array), dtype=bool)
+
+
+def _first_occurrences(array: Any) -> Any:
+    """Mask of the first occurrence of each distinct value."""
+    if array.dtype.kind in "biufSU":
+        _, first = np.unique(array, return_index=True)
+    else:
+        # Object arrays (e.g. strings): a dict is faster than sorting them
+        items = array.tolist()
+        positions = range(len(items) - 1, -1, -1)
+        # Iterating backwards, the first occurrence is written last
+        first = np.fromiter(dict(zip(reversed(items), positions)).values(), dtype=int)
+    mask = np.zeros(len(array), dtype=bool)
+    mask[first] = True
+    return mask
+
+
+def _build_vectorized(
+    labels: Any, values: Any, same: bool, sort: bool, dedupe: bool
+) -> Tuple[List[Any], List[Any]]:
+    label_array = _as_array(labels)
+    value_array = label_array if same else _as_array(values)
+    if len(label_array) != len(value_array):
+        raise ValueError("Option labels and values must have the same length")
+
+    keep = _present(value_array)
+    if dedupe:
+        keep &= _first_occurrences(value_array)
+
+    if not keep.all():
+        label_array = label_array[keep]
+        value_array = label_array if same else value_array[keep]
+
+    if sort:
+        try:
+            order = np.argsort(label_array, kind="stable")
+        except TypeError:
+            order = np.array(
+                sorted(range(len(label_array)), key=lambda i: str(label_array[i])),
+                dtype=np.intp,
+            )
+        label_array = label_array[order]
+        value_array = label_array if same else value_array[order]
+
+    label_list = label_array.tolist()
+    return label_list, label_list if same else value_array.tolist()
+
+
+def _build_python(
+    labels: Sequence[Any], values: Sequence[Any], sort: bool, dedupe: bool
+) -> Tuple[List[Any], List[Any]]:
+    if len(labels) != len(values):
+        raise ValueError("Option labels and values must have the same length")
+
+    pairs = [
+        (label, value) for label, value in zip(labels, values) if value is not None
+    ]
+    if dedupe:
+        seen = set()
+        unique = []
+        for label, value in pairs:
+            if value not in seen:
+                seen.add(value)
+                unique.append((label, value))
+        pairs = unique
+    if sort:
+        try:
+            pairs.sort(key=lambda pair: pair[0])
+        except TypeError:
+            pairs.sort(key=lambda pair: str(pair[0]))
+    return [label for label, _ in pairs], [value for _, value in pairs]
+
+
+def _is_index_key(value: str) -> bool:
+    """
+    Whether browsers treat ``value`` as an array index when it is an object
+    key, listing it before other keys in ascending order.
+    """
+    if not (value.isascii() and value.isdigit()):
+        return False
+    return str(int(value)) == value and int(value) < 2**32 - 1
+
+
+def build_options(
+    labels: Any,
+    values: Any = None,
+    sort: bool = False,
+    dedupe: bool = True,
+    compact: bool = False,
+) -> Options:
+    """Build options like ``options_from_columns``, without caching."""
+    same = values is None or values is labels
+    vectorized = np is not None and any(
+        isinstance(column, np.ndarray)
+        or (pd is not None and isinstance(column, (pd.Series, pd.Index)))
+        for column in (labels, values)
+    )
+    if vectorized:
+        label_list, value_list = _build_vectorized(labels, values, same, sort, dedupe)
+    else:
+        labels = list(labels)
+        label_list, value_list = _build_python(
+            labels, labels if same else list(values), sort, dedupe
+        )
+
+    options: Options
+    if compact and same:
+        options = value_list
+    elif compact and all(
+        isinstance(value, str) and not _is_index_key(value) for value in value_list
+    ):
+        options = dict(zip(value_list, label_list))
+    else:
+        options = [
+            {"label": label, "value": value}
+            for label, value in zip(label_list, value_list)
+        ]
+
+    return options
+
+
+def options_from_columns(
+    labels: Any,
+    values: Any = None,
+    sort: bool = False,
+    dedupe: bool = True,
+    compact: bool = False,
+) -> Options:
+    """
+    Build dropdown options from columns of labels and values.
+
+    NumPy arrays and pandas objects are deduplicated, cleaned of missing
+    values and sorted with vectorized operations, and converted to Python
+    values in one pass. Results are cached by a content hash of the columns,
+    so rendering the same data again returns the same options object
+    without rebuilding it; treat the result as read-only.
+
+    Args:
+        labels: Option labels (sequence, NumPy array, pandas Series/Index)
+        values: Option values; defaults to the labels
+        sort: Sort options by label
+        dedupe: Keep only the first option for each value
+        compact: Return the smallest form ``dcc.Dropdown`` accepts: a list of
+            values when labels and values are the same column, a
+            ``{value: label}`` dict when all values are strings that keep
+            their order as object keys (not integers such as ``"1001"``,
+            which browsers list first), and a list of option dicts
+            otherwise
+
+    Returns:
+        Options for ``dcc.Dropdown`` / ``Select``
+
+    Example:
+        ```python
+        from dash_ui_kit import Select, options_from_columns
+
+        options = options_from_columns(df["name"], df["id"], sort=True)
+        Select(id="customer", options=options)
+
+        # Or let Select do it
+        Select(id="customer", options=df[["name", "id"]])
+        ```
+    """
+    same = values is None or values is labels
+    if same:
+        key: Optional[Hashable] = _fingerprint(labels)
+    else:
+        label_key, value_key = _fingerprint(labels), _fingerprint(values)
+        key = None if label_key is None or value_key is None else (label_key, value_key)
+
+    if key is not None:
+        key = (key, same, sort, dedupe, compact)
+        with _lock:
+            options = _cache.get(key)
+            if options is not None:
+                _cache.move_to_end(key)
+                return options
+
+    options = build_options(labels, values, sort=sort, dedupe=dedupe, compact=compact)
+
+    if key is not None:
+        with _lock:
+            _cache[key] = options
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return options
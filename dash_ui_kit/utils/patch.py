@@ -0,0 +1,299 @@
+"""Compute minimal ``dash.Patch`` updates between two layouts."""
+
+import json
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from dash import Output, Patch, no_update
+
+from dash_ui_kit.utils.serialization import serialize_layout
+
+PathType = Tuple[Union[str, int], ...]
+
+
+class LayoutChange(NamedTuple):
+    """
+    A single structural change between two layouts.
+
+    Attributes:
+        op: One of "assign", "delete", "insert" or "extend"
+        path: Location of the change, as keys and list indices from the root.
+            For "insert" the last element is the insertion index; for
+            "extend" the path points at the list being extended.
+        value: New value for "assign", "insert" and "extend"
+    """
+
+    op: str
+    path: PathType
+    value: Any = None
+
+
+def _to_spec(layout: Any) -> Any:
+    """Convert components (or spec trees) to plain JSON values."""
+    return json.loads(serialize_layout(layout))
+
+
+def _is_component(value: Any) -> bool:
+    return isinstance(value, dict) and value.keys() == {"props", "type", "namespace"}
+
+
+def _key(value: Any) -> Optional[str]:
+    """Identity of a list item: its component id, if it has one."""
+    if _is_component(value) and value["props"].get("id") is not None:
+        return json.dumps(value["props"]["id"], sort_keys=True)
+    return None
+
+
+def _diff(old: Any, new: Any, path: PathType, changes: List[LayoutChange]) -> None:
+    if old == new:
+        return
+
+    if _is_component(old) and _is_component(new):
+        old_props, new_props = old["props"], new["props"]
+        if (
+            old["type"] != new["type"]
+            or old["namespace"] != new["namespace"]
+            or _key(old) != _key(new)
+        ):
+            changes.append(LayoutChange("assign", path, new))
+            return
+
+        props_path = path + ("props",)
+        for name, value in new_props.items():
+            if name not in old_props:
+                changes.append(LayoutChange("assign", props_path + (name,), value))
+            else:
+                _diff(old_props[name], value, props_path + (name,), changes)
+        for name in old_props:
+            if name not in new_props:
+                changes.append(LayoutChange("delete", props_path + (name,)))
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, changes)
+        return
+
+    changes.append(LayoutChange("assign", path, new))
+
+
+def _diff_list(
+    old: List[Any], new: List[Any], path: PathType, changes: List[LayoutChange]
+) -> None:
+    old_keys = [_key(item) for item in old]
+    new_keys = [_key(item) for item in new]
+    keyed = (
+        all(old_keys)
+        and all(new_keys)
+        and len(set(old_keys)) == len(old_keys)
+        and len(set(new_keys)) == len(new_keys)
+    )
+
+    if keyed and old_keys != new_keys:
+        _diff_keyed_list(old, new, old_keys, new_keys, path, changes)
+        return
+
+    # Positional diff: update the common prefix, then grow or shrink the tail
+    for index, (old_item, new_item) in enumerate(zip(old, new)):
+        _diff(old_item, new_item, path + (index,), changes)
+    if len(new) > len(old):
+        changes.append(LayoutChange("extend", path, new[len(old) :]))
+    for index in reversed(range(len(new), len(old))):
+        changes.append(LayoutChange("delete", path + (index,)))
+
+
+def _diff_keyed_list(
+    old: List[Any],
+    new: List[Any],
+    old_keys: Sequence[Optional[str]],
+    new_keys: Sequence[Optional[str]],
+    path: PathType,
+    changes: List[LayoutChange],
+) -> None:
+    """Diff lists of components with unique ids, matching items by id."""
+    new_key_set = set(new_keys)
+    kept = [key for key in old_keys if key in new_key_set]
+    old_key_set = set(old_keys)
+    if kept != [key for key in new_keys if key in old_key_set]:
+        # Items were reordered; resending the list is simpler than moves
+        changes.append(LayoutChange("assign", path, new))
+        return
+
+    for index in reversed(range(len(old))):
+        if old_keys[index] not in new_key_set:
+            changes.append(LayoutChange("delete", path + (index,)))
+
+    old_by_key = dict(zip(old_keys, old))
+    for index, (key, item) in enumerate(zip(new_keys, new)):
+        if key in old_by_key:
+            _diff(old_by_key[key], item, path + (index,), changes)
+        else:
+            changes.append(LayoutChange("insert", path + (index,), item))
+
+
+def diff_layout(old: Any, new: Any) -> List[LayoutChange]:
+    """
+    Compute the structural changes that turn ``old`` into ``new``.
+
+    Components are compared prop by prop. Lists of components that all have
+    unique ids are matched by id, so inserting or removing a card in a grid
+    does not touch its siblings; other lists are compared by position.
+
+    Args:
+        old: Previous layout (components, lists or JSON spec trees)
+        new: New layout
+
+    Returns:
+        List[LayoutChange]: Changes to apply in order
+    """
+    changes: List[LayoutChange] = []
+    _diff(_to_spec(old), _to_spec(new), (), changes)
+    return changes
+
+
+def changes_to_patch(
+    changes: Sequence[LayoutChange], patch: Optional[Patch] = None
+) -> Patch:
+    """
+    Record layout changes as operations on a ``dash.Patch``.
+
+    Args:
+        changes: Changes produced by ``diff_layout``
+        patch: Patch to extend; a new one is created by default
+
+    Returns:
+        Patch: Patch applying the changes
+    """
+    patch = Patch() if patch is None else patch
+    for change in changes:
+        if change.op == "extend":
+            target = patch
+            for key in change.path:
+                target = target[key]
+            target.extend(change.value)
+            continue
+
+        parent = patch
+        for key in change.path[:-1]:
+            parent = parent[key]
+        last = change.path[-1]
+        if change.op == "assign":
+            parent[last] = change.value
+        elif change.op == "delete":
+            del parent[last]
+        elif change.op == "insert":
+            parent.insert(last, change.value)
+        else:
+            raise ValueError(f"Unknown layout change: {change.op!r}")
+    return patch
+
+
+def layout_patch(old: Any, new: Any) -> Any:
+    """
+    Build the smallest update that turns the ``old`` output value into ``new``.
+
+    Use it in callbacks that rebuild a subtree but only change a few props,
+    so the response carries the changed values instead of the whole tree.
+
+    Args:
+        old: Value previously sent for the output (e.g. from a ``State`` or a
+            cached build)
+        new: Newly built value
+
+    Returns:
+        A ``dash.Patch`` with the changes, ``dash.no_update`` if nothing
+        changed, or ``new`` itself if the root has to be replaced
+
+    Example:
+        ```python
+        from dash_ui_kit import layout_patch
+
+        @callback(
+            Output("grid", "children"),
+            Input("refresh", "n_intervals"),
+            State("grid", "children"),
+        )
+        def refresh(_, current):
+            return layout_patch(current, build_cards(load_assets()))
+        ```
+    """
+    changes = diff_layout(old, new)
+    if not changes:
+        return no_update
+    if any(change.op == "assign" and not change.path for change in changes):
+        return new
+    return changes_to_patch(changes)
+
+
+class ComponentPatch:
+    """
+    Base class for partial updates of an existing kit component.
+
+    Subclasses compute the props a kit component would derive (such as its
+    ``className``) from a subset of its arguments, so a callback can update
+    those props without rebuilding and resending the whole component.
+
+    Attributes:
+        PROPS: Props the helper can update, in output order
+        props: Props computed for this update
+    """
+
+    PROPS: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, props: Dict[str, Any]) -> None:
+        self.props = props
+
+    @classmethod
+    def outputs(cls, component_id: Any, allow_duplicate: bool = False) -> List[Output]:
+        """
+        Return one ``Output`` per patchable prop of ``component_id``.
+
+        Args:
+            component_id: Id of the existing component
+            allow_duplicate: Passed to each ``Output``, for props that other
+                callbacks also update
+
+        Returns:
+            List[Output]: Outputs matching the order of ``values()``
+        """
+        return [
+            Output(component_id, prop, allow_duplicate=allow_duplicate)
+            for prop in cls.PROPS
+        ]
+
+    def values(self) -> Tuple[Any, ...]:
+        """
+        Return the callback return values for ``outputs()``.
+
+        Props this update does not touch are ``dash.no_update``.
+        """
+        return tuple(self.props.get(prop, no_update) for prop in self.PROPS)
+
+    def apply(self, patch: Patch) -> Patch:
+        """
+        Record the update on a ``dash.Patch`` pointing at the component.
+
+        Use it when the component is an item of a patched ``children`` list,
+        e.g. ``ButtonPatch(disabled=True).apply(patch[2])``.
+
+        Args:
+            patch: Patch located at the component's JSON spec
+
+        Returns:
+            Patch: The same patch
+        """
+        for prop, value in self.props.items():
+            patch["props"][prop] = value
+        return patch
+
+    def __repr__(self) -> str:
+        props = ", ".join(f"{name}={value!r}" for name, value in self.props.items())
+        return f"{type(self).__name__}({props})"
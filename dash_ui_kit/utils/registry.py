@@ -0,0 +1,70 @@
+"""Server-side objects registered by name, so callbacks can find them."""
+
+import threading
+from typing import Any, Callable, ClassVar, Dict, Type, TypeVar, cast
+
+S = TypeVar("S", bound="NamedSource")
+
+
+class NamedSource:
+    """
+    Base class for server-side data that components reference by name.
+
+    Components only send the name to the browser; callbacks look the object
+    up again with ``get``. Each subclass has its own registry.
+    """
+
+    _registry: ClassVar[Dict[str, Any]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    name: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._registry = {}
+        cls._registry_lock = threading.Lock()
+
+    def _register(self, name: str) -> None:
+        self.name = name
+        with self._registry_lock:
+            self._registry[name] = self
+
+    @classmethod
+    def get(cls: Type[S], name: str) -> S:
+        """
+        Return the object registered under ``name``.
+
+        Raises:
+            KeyError: If no object with that name was built in this process
+        """
+        try:
+            return cast(S, cls._registry[name])
+        except KeyError:
+            raise KeyError(
+                f"No {cls.__name__} named {name!r}. Build it when the app module "
+                "is imported so every worker process has it."
+            ) from None
+
+    @classmethod
+    def cached(cls: Type[S], name: str, build: Callable[[], Any]) -> S:
+        """
+        Return the object registered under ``name``, building it on first use.
+
+        Args:
+            name: Name of the source
+            build: Called without arguments to produce the data when the
+                source does not exist yet
+
+        Returns:
+            The registered object
+        """
+        source = cls._registry.get(name)
+        if source is None:
+            source = cls(build(), name)  # type: ignore[call-arg]
+        return source
+
+    @classmethod
+    def drop(cls, name: str) -> None:
+        """Forget the object registered under ``name`` (e.g. after reloading)."""
+        with cls._registry_lock:
+            cls._registry.pop(name, None)
@@ -0,0 +1,202 @@
+"""Server-side search over large option lists."""
+
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dash_ui_kit.utils.registry import NamedSource
+
+OptionType = Dict[str, Any]
+
+# Length of the substrings indexed for "contains" matches
+NGRAM = 3
+
+
+class SearchPage(NamedTuple):
+    """
+    One page of search results.
+
+    Attributes:
+        options: Matching options, best matches first
+        total: Number of options matching the query
+        offset: Position of the first returned option among all matches
+    """
+
+    options: List[OptionType]
+    total: int
+    offset: int
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        """Offset of the next page, or None if this is the last page."""
+        end = self.offset + len(self.options)
+        return end if end < self.total else None
+
+
+def _normalize(text: Any) -> str:
+    return str(text).casefold()
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class OptionIndex(NamedSource):
+    """
+    A search index over option labels, for selects with too many options to
+    send to the browser.
+
+    Labels are indexed once by word prefix and by character trigrams. A
+    search returns the options whose label contains the query
+    (case-insensitive), ranked: label starts with the query, then a word
+    starts with it, then any other match; ties keep the original order.
+    Queries shorter than three characters only match the start of a word.
+
+    Indexes are registered by ``name`` so a search callback, in any worker
+    process that built the index, can find it from the name alone.
+
+    Args:
+        options: Option dicts with ``label`` and ``value`` keys
+        name: Name of the option source, unique per app
+
+    Example:
+        ```python
+        from dash_ui_kit import OptionIndex, Select
+
+        skus = OptionIndex.cached("skus", lambda: [
+            {"label": f"{row.sku} - {row.name}", "value": row.sku}
+            for row in products.itertuples()
+        ])
+
+        Select(id="sku", options=skus, page_size=50)
+
+        # Or page through results yourself
+        page = skus.search("bolt", limit=20, offset=40)
+        ```
+    """
+
+    def __init__(self, options: Sequence[OptionType], name: str) -> None:
+        self.options: List[OptionType] = list(options)
+        self._labels = [_normalize(option["label"]) for option in self.options]
+        self._positions: Dict[Any, int] = {}
+        for position, option in enumerate(self.options):
+            self._positions.setdefault(option["value"], position)
+
+        words: List[Tuple[str, int]] = []
+        ngrams: Dict[str, List[int]] = defaultdict(list)
+        for position, label in enumerate(self._labels):
+            words.extend((word, position) for word in set(label.split()))
+            for gram in _ngrams(label):
+                ngrams[gram].append(position)
+        words.sort()
+        self._words = words
+        # Compact posting lists: 4 bytes per entry instead of 8
+        self._ngrams: Dict[str, array] = {
+            gram: array("i", postings) for gram, postings in ngrams.items()
+        }
+
+        self._register(name)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Positions that may match ``query``, in any order."""
+        if len(query) >= NGRAM:
+            postings = sorted(
+                (self._ngrams.get(gram, ()) for gram in _ngrams(query)), key=len
+            )
+            candidates = set(postings[0])
+            for other in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(other)
+            return candidates
+
+        # Too short for trigrams: match word prefixes only
+        words = self._words
+        candidates = set()
+        for index in range(bisect_left(words, (query,)), len(words)):
+            word, position = words[index]
+            if not word.startswith(query):
+                break
+            candidates.add(position)
+        return candidates
+
+    def _matches(self, query: str) -> List[int]:
+        """Positions matching ``query``, best first."""
+        starts: List[int] = []
+        word_starts: List[int] = []
+        contains: List[int] = []
+        for position in sorted(self._candidates(query)):
+            label = self._labels[position]
+            found = label.find(query)
+            if found < 0:
+                # Shares every trigram with the query but not in sequence
+                continue
+            if found == 0:
+                starts.append(position)
+            elif label[found - 1].isspace() or f" {query}" in label:
+                word_starts.append(position)
+            else:
+                contains.append(position)
+        return starts + word_starts + contains
+
+    def search(
+        self, query: Optional[str], limit: int = 50, offset: int = 0
+    ) -> SearchPage:
+        """
+        Find options whose label contains ``query``.
+
+        Args:
+            query: Search text; empty returns options in their original order,
+                and one or two characters match the start of a word only
+            limit: Maximum number of options returned
+            offset: Number of best matches to skip, for pagination
+
+        Returns:
+            SearchPage: The requested page of matches and the total count
+        """
+        query = _normalize(query or "").strip()
+        if not query:
+            return SearchPage(
+                self.options[offset : offset + limit], len(self.options), offset
+            )
+
+        matches = self._matches(query)
+        page = [self.options[position] for position in matches[offset : offset + limit]]
+        return SearchPage(page, len(matches), offset)
+
+    def lookup(self, values: Any) -> List[OptionType]:
+        """
+        Return the options for selected value(s), so they stay displayable
+        while not among the search results.
+
+        Args:
+            values: A value, a list of values or None
+
+        Returns:
+            List[OptionType]: Options for the known values, in the given order
+        """
+        if values is None:
+            return []
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        return [
+            self.options[self._positions[value]]
+            for value in values
+            if value in self._positions
+        ]
+
+    def __repr__(self) -> str:
+        return f"OptionIndex({self.name!r}, {len(self.options)} options)"
@@ -0,0 +1,98 @@
+"""Helpers for converting Dash layouts to and from JSON."""
+
+import importlib
+import json
+from typing import Any, Dict, Optional, Tuple, Type
+
+from dash.development.base_component import Component
+from plotly.utils import PlotlyJSONEncoder
+
+# Namespaces whose Python module differs from the namespace name
+_NAMESPACE_MODULES = {
+    "dash_html_components": "dash.html",
+    "dash_core_components": "dash.dcc",
+    "dash_table": "dash.dash_table",
+}
+
+_component_types: Dict[Tuple[str, str], Type[Component]] = {}
+
+
+def _scan_component_types() -> None:
+    """Index every loaded Component subclass by (namespace, type)."""
+    pending = list(Component.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        # Skip subclasses that reuse their parent's type (e.g. interned ones)
+        if "_type" not in vars(cls):
+            continue
+        namespace = getattr(cls, "_namespace", None)
+        type_name = getattr(cls, "_type", None)
+        if namespace and type_name:
+            _component_types.setdefault((namespace, type_name), cls)
+
+
+def _component_type(namespace: str, type_name: str) -> Optional[Type[Component]]:
+    """Look up the component class for a serialized (namespace, type) pair."""
+    key = (namespace, type_name)
+    if key not in _component_types:
+        try:
+            importlib.import_module(_NAMESPACE_MODULES.get(namespace, namespace))
+        except ImportError:
+            return None
+        _scan_component_types()
+    return _component_types.get(key)
+
+
+def _decode_component(obj: Dict[str, Any]) -> Any:
+    """``json.loads`` object hook that rebuilds Dash components."""
+    if obj.keys() != {"props", "type", "namespace"}:
+        return obj
+
+    cls = _component_type(obj["namespace"], obj["type"])
+    if cls is None:
+        return obj
+    return cls(**obj["props"])
+
+
+def serialize_layout(layout: Any) -> bytes:
+    """
+    Serialize a Dash layout (component tree, list or plain values) to JSON bytes.
+
+    Args:
+        layout: Component, list of components or JSON-compatible value
+
+    Returns:
+        bytes: Compact UTF-8 encoded JSON, as sent to the browser by Dash
+
+    Example:
+        ```python
+        data = serialize_layout(Card([CardTitle("Revenue")]))
+        ```
+    """
+    return json.dumps(layout, cls=PlotlyJSONEncoder, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def deserialize_layout(data: bytes, components: bool = True) -> Any:
+    """
+    Rebuild a layout from bytes produced by ``serialize_layout``.
+
+    Args:
+        data: Serialized layout
+        components: Rebuild Dash component objects. When False the plain JSON
+            spec (nested dicts) is returned, which Dash also accepts as
+            callback output and is cheaper to produce.
+
+    Returns:
+        Any: The layout as components, or as its JSON spec
+
+    Example:
+        ```python
+        layout = deserialize_layout(serialize_layout(Card("Hello")))
+        ```
+    """
+    if components:
+        return json.loads(data, object_hook=_decode_component)
+    return json.loads(data)
@@ -0,0 +1,65 @@
+"""Row data kept on the server and sent to the browser in windows."""
+
+from typing import Any, Dict, List, Sequence
+
+from dash_ui_kit.utils.registry import NamedSource
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+RowType = Dict[str, Any]
+
+
+class RowSource(NamedSource):
+    """
+    Rows served to windowed components (``VirtualList``, ``CardGrid``) a
+    window at a time, so the page payload does not grow with the data.
+
+    Sources are registered by ``name``; build them when the app module is
+    imported so every worker process can serve their windows.
+
+    Args:
+        data: A sequence of row dicts or a pandas DataFrame
+        name: Name of the source, unique per app
+
+    Example:
+        ```python
+        from dash_ui_kit import RowSource, VirtualList
+
+        events = RowSource.cached("events", load_events)
+        VirtualList(id="feed", data=events, template=row_template)
+        ```
+    """
+
+    def __init__(self, data: Any, name: str) -> None:
+        self._frame = None
+        self._rows: Sequence[RowType] = ()
+        if pd is not None and isinstance(data, pd.DataFrame):
+            self._frame = data.reset_index(drop=True)
+        else:
+            self._rows = list(data)
+        self._register(name)
+
+    def __len__(self) -> int:
+        return len(self._frame) if self._frame is not None else len(self._rows)
+
+    def rows(self, start: int, stop: int) -> List[RowType]:
+        """
+        Return the rows in ``[start, stop)``.
+
+        Args:
+            start: Index of the first row
+            stop: Index after the last row (clamped to the number of rows)
+
+        Returns:
+            List[RowType]: Row dicts with JSON-friendly values
+        """
+        start = max(start, 0)
+        if self._frame is not None:
+            return list(self._frame.iloc[start:stop].to_dict("records"))
+        return list(self._rows[start:stop])
+
+    def __repr__(self) -> str:
+        return f"RowSource({self.name!r}, {len(self)} rows)"
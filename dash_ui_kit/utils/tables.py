@@ -0,0 +1,321 @@
+"""Tables kept on the server and queried a page at a time."""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dash_ui_kit.utils.options import _as_array, _present
+from dash_ui_kit.utils.registry import NamedSource
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None  # type: ignore
+
+RowType = Dict[str, Any]
+
+# Number of (sort, filters) row selections kept per table
+_SELECTION_CACHE_SIZE = 32
+
+_COMPARISON = re.compile(r"^\s*(<=|>=|!=|<|>|=)?\s*(-?\d+(?:\.\d+)?(?:e-?\d+)?)\s*$")
+
+
+def _column(values: Any) -> Any:
+    """Column as a NumPy array; numbers with gaps become floats with NaN."""
+    array = _as_array(values)
+    if array.dtype.kind == "O":
+        items = array.tolist()
+        numbers = [item for item in items if item is not None]
+        if numbers and all(
+            isinstance(item, (int, float)) and not isinstance(item, bool)
+            for item in numbers
+        ):
+            array = np.array(
+                [np.nan if item is None else item for item in items], dtype=float
+            )
+    return array
+
+
+class TablePage(NamedTuple):
+    """
+    One page of a table query.
+
+    Attributes:
+        rows: Row dicts of the page, missing values as None
+        total: Number of rows matching the filters
+        page: Index of the returned page (clamped to the last page)
+        page_count: Number of pages, at least 1
+    """
+
+    rows: List[RowType]
+    total: int
+    page: int
+    page_count: int
+
+
+class TableSource(NamedSource):
+    """
+    A table kept on the server and queried a page at a time by
+    ``DataTable``, so the browser never receives more than one page.
+
+    Columns are stored as NumPy arrays. Sorting uses a stable ``argsort``
+    computed once per column and cached, in both directions; filters are
+    vectorized masks, with text matched once per distinct value. The rows
+    selected by a (sort, filters) combination are cached too, so paging
+    through results only slices an index array.
+
+    Filters map a column to an expression. Text matches
+    case-insensitively anywhere in the value; on numeric columns an
+    expression such as ``"> 10"``, ``"<= 2.5"``, ``"!= 0"`` or ``"42"``
+    compares numbers.
+
+    Args:
+        data: A pandas DataFrame, a mapping of column names to sequences,
+            or a sequence of row dicts
+        name: Name of the source, unique per app
+        columns: Columns to keep; all by default
+
+    Example:
+        ```python
+        from dash_ui_kit import DataTable, TableSource
+
+        orders = TableSource.cached("orders", load_orders)  # 1M rows
+
+        DataTable(id="orders", source=orders, page_size=25)
+
+        # Or query it yourself
+        page = orders.query(page=3, sort_by="total", descending=True,
+                            filters={"country": "fr", "total": "> 100"})
+        ```
+    """
+
+    def __init__(
+        self, data: Any, name: str, columns: Optional[Sequence[str]] = None
+    ) -> None:
+        if np is None:
+            raise ImportError(
+                "TableSource needs NumPy: pip install 'dash-ui-kit[data]'"
+            )
+
+        arrays: Dict[str, Any]
+        if pd is not None and isinstance(data, pd.DataFrame):
+            frame_columns = [str(column) for column in data.columns]
+            arrays = {str(column): data[column] for column in data.columns}
+        elif isinstance(data, Mapping):
+            frame_columns = [str(column) for column in data]
+            arrays = {str(column): values for column, values in data.items()}
+        else:
+            rows = list(data)
+            frame_columns = list(rows[0]) if rows else []
+            arrays = {
+                column: [row.get(column) for row in rows] for column in frame_columns
+            }
+
+        self.columns: List[str] = list(columns) if columns else frame_columns
+        self._data: Dict[str, Any] = {}
+        for column in self.columns:
+            if column not in arrays:
+                raise KeyError(f"Column {column!r} not in table {name!r}")
+            self._data[column] = _column(arrays[column])
+
+        lengths = {len(values) for values in self._data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All table columns must have the same length")
+        self._length = lengths.pop() if lengths else 0
+
+        self._orders: Dict[Tuple[str, bool], Any] = {}
+        self._factors: Dict[str, Tuple[Any, Any]] = {}
+        self._texts: Dict[str, Any] = {}
+        self._selections: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._register(name)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _factorized(self, column: str) -> Tuple[Any, Any]:
+        """
+        Cached (codes, uniques) of a column: ``uniques`` sorted, ``codes``
+        the position of each value in ``uniques``, -1 where it is missing.
+        """
+        factorized = self._factors.get(column)
+        if factorized is not None:
+            return factorized
+
+        values = self._data[column]
+        try:
+            if pd is None:
+                raise TypeError
+            codes, uniques = pd.factorize(values, sort=True)
+            uniques = np.asarray(uniques)
+        except TypeError:
+            present = _present(values)
+            try:
+                uniques, inverse = np.unique(values[present], return_inverse=True)
+            except TypeError:
+                # Mixed types can't be compared; order them by their text
+                uniques, inverse = np.unique(
+                    values[present].astype(str), return_inverse=True
+                )
+            codes = np.full(len(values), -1, dtype=np.intp)
+            codes[present] = inverse
+
+        with self._lock:
+            self._factors[column] = (codes, uniques)
+        return codes, uniques
+
+    def _order(self, column: str, descending: bool) -> Any:
+        """Cached stable sort permutation of a column; missing values last."""
+        key = (column, descending)
+        order = self._orders.get(key)
+        if order is not None:
+            return order
+
+        values = self._data[column]
+        if values.dtype.kind == "f":
+            keys = values
+        else:
+            # Sorting small integer codes beats comparing objects
+            codes, _ = self._factorized(column)
+            keys = np.where(codes < 0, np.nan, codes)
+        # argsort puts NaN (missing) last in both directions
+        order = np.argsort(-keys if descending else keys, kind="stable")
+
+        with self._lock:
+            self._orders[key] = order
+        return order
+
+    def _contains(self, column: str, text: str) -> Any:
+        """Mask of rows whose value contains ``text``, ignoring case."""
+        codes, uniques = self._factorized(column)
+        lowered = self._texts.get(column)
+        if lowered is None:
+            lowered = np.char.lower(uniques.astype(str))
+            with self._lock:
+                self._texts[column] = lowered
+        # Match each distinct value once, then spread to the rows
+        hits = np.append(np.char.find(lowered, text) >= 0, False)
+        return hits[codes]
+
+    def _mask(self, column: str, expression: str) -> Any:
+        values = self._data[column]
+        if values.dtype.kind in "biuf":
+            match = _COMPARISON.match(expression)
+            if match:
+                operator, number = match.group(1) or "=", float(match.group(2))
+                with np.errstate(invalid="ignore"):
+                    if operator == "=":
+                        return values == number
+                    if operator == "!=":
+                        return values != number
+                    if operator == "<":
+                        return values < number
+                    if operator == "<=":
+                        return values <= number
+                    if operator == ">":
+                        return values > number
+                    return values >= number
+        return self._contains(column, expression.strip().lower())
+
+    def _selection(
+        self,
+        sort_by: Optional[str],
+        descending: bool,
+        filters: Dict[str, str],
+    ) -> Any:
+        """Indexes of the matching rows, in display order."""
+        key = (sort_by, descending, tuple(sorted(filters.items())))
+        with self._lock:
+            selection = self._selections.get(key)
+            if selection is not None:
+                self._selections.move_to_end(key)
+                return selection
+
+        if sort_by is not None:
+            selection = self._order(sort_by, descending)
+        else:
+            selection = np.arange(self._length)
+        if filters:
+            keep = np.ones(self._length, dtype=bool)
+            for column, expression in filters.items():
+                keep &= self._mask(column, expression)
+            selection = selection[keep[selection]]
+
+        with self._lock:
+            self._selections[key] = selection
+            while len(self._selections) > _SELECTION_CACHE_SIZE:
+                self._selections.popitem(last=False)
+        return selection
+
+    def _rows(self, indexes: Any) -> List[RowType]:
+        columns = []
+        for column in self.columns:
+            values = self._data[column][indexes]
+            items = values.tolist()
+            if values.dtype.kind in "fO":
+                present = _present(values).tolist()
+                items = [item if keep else None for item, keep in zip(items, present)]
+            columns.append(items)
+        return [dict(zip(self.columns, row)) for row in zip(*columns)]
+
+    def query(
+        self,
+        page: int = 0,
+        page_size: int = 25,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> TablePage:
+        """
+        Return one page of rows, sorted and filtered.
+
+        Args:
+            page: Index of the page (clamped to the available pages)
+            page_size: Rows per page
+            sort_by: Column to sort by; source order by default
+            descending: Sort in descending order
+            filters: Expressions by column; empty expressions are ignored
+
+        Returns:
+            TablePage: The rows of the page and the number of matches
+
+        Raises:
+            KeyError: If a sort or filter column is not in the table
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        filters = {
+            column: str(expression)
+            for column, expression in (filters or {}).items()
+            if expression not in (None, "")
+        }
+        for column in ([sort_by] if sort_by is not None else []) + list(filters):
+            if column not in self._data:
+                raise KeyError(f"Column {column!r} not in table {self.name!r}")
+
+        selection = self._selection(sort_by, descending, filters)
+        total = len(selection)
+        page_count = max(1, -(-total // page_size))
+        page = min(max(page, 0), page_count - 1)
+        start = page * page_size
+        rows = self._rows(selection[start : start + page_size])
+        return TablePage(rows, total, page, page_count)
+
+    def __repr__(self) -> str:
+        return f"TableSource({self.name!r}, {len(self)} rows)"
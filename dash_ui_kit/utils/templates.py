@@ -0,0 +1,100 @@
+"""Render row templates built from kit components to HTML for the browser."""
+
+import html as html_lib
+import re
+from typing import Any, Dict, List
+
+from dash.development.base_component import Component
+
+# Elements without a closing tag
+_VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "source", "wbr"}
+
+# Dash prop names that differ from their HTML attribute
+_ATTRIBUTES = {"className": "class", "htmlFor": "for"}
+
+# Props handled by Dash, not rendered as attributes
+_SKIPPED_PROPS = {"children", "id", "key", "n_clicks", "n_clicks_timestamp"}
+
+FIELD_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+def _css_name(name: str) -> str:
+    return re.sub(r"[A-Z]", lambda match: "-" + match.group(0).lower(), name)
+
+
+def _style(style: Dict[str, Any]) -> str:
+    return ";".join(f"{_css_name(name)}:{value}" for name, value in style.items())
+
+
+def _render(node: Any, parts: List[str]) -> None:
+    if node is None:
+        return
+    if isinstance(node, (list, tuple)):
+        for child in node:
+            _render(child, parts)
+        return
+    if not isinstance(node, Component):
+        parts.append(html_lib.escape(str(node), quote=False))
+        return
+    if node._namespace != "dash_html_components":  # pylint: disable=protected-access
+        raise ValueError(
+            f"Row templates can only contain html components and kit components "
+            f"built from them, not {node._namespace}.{node._type}"  # pylint: disable=protected-access
+        )
+
+    tag = node._type.lower()  # pylint: disable=protected-access
+    attributes = []
+    for name in node._prop_names:  # pylint: disable=protected-access
+        value = getattr(node, name, None)
+        if value is None or name in _SKIPPED_PROPS:
+            continue
+        if name == "style":
+            value = _style(value)
+        elif isinstance(value, bool):
+            if not value:
+                continue
+            value = name
+        attribute = _ATTRIBUTES.get(name, name)
+        attributes.append(f' {attribute}="{html_lib.escape(str(value))}"')
+
+    parts.append(f"<{tag}{''.join(attributes)}>")
+    if tag in _VOID_TAGS:
+        return
+    _render(getattr(node, "children", None), parts)
+    parts.append(f"</{tag}>")
+
+
+def render_template(template: Any) -> str:
+    """
+    Render a row template to an HTML string with ``{field}`` placeholders.
+
+    Templates are ordinary kit or ``dash.html`` components whose text and
+    attribute values may contain ``{field}`` placeholders, filled in the
+    browser with the (escaped) fields of each row. Ids and event props are
+    dropped: template rows are not Dash components.
+
+    Args:
+        template: Component (or list of components) describing one row
+
+    Returns:
+        str: HTML of the row
+
+    Raises:
+        ValueError: If the template contains non-html components such as
+            ``dcc`` components
+
+    Example:
+        ```python
+        render_template(
+            html.Div([Badge("{level}", variant="{variant}"), html.Span("{message}")])
+        )
+        ```
+    """
+    parts: List[str] = []
+    _render(template, parts)
+    return "".join(parts)
+
+
+def template_fields(template_html: str) -> List[str]:
+    """Return the placeholder field names used by a rendered template."""
+    return sorted(set(FIELD_PATTERN.findall(template_html)))
@@ -0,0 +1,217 @@
+"""Declarative field validation shared between the browser and the server."""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Kept simple on purpose and identical in assets/scripts/validation.js
+EMAIL_PATTERN = r"[^\s@]+@[^\s@]+\.[^\s@]+"
+_NUMBER = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*")
+
+_DEFAULT_MESSAGES = {
+    "required": "This field is required",
+    "min_length": "Must be at least {min_length} characters",
+    "max_length": "Must be at most {max_length} characters",
+    "pattern": "Invalid format",
+    "email": "Enter a valid email address",
+    "number": "Must be a number",
+    "min": "Must be at least {min}",
+    "max": "Must be at most {max}",
+}
+
+
+class _Placeholders(Dict[str, Any]):
+    """Message parameters that leave unknown placeholders as written."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class Validator:
+    """
+    A set of validation rules for a single field value.
+
+    Rules are compiled once: the Python validator checks values on the
+    server, and ``rules`` is the JSON form the browser compiles into the
+    same checks for ``Input(validate=...)``. Empty values (None or "") only
+    fail the ``required`` rule.
+
+    Args:
+        required: Reject empty values
+        min_length: Minimum number of characters
+        max_length: Maximum number of characters
+        pattern: Regular expression the whole value must match. Use syntax
+            shared by Python and JavaScript (no named groups or lookbehinds).
+        email: Require an email address
+        min: Minimum numeric value (implies a number check)
+        max: Maximum numeric value (implies a number check)
+        messages: Error messages by rule name, overriding the defaults.
+            Messages may use ``{min_length}``, ``{max_length}``, ``{min}``
+            and ``{max}`` placeholders; other placeholders are kept as
+            written.
+
+    Example:
+        ```python
+        from dash_ui_kit import Validator
+
+        email = Validator(required=True, email=True)
+        age = Validator(min=18, max=120, messages={"min": "Adults only"})
+
+        email("someone@example.com")  # None
+        age("12")  # "Adults only"
+        ```
+    """
+
+    def __init__(
+        self,
+        required: bool = False,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        pattern: Optional[str] = None,
+        email: bool = False,
+        min: Optional[float] = None,
+        max: Optional[float] = None,
+        messages: Optional[Dict[str, str]] = None,
+    ) -> None:
+        unknown = set(messages or {}) - set(_DEFAULT_MESSAGES)
+        if unknown:
+            raise ValueError(f"Unknown validation rules: {sorted(unknown)}")
+
+        params = {
+            "min_length": min_length,
+            "max_length": max_length,
+            "min": min,
+            "max": max,
+        }
+        texts = {**_DEFAULT_MESSAGES, **(messages or {})}
+
+        def message(rule: str) -> str:
+            return texts[rule].format_map(_Placeholders(params))
+
+        rules: List[Dict[str, Any]] = []
+        if required:
+            rules.append({"rule": "required", "message": message("required")})
+        if min_length is not None:
+            rules.append(
+                {
+                    "rule": "min_length",
+                    "value": min_length,
+                    "message": message("min_length"),
+                }
+            )
+        if max_length is not None:
+            rules.append(
+                {
+                    "rule": "max_length",
+                    "value": max_length,
+                    "message": message("max_length"),
+                }
+            )
+        if email:
+            rules.append(
+                {"rule": "pattern", "value": EMAIL_PATTERN, "message": message("email")}
+            )
+        if pattern is not None:
+            rules.append(
+                {"rule": "pattern", "value": pattern, "message": message("pattern")}
+            )
+        if min is not None or max is not None:
+            rules.append({"rule": "number", "message": message("number")})
+        if min is not None:
+            rules.append({"rule": "min", "value": min, "message": message("min")})
+        if max is not None:
+            rules.append({"rule": "max", "value": max, "message": message("max")})
+
+        self.rules: Tuple[Dict[str, Any], ...] = tuple(rules)
+        self._patterns: Dict[str, Pattern[str]] = {
+            rule["value"]: re.compile(rule["value"])
+            for rule in rules
+            if rule["rule"] == "pattern"
+        }
+
+    def _fails(self, rule: Dict[str, Any], value: Any) -> bool:
+        name = rule["rule"]
+        if name == "min_length":
+            return bool(len(str(value)) < rule["value"])
+        if name == "max_length":
+            return bool(len(str(value)) > rule["value"])
+        if name == "pattern":
+            return self._patterns[rule["value"]].fullmatch(str(value)) is None
+        number = _to_number(value)
+        if name == "number":
+            return number is None
+        if name == "min":
+            return number is not None and number < rule["value"]
+        if name == "max":
+            return number is not None and number > rule["value"]
+        return False
+
+    def __call__(self, value: Any) -> Optional[str]:
+        """
+        Validate a value.
+
+        Args:
+            value: Field value, as sent by the browser
+
+        Returns:
+            Optional[str]: Message of the first failing rule, or None if the
+            value is valid
+        """
+        if value is None or value == "":
+            for rule in self.rules:
+                if rule["rule"] == "required":
+                    return str(rule["message"])
+            return None
+
+        for rule in self.rules:
+            if self._fails(rule, value):
+                return str(rule["message"])
+        return None
+
+    def is_valid(self, value: Any) -> bool:
+        """Return True if ``value`` passes every rule."""
+        return self(value) is None
+
+    def __repr__(self) -> str:
+        rules = ", ".join(rule["rule"] for rule in self.rules)
+        return f"Validator({rules})"
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Parse a number the way the browser does (no "1_000", "inf" or "nan")."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, str) and _NUMBER.fullmatch(value):
+        return float(value)
+    return None
+
+
+def validate_values(
+    values: Dict[str, Any], validators: Dict[str, Validator]
+) -> Dict[str, str]:
+    """
+    Validate several named values, e.g. a ``Form`` submission.
+
+    Args:
+        values: Field values by name
+        validators: Validators by field name; fields missing from ``values``
+            are validated as None
+
+    Returns:
+        Dict[str, str]: Error messages by field name, empty if all are valid
+
+    Example:
+        ```python
+        errors = validate_values(form, {"email": email, "age": age})
+        if errors:
+            ...
+        ```
+    """
+    errors = {}
+    for name, validator in validators.items():
+        message = validator(values.get(name))
+        if message is not None:
+            errors[name] = message
+    return errors
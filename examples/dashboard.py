@@ -11,6 +11,7 @@ from dash_ui_kit import (
     CardFooter,
     CardHeader,
     CardTitle,
+    StatCard,
 )
 
 app = Dash(__name__)
@@ -34,64 +35,28 @@ app.layout = html.Div(
         # Stats cards
         html.Div(
             [
-                Card(
-                    [
-                        CardHeader(
-                            [
-                                CardTitle("Total Users"),
-                                CardDescription("Active users this month"),
-                            ]
-                        ),
-                        CardContent(
-                            [
-                                html.P("12,345", className="text-4xl font-bold"),
-                                html.P(
-                                    "+20.1% from last month",
-                                    className="text-sm text-muted-foreground mt-2",
-                                ),
-                            ]
-                        ),
-                    ],
+                StatCard(
+                    "Total Users",
+                    12345,
+                    description="Active users this month",
+                    delta="+20.1% from last month",
+                    trend="up",
                     className="flex-1",
                 ),
-                Card(
-                    [
-                        CardHeader(
-                            [
-                                CardTitle("Revenue"),
-                                CardDescription("Total revenue this month"),
-                            ]
-                        ),
-                        CardContent(
-                            [
-                                html.P("$45,231", className="text-4xl font-bold"),
-                                html.P(
-                                    "+15.2% from last month",
-                                    className="text-sm text-muted-foreground mt-2",
-                                ),
-                            ]
-                        ),
-                    ],
+                StatCard(
+                    "Revenue",
+                    "$45,231",
+                    description="Total revenue this month",
+                    delta="+15.2% from last month",
+                    trend="up",
                     className="flex-1",
                 ),
-                Card(
-                    [
-                        CardHeader(
-                            [
-                                CardTitle("Orders"),
-                                CardDescription("Processed this week"),
-                            ]
-                        ),
-                        CardContent(
-                            [
-                                html.P("573", className="text-4xl font-bold"),
-                                html.P(
-                                    "+8.5% from last week",
-                                    className="text-sm text-muted-foreground mt-2",
-                                ),
-                            ]
-                        ),
-                    ],
+                StatCard(
+                    "Orders",
+                    573,
+                    description="Processed this week",
+                    delta="+8.5% from last week",
+                    trend="up",
                     className="flex-1",
                 ),
             ],
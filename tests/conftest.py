@@ -1,6 +1,11 @@
 """Pytest configuration and fixtures."""
 
+import json
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+import dash
 import pytest
+from dash import _callback
 
 
 @pytest.fixture
@@ -11,3 +16,83 @@ def sample_options() -> list:
         {"label": "Option 2", "value": "2"},
         {"label": "Option 3", "value": "3"},
     ]
+
+
+@pytest.fixture
+def dash_app() -> Iterator[Callable[[Any], dash.Dash]]:
+    """
+    Factory of apps with a layout, serving the kit's callbacks.
+
+    Dash moves callbacks registered with ``dash.callback`` into the first app
+    that starts; they are restored afterwards so every test gets them.
+    """
+    callback_map = dict(_callback.GLOBAL_CALLBACK_MAP)
+    callback_list = list(_callback.GLOBAL_CALLBACK_LIST)
+
+    def build(layout: Any) -> dash.Dash:
+        app = dash.Dash(__name__)
+        app.layout = layout
+        return app
+
+    yield build
+
+    _callback.GLOBAL_CALLBACK_MAP.clear()
+    _callback.GLOBAL_CALLBACK_MAP.update(callback_map)
+    _callback.GLOBAL_CALLBACK_LIST[:] = callback_list
+
+
+def update_component(
+    client: Any,
+    output: str,
+    outputs: Any,
+    inputs: Sequence[Any],
+    state: Sequence[Any] = (),
+    changed: Optional[Sequence[tuple]] = None,
+) -> Any:
+    """
+    Request a callback from a test client as the Dash renderer does.
+
+    Args:
+        client: Flask test client of the app
+        output: Output key of the callback, as registered by Dash
+        outputs: ``(id, property)`` of the output, a list of them for a
+            callback with several outputs, nested in a list for ``ALL``
+        inputs: ``(id, property, value)`` of each input, nested in a list
+            for ``ALL``
+        state: ``(id, property, value)`` of each state
+        changed: ``(id, property)`` of the inputs that triggered the call;
+            every input by default
+
+    Returns:
+        The response of ``/_dash-update-component``
+    """
+
+    def prop(spec: Any) -> Any:
+        if isinstance(spec, list):
+            return [prop(item) for item in spec]
+        fields = {"id": spec[0], "property": spec[1]}
+        if len(spec) > 2:
+            fields["value"] = spec[2]
+        return fields
+
+    def flat(specs: Sequence[Any]) -> List[tuple]:
+        return [
+            item
+            for spec in specs
+            for item in (flat(spec) if isinstance(spec, list) else [spec])
+        ]
+
+    def prop_id(spec: tuple) -> str:
+        id = spec[0] if isinstance(spec[0], str) else json.dumps(spec[0])
+        return f"{id}.{spec[1]}"
+
+    return client.post(
+        "/_dash-update-component",
+        json={
+            "output": output,
+            "outputs": prop(outputs),
+            "inputs": prop(list(inputs)),
+            "state": prop(list(state)),
+            "changedPropIds": [prop_id(spec) for spec in (changed or flat(inputs))],
+        },
+    )
@@ -0,0 +1,146 @@
+"""Unit tests for Accordion."""
+
+import pytest
+from dash import html
+
+from dash_ui_kit import Accordion, AccordionItem, accordion_value_id
+from tests.conftest import update_component
+
+
+def parts(component):
+    items = component.children[:-4]
+    value, loaded, request, token = component.children[-4:]
+    return items, value, loaded, request, token
+
+
+def test_accordion_builds_only_open_items() -> None:
+    """Test lazy items are empty until expanded."""
+    built = []
+
+    def load(name):
+        return lambda: built.append(name) or html.P(name)
+
+    component = Accordion(
+        id="faq",
+        items=[
+            AccordionItem("Billing", "billing", load=load("billing")),
+            AccordionItem("Privacy", "privacy", load=load("privacy")),
+            AccordionItem("About", "about", children=html.P("Static")),
+        ],
+        value="billing",
+    )
+    items, value, loaded, request, token = parts(component)
+    assert built == ["billing"]
+    assert value.id == accordion_value_id("faq")
+    assert value.data == ["billing"]
+    assert loaded.data == ["billing", "about"]
+
+    billing, privacy, about = items
+    assert "duk-accordion__item--open" in billing.className
+    assert privacy.className == "duk-accordion__item"
+    header, body = privacy.children
+    assert getattr(header.children, "aria-expanded") == "false"
+    assert body.children is None
+    assert body.id == {"type": "duk-accordion-body", "id": "faq", "item": "privacy"}
+    assert about.children[1].children.children == "Static"
+
+
+def test_accordion_multiple() -> None:
+    """Test several items open only with multiple."""
+    items = [AccordionItem("A", "a"), AccordionItem("B", "b")]
+    component = Accordion(id="faq", items=items, value=["a", "b"], multiple=True)
+    assert getattr(component, "data-duk-multiple") == "true"
+    assert parts(component)[1].data == ["a", "b"]
+    with pytest.raises(ValueError):
+        Accordion(id="faq", items=items, value=["a", "b"])
+
+
+def test_accordion_validate() -> None:
+    """Test item values must be unique."""
+    with pytest.raises(ValueError):
+        Accordion(id="faq", items=[AccordionItem("A", "a"), AccordionItem("B", "a")])
+
+
+def _load(client, item, loaded, token):
+    """Request the body of ``item`` of the accordion "lazy"."""
+
+    def body(value):
+        return ({"id": "lazy", "item": value, "type": "duk-accordion-body"}, "children")
+
+    loaded_id = {"id": "lazy", "type": "duk-accordion-loaded"}
+    return update_component(
+        client,
+        '..{"id":["MATCH"],"item":["ALL"],"type":"duk-accordion-body"}'
+        '.children...{"id":["MATCH"],"type":"duk-accordion-loaded"}.data..',
+        [[body("a"), body("b")], (loaded_id, "data")],
+        [({"id": "lazy", "type": "duk-accordion-request"}, "data", {"value": item})],
+        [
+            (loaded_id, "data", loaded),
+            ({"id": "lazy", "type": "duk-accordion-token"}, "data", token),
+        ],
+    )
+
+
+def test_accordion_load_callback(dash_app) -> None:
+    """Test the load callback fills only the expanded item."""
+    component = Accordion(
+        id="lazy",
+        items=[
+            AccordionItem("A", "a", children="A"),
+            AccordionItem("B", "b", load=lambda: html.P("B")),
+        ],
+    )
+    client = dash_app(component).server.test_client()
+
+    response = _load(client, "b", ["a"], parts(component)[4].data)
+    assert response.status_code == 200
+    result = response.get_json()["response"]
+    key = '{"id":"lazy","item":"b","type":"duk-accordion-body"}'
+    assert result[key]["children"]["props"] == {"children": "B"}
+    assert '{"id":"lazy","item":"a","type":"duk-accordion-body"}' not in result
+    assert result['{"id":"lazy","type":"duk-accordion-loaded"}']["data"] == ["a", "b"]
+
+
+def test_accordion_load_per_build(dash_app) -> None:
+    """Test two accordions with the same id load their own bodies."""
+
+    def build(body):
+        return Accordion(
+            id="lazy",
+            items=[
+                AccordionItem("A", "a", children="A"),
+                AccordionItem("B", "b", load=lambda: body),
+            ],
+        )
+
+    first, second = build("First B"), build("Second B")
+    client = dash_app(first).server.test_client()
+    key = '{"id":"lazy","item":"b","type":"duk-accordion-body"}'
+
+    for component, body in ((first, "First B"), (second, "Second B")):
+        response = _load(client, "b", ["a"], parts(component)[4].data)
+        assert response.get_json()["response"][key]["children"] == body
+
+    # A token from another worker falls back to the last build with this id
+    response = _load(client, "b", ["a"], "unknown")
+    assert response.get_json()["response"][key]["children"] == "Second B"
+
+
+def test_accordion_load_without_loader(dash_app, monkeypatch) -> None:
+    """Test an item no loader is found for shows an error and stays unloaded."""
+    from dash_ui_kit.components import accordion
+    from dash_ui_kit.utils.loaders import LoaderRegistry
+
+    component = Accordion(
+        id="lazy",
+        items=[AccordionItem("A", "a"), AccordionItem("B", "b", load=lambda: "B")],
+    )
+    client = dash_app(component).server.test_client()
+    # A worker that never built this layout
+    monkeypatch.setattr(accordion, "_loaders", LoaderRegistry())
+
+    result = _load(client, "b", ["a"], parts(component)[4].data).get_json()
+    body = result["response"]['{"id":"lazy","item":"b","type":"duk-accordion-body"}']
+    assert body["children"]["props"]["role"] == "alert"
+    loaded = result["response"]['{"id":"lazy","type":"duk-accordion-loaded"}']
+    assert loaded["data"] == ["a"]
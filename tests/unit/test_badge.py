@@ -1,8 +1,9 @@
 """Unit tests for Badge component."""
 
 import pytest
+from dash import no_update
 
-from dash_ui_kit import Badge
+from dash_ui_kit import Badge, BadgePatch
 
 
 def test_badge_renders() -> None:
@@ -34,3 +35,21 @@ def test_badge_custom_classname() -> None:
     badge = Badge("Test", className="custom-class")
     assert "custom-class" in badge.className
     assert "duk-badge" in badge.className
+
+
+def test_badge_patch() -> None:
+    """Test BadgePatch computes className and label."""
+    patch = BadgePatch("Down", variant="destructive")
+    assert patch.props == {
+        "className": Badge("Down", variant="destructive").className,
+        "children": "Down",
+    }
+    assert [output.component_property for output in BadgePatch.outputs("b")] == [
+        "className",
+        "children",
+    ]
+
+
+def test_badge_patch_label_only() -> None:
+    """Test a label-only BadgePatch leaves className untouched."""
+    assert BadgePatch("3").values() == (no_update, "3")
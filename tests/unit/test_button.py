@@ -1,8 +1,9 @@
 """Unit tests for Button component."""
 
 import pytest
+from dash import Patch, no_update
 
-from dash_ui_kit import Button
+from dash_ui_kit import Button, ButtonPatch
 
 
 def test_button_renders() -> None:
@@ -39,6 +40,8 @@ def test_button_loading() -> None:
     """Test loading state."""
     button = Button("Test", loading=True)
     assert button.disabled is True
+    assert "duk-button--loading" in button.className
+    assert button.children == "Test"
 
 
 def test_button_custom_classname() -> None:
@@ -52,3 +55,82 @@ def test_button_n_clicks() -> None:
     """Test n_clicks prop."""
     button = Button("Test", n_clicks=5)
     assert button.n_clicks == 5
+
+
+def test_button_patch_class_name() -> None:
+    """Test ButtonPatch computes the same className as Button."""
+    patch = ButtonPatch(variant="destructive", size="sm")
+    assert patch.props == {
+        "className": Button("x", variant="destructive", size="sm").className
+    }
+
+
+def test_button_patch_loading() -> None:
+    """Test ButtonPatch turns the loading class on and off without children."""
+    style = {"variant": "outline", "size": "sm", "className": "toolbar"}
+    patch = ButtonPatch(loading=True, **style)
+    assert patch.props == {
+        "className": Button("x", loading=True, **style).className,
+        "disabled": True,
+    }
+    assert "duk-button--loading" in patch.props["className"]
+
+    patch = ButtonPatch(loading=False, **style)
+    assert patch.props == {
+        "className": Button("x", **style).className,
+        "disabled": False,
+    }
+    assert "duk-button--loading" not in patch.props["className"]
+
+    patch = ButtonPatch(loading=True, children="Saving", **style)
+    assert patch.props["children"] == "Saving"
+
+
+def test_button_patch_loading_needs_style() -> None:
+    """Test loading can't silently reset the variant, size and classes."""
+    with pytest.raises(ValueError):
+        ButtonPatch(loading=True)
+    with pytest.raises(ValueError):
+        ButtonPatch(loading=False, variant="outline", size="sm")
+
+
+def test_button_patch_outputs_and_values() -> None:
+    """Test outputs and values line up, with no_update for untouched props."""
+    outputs = ButtonPatch.outputs("save-btn")
+    assert [output.component_property for output in outputs] == [
+        "className",
+        "disabled",
+        "children",
+    ]
+    assert ButtonPatch(disabled=False).values() == (no_update, False, no_update)
+
+
+def test_button_patch_apply() -> None:
+    """Test apply records prop assignments on a Patch."""
+    patch = Patch()
+    ButtonPatch(variant="outline").apply(patch[2])
+    operations = patch.to_plotly_json()["operations"]
+    assert operations[0]["location"] == [2, "props", "className"]
+
+
+def test_button_clientside_loading() -> None:
+    """Test loading_until renders the data attributes read by button.js."""
+    button = Button("Run", id="run", loading_until="results", loading_timeout=5)
+    props = button.to_plotly_json()["props"]
+    assert props["data-duk-loading-until"] == "results"
+    assert props["data-duk-loading-timeout"] == 5
+
+
+def test_button_clientside_loading_pattern_id() -> None:
+    """Test dictionary target ids are stringified like Dash does in the DOM."""
+    button = Button("Run", loading_until={"type": "out", "index": 1})
+    props = button.to_plotly_json()["props"]
+    assert props["data-duk-loading-until"] == '{"index":1,"type":"out"}'
+
+
+def test_button_scripts_registered() -> None:
+    """Test the clientside script is registered for Dash to serve."""
+    import dash_ui_kit
+
+    paths = [resource["relative_package_path"] for resource in dash_ui_kit._js_dist]
+    assert "assets/scripts/button.js" in paths
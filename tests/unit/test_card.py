@@ -10,7 +10,9 @@ from dash_ui_kit import (
     CardFooter,
     CardHeader,
     CardTitle,
+    LazyCard,
 )
+from tests.conftest import update_component
 
 
 def test_card_renders() -> None:
@@ -76,3 +78,92 @@ def test_card_composition() -> None:
     )
     assert "duk-card" in card.className
     assert len(card.children) == 3
+
+
+def test_lazy_card_renders_header_only() -> None:
+    """Test LazyCard defers its content and keeps the header."""
+    calls = []
+    card = LazyCard(
+        id="revenue",
+        header=CardHeader(CardTitle("Revenue")),
+        load=lambda: calls.append(1) or "Content",
+        footer=CardFooter("Footer"),
+        max_concurrent=2,
+    )
+    header, body, footer, request, token, trigger = card.children
+    assert calls == []
+    assert "duk-lazy-card" in card.className
+    assert getattr(card, "data-duk-concurrency") == "2"
+    assert getattr(card, "data-duk-root-margin") == "200px"
+    assert body.id == {"type": "duk-lazy-card-body", "id": "revenue"}
+    assert "duk-lazy-card__body--loading" in body.className
+    assert body.children is None
+    assert footer.children == "Footer"
+    assert trigger.hidden
+
+
+def test_lazy_card_validates_concurrency() -> None:
+    """Test LazyCard needs at least one concurrent load."""
+    with pytest.raises(ValueError):
+        LazyCard(id="x", header="X", load=lambda: None, max_concurrent=0)
+
+
+def _load(client, token):
+    """Request the content of the card "lazy" built with ``token``."""
+    return update_component(
+        client,
+        '{"id":["MATCH"],"type":"duk-lazy-card-body"}.children',
+        ({"id": "lazy", "type": "duk-lazy-card-body"}, "children"),
+        [({"id": "lazy", "type": "duk-lazy-card-request"}, "data", {"at": 1})],
+        [({"id": "lazy", "type": "duk-lazy-card-token"}, "data", token)],
+    )
+
+
+def _token(card):
+    return card.children[-2].data
+
+
+def test_lazy_card_load_callback(dash_app) -> None:
+    """Test the load callback builds the card content."""
+    card = LazyCard(id="lazy", header="Header", load=lambda: html.P("Body"))
+    client = dash_app(card).server.test_client()
+
+    response = _load(client, _token(card))
+    assert response.status_code == 200
+    result = response.get_json()["response"]
+    assert result['{"id":"lazy","type":"duk-lazy-card-body"}']["children"] == {
+        "props": {"children": "Body"},
+        "type": "P",
+        "namespace": "dash_html_components",
+    }
+
+
+def test_lazy_card_load_per_build(dash_app) -> None:
+    """Test each build of the same card loads its own content."""
+    alice = LazyCard(id="lazy", header="Header", load=lambda: "Alice's")
+    bob = LazyCard(id="lazy", header="Header", load=lambda: "Bob's")
+    client = dash_app(alice).server.test_client()
+    body = '{"id":"lazy","type":"duk-lazy-card-body"}'
+
+    for card, content in ((alice, "Alice's"), (bob, "Bob's")):
+        response = _load(client, _token(card))
+        assert response.get_json()["response"][body]["children"] == content
+
+    # A token from another worker falls back to the last build with this id
+    response = _load(client, "unknown")
+    assert response.get_json()["response"][body]["children"] == "Bob's"
+
+
+def test_lazy_card_load_without_loader(dash_app, monkeypatch) -> None:
+    """Test a card no loader is found for shows an error."""
+    from dash_ui_kit.components import card
+    from dash_ui_kit.utils.loaders import LoaderRegistry
+
+    lazy = LazyCard(id="lazy", header="Header", load=lambda: "Content")
+    client = dash_app(lazy).server.test_client()
+    # A worker that never built this layout
+    monkeypatch.setattr(card, "_loaders", LoaderRegistry())
+
+    result = _load(client, _token(lazy)).get_json()["response"]
+    content = result['{"id":"lazy","type":"duk-lazy-card-body"}']["children"]
+    assert content["props"]["role"] == "alert"
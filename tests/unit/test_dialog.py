@@ -0,0 +1,140 @@
+"""Unit tests for Dialog."""
+
+from dash import html
+
+from dash_ui_kit import Dialog, dialog_trigger_id
+from tests.conftest import update_component
+
+
+def test_dialog_layout_holds_only_trigger() -> None:
+    """Test the dialog content is not built with the layout."""
+    built = []
+    dialog = Dialog(
+        id="profile",
+        trigger="Edit",
+        title="Edit profile",
+        load=lambda: built.append(1) or html.P("Form"),
+        trigger_variant="outline",
+    )
+    trigger, mount, token = dialog.children
+    assert built == []
+    assert trigger.id == dialog_trigger_id("profile")
+    assert "duk-button--outline" in trigger.className
+    assert mount.id == {"type": "duk-dialog-mount", "id": "profile"}
+    assert mount.children is None
+
+
+def test_dialog_cache() -> None:
+    """Test dialog content is built through the cache."""
+    from dash_ui_kit.components.dialog import _loaders
+
+    class Cache:
+        def __init__(self):
+            self.keys = []
+
+        def get_or_build(self, key, builder):
+            self.keys.append(key)
+            return builder()
+
+    cache = Cache()
+    dialog = Dialog(
+        id="help", trigger="Help", load=lambda: "Help", cache_key="help-v1", cache=cache
+    )
+    content = _loaders.build(dialog.children[2].data)
+    assert cache.keys == ["help-v1"]
+    assert content.className == "duk-dialog-layer"
+
+
+def _open(client, token):
+    """Click the trigger of the dialog "confirm" built with ``token``."""
+    return update_component(
+        client,
+        '{"id":["MATCH"],"type":"duk-dialog-mount"}.children',
+        ({"id": "confirm", "type": "duk-dialog-mount"}, "children"),
+        [({"id": "confirm", "type": "duk-dialog-trigger"}, "n_clicks", 1)],
+        [({"id": "confirm", "type": "duk-dialog-token"}, "data", token)],
+    )
+
+
+def test_dialog_open_callback(dash_app) -> None:
+    """Test opening the dialog mounts its content."""
+    dialog = Dialog(
+        id="confirm",
+        trigger="Delete",
+        title="Delete report?",
+        description="This can't be undone.",
+        load=lambda: html.P("Body"),
+    )
+    client = dash_app(dialog).server.test_client()
+    response = _open(client, dialog.children[2].data)
+    assert response.status_code == 200
+    result = response.get_json()["response"]
+    layer = result['{"id":"confirm","type":"duk-dialog-mount"}']["children"]
+    overlay, panel = layer["props"]["children"]
+    assert panel["props"]["role"] == "dialog"
+    header, body, close = panel["props"]["children"]
+    assert header["props"]["children"][0]["props"]["children"] == "Delete report?"
+    assert body["props"]["children"]["props"]["children"] == "Body"
+    assert close["props"]["id"] == {"type": "duk-dialog-close", "id": "confirm"}
+
+
+def test_dialog_open_per_build(dash_app) -> None:
+    """Test each build of the same dialog opens its own content."""
+    alice = Dialog(id="confirm", trigger="Open", load=lambda: "Alice's")
+    bob = Dialog(id="confirm", trigger="Open", load=lambda: "Bob's")
+    client = dash_app(alice).server.test_client()
+    mount = '{"id":"confirm","type":"duk-dialog-mount"}'
+
+    for dialog, content in ((alice, "Alice's"), (bob, "Bob's")):
+        response = _open(client, dialog.children[2].data)
+        layer = response.get_json()["response"][mount]["children"]
+        panel = layer["props"]["children"][1]
+        assert panel["props"]["children"][0]["props"]["children"] == content
+
+    # A token from another worker falls back to the last build with this id
+    layer = _open(client, "unknown").get_json()["response"][mount]["children"]
+    panel = layer["props"]["children"][1]
+    assert panel["props"]["children"][0]["props"]["children"] == "Bob's"
+
+
+def test_dialog_open_without_loader(dash_app, monkeypatch) -> None:
+    """Test a dialog no loader is found for opens with an error."""
+    from dash_ui_kit.components import dialog as module
+    from dash_ui_kit.utils.loaders import LoaderRegistry
+
+    dialog = Dialog(id="confirm", trigger="Open", load=lambda: "Body")
+    client = dash_app(dialog).server.test_client()
+    # A worker that never built this layout
+    monkeypatch.setattr(module, "_loaders", LoaderRegistry())
+
+    mount = '{"id":"confirm","type":"duk-dialog-mount"}'
+    response = _open(client, dialog.children[2].data)
+    layer = response.get_json()["response"][mount]["children"]
+    body, close = layer["props"]["children"][1]["props"]["children"]
+    assert body["props"]["children"]["props"]["role"] == "alert"
+    assert close["props"]["id"] == {"type": "duk-dialog-close", "id": "confirm"}
+
+
+def test_dialog_cache_holds_only_the_body() -> None:
+    """Test cached content is framed with the ids of each dialog."""
+    from dash_ui_kit.components.dialog import _loaders
+
+    class Cache:
+        def __init__(self):
+            self.built = {}
+
+        def get_or_build(self, key, builder):
+            return self.built.setdefault(key, builder())
+
+    cache = Cache()
+    first, second = (
+        Dialog(
+            id=id, trigger="Help", load=lambda: "Help", cache_key="help", cache=cache
+        )
+        for id in ("first", "second")
+    )
+    for dialog, id in ((first, "first"), (second, "second")):
+        panel = _loaders.build(dialog.children[2].data).children[1]
+        close = panel.children[-1]
+        assert close.id == {"type": "duk-dialog-close", "id": id}
+    assert cache.built == {"help": "Help"}
@@ -0,0 +1,95 @@
+"""Unit tests for series downsampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dash_ui_kit import downsample
+from dash_ui_kit.utils.downsample import lttb_indices, minmax_indices
+
+
+def _reference_lttb(x, y, points):
+    """Textbook LTTB, one point at a time."""
+    count = len(y)
+    every = (count - 2) / (points - 2)
+    kept, anchor = [0], 0
+    for bucket in range(points - 2):
+        start = int(np.floor(bucket * every)) + 1
+        stop = int(np.floor((bucket + 1) * every)) + 1
+        after = min(int(np.floor((bucket + 2) * every)) + 1, count)
+        if bucket < points - 3:
+            next_x, next_y = x[stop:after].mean(), y[stop:after].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        areas = [
+            abs(
+                (x[anchor] - next_x) * (y[index] - y[anchor])
+                - (x[anchor] - x[index]) * (next_y - y[anchor])
+            )
+            for index in range(start, stop)
+        ]
+        anchor = start + int(np.argmax(areas))
+        kept.append(anchor)
+    return kept + [count - 1]
+
+
+@pytest.mark.parametrize("count,points", [(1000, 50), (101, 10), (12345, 120)])
+def test_lttb_matches_reference(count: int, points: int) -> None:
+    """Test the vectorized LTTB keeps the same points as the textbook one."""
+    y = np.random.default_rng(count).normal(size=count).cumsum()
+    x = np.arange(count, dtype=float)
+    assert lttb_indices(x, y, points).tolist() == _reference_lttb(x, y, points)
+
+
+def test_minmax_keeps_extremes() -> None:
+    """Test min-max bucketing keeps each bucket's lowest and highest point."""
+    y = np.array([1.0, 5, 2, 0, 3, 3, 9, 1, 2, 7, 4])
+    assert minmax_indices(y, 3).tolist() == [0, 1, 3, 6, 7, 8, 9, 10]
+    assert minmax_indices(y, 10).tolist() == list(range(11))
+
+
+def test_downsample_short_series_unchanged() -> None:
+    """Test series shorter than the target are kept whole, minus gaps."""
+    x, y = downsample([1, None, 3], points=10)
+    assert x.tolist() == [0, 2]
+    assert y.tolist() == [1.0, 3.0]
+
+
+def test_downsample_keeps_x_values() -> None:
+    """Test x values, including datetimes, are returned for the kept points."""
+    times = pd.Series(pd.date_range("2024-01-01", periods=1000, freq="min"))
+    values = pd.Series(np.sin(np.arange(1000) / 50))
+    x, y = downsample(values, times, points=100)
+    assert len(x) == len(y) == 100
+    assert x.dtype.kind == "M"
+    assert x[0] == times.iloc[0] and x[-1] == times.iloc[-1]
+
+
+def test_downsample_cached_by_content() -> None:
+    """Test equal series share one cached, read-only result."""
+    y = np.random.default_rng(0).normal(size=5000)
+    first = downsample(y, points=80, method="minmax")
+    again = downsample(y.copy(), points=80, method="minmax")
+    assert again is first
+    assert downsample(y, points=80) is not first
+    with pytest.raises(ValueError):
+        first[1][0] = 0
+
+
+def test_downsample_cache_distinguishes_equal_values() -> None:
+    """Test lists equal in Python but of other values get their own result."""
+    x, y = downsample([0, 1, 1, 0], x=[-1, -2, -3, -4])
+    x_other, _ = downsample([0, 1, 1, 0], x=[-2, -2, -3, -4])
+    assert list(x) == [-1, -2, -3, -4]
+    assert list(x_other) == [-2, -2, -3, -4]
+    assert y.dtype == float
+
+
+def test_downsample_rejects_bad_arguments() -> None:
+    """Test invalid methods, sizes and lengths raise."""
+    with pytest.raises(ValueError):
+        downsample([1, 2, 3], method="mean")
+    with pytest.raises(ValueError):
+        downsample([1, 2, 3], points=1)
+    with pytest.raises(ValueError):
+        downsample([1, 2, 3], x=[1, 2])
@@ -0,0 +1,73 @@
+"""Unit tests for InfiniteFeed."""
+
+import pytest
+from dash import html
+
+from dash_ui_kit import FeedSource, InfiniteFeed
+from tests.conftest import update_component
+
+ITEMS = [f"Item {index}" for index in range(25)]
+
+
+def fetch(after, limit):
+    return ITEMS[after : after + limit]
+
+
+def test_infinite_feed_renders_first_page() -> None:
+    """Test the first page is rendered with the layout."""
+    source = FeedSource(fetch, "feed-items", render=html.P)
+    feed = InfiniteFeed(id="feed", source=source, page_size=10)
+    items, footer, state, request = feed.children
+    assert [item.children for item in items.children] == ITEMS[:10]
+    assert footer.className == "duk-feed__footer"
+    assert state.data["source"] == "feed-items"
+    assert state.data["cursor"] is not None
+    assert getattr(feed, "data-duk-auto") == "true"
+
+    short = InfiniteFeed(id="short", source=source, page_size=50, auto=False)
+    assert "duk-feed__footer--done" in short.children[1].className
+    assert short.children[2].data["cursor"] is None
+
+    with pytest.raises(TypeError):
+        InfiniteFeed(id="feed", source=ITEMS)
+
+
+def test_infinite_feed_appends_with_patch(dash_app) -> None:
+    """Test the load callback appends only the next page."""
+    source = FeedSource(fetch, "feed-patch")
+    feed = InfiniteFeed(id="feed", source=source, page_size=10)
+    app = dash_app(feed)
+    client = app.server.test_client()
+    state = feed.children[2].data
+
+    def post(request):
+        ids = {
+            kind: {"id": "feed", "type": f"duk-feed-{kind}"}
+            for kind in ["items", "state", "footer", "request"]
+        }
+        return update_component(
+            client,
+            '..{"id":["MATCH"],"type":"duk-feed-items"}.children'
+            '...{"id":["MATCH"],"type":"duk-feed-state"}.data'
+            '...{"id":["MATCH"],"type":"duk-feed-footer"}.className..',
+            [
+                (ids["items"], "children"),
+                (ids["state"], "data"),
+                (ids["footer"], "className"),
+            ],
+            [(ids["request"], "data", request)],
+            [(ids["state"], "data", state)],
+        )
+
+    response = post({"cursor": state["cursor"]})
+    assert response.status_code == 200
+    result = response.get_json()["response"]
+    patch = result['{"id":"feed","type":"duk-feed-items"}']["children"]
+    assert patch["__dash_patch_update"] == "__dash_patch_update"
+    assert patch["operations"] == [
+        {"operation": "Extend", "location": [], "params": {"value": ITEMS[10:20]}}
+    ]
+    assert result['{"id":"feed","type":"duk-feed-state"}']["data"]["cursor"]
+
+    # A stale cursor appends nothing
+    assert post({"cursor": "stale"}).status_code == 204
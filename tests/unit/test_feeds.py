@@ -0,0 +1,88 @@
+"""Unit tests for feed sources and cursors."""
+
+import pytest
+
+from dash_ui_kit import FeedSource, decode_cursor, encode_cursor
+
+EVENTS = [{"id": 100 - index, "text": f"Event {index}"} for index in range(45)]
+
+
+def fetch_before(after, limit):
+    """Events newest first, older than the event with id ``after``."""
+    return [event for event in EVENTS if after is None or event["id"] < after][:limit]
+
+
+def test_cursor_round_trip() -> None:
+    """Test cursors encode JSON positions opaquely."""
+    for position in [0, 42, "2024-01-01T00:00:00", [3, "b"], None]:
+        cursor = encode_cursor(position)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == position
+    assert decode_cursor(None) is None
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+def test_feed_source_pages_by_key() -> None:
+    """Test keyset paging follows the key of the last item."""
+    source = FeedSource(fetch_before, "events", key=lambda event: event["id"])
+    first = source.page(limit=20)
+    assert [event["id"] for event in first.items] == list(range(100, 80, -1))
+    assert decode_cursor(first.cursor) == 81
+
+    second = source.page(first.cursor, limit=20)
+    assert second.items[0]["id"] == 80
+    last = source.page(second.cursor, limit=20)
+    assert len(last.items) == 5
+    assert last.cursor is None
+
+
+def test_feed_source_pages_by_offset() -> None:
+    """Test offset paging without a key."""
+    calls = []
+
+    def fetch(after, limit):
+        calls.append((after, limit))
+        return EVENTS[after : after + limit]
+
+    source = FeedSource(fetch, "offsets")
+    first = source.page(limit=40)
+    assert calls == [(0, 40)]
+    second = source.page(first.cursor, limit=40)
+    assert calls[-1] == (40, 40)
+    assert len(second.items) == 5
+    assert second.cursor is None
+
+    # A full last page is followed by an empty one
+    full = source.page(encode_cursor(5), limit=40)
+    assert len(full.items) == 40 and full.cursor
+    end = source.page(full.cursor, limit=40)
+    assert end.items == [] and end.cursor is None
+    with pytest.raises(ValueError):
+        source.page(encode_cursor(-1))
+
+
+def test_feed_source_bounds_page_size() -> None:
+    """Test page sizes are capped by max_page_size."""
+    source = FeedSource(
+        fetch_before, "bounded", key=lambda event: event["id"], max_page_size=10
+    )
+    assert len(source.page(limit=1000).items) == 10
+    calls = []
+    source = FeedSource(
+        lambda after, limit: calls.append(limit) or EVENTS[:limit],
+        "capped",
+        max_page_size=10,
+    )
+    source.page(limit=1000)
+    assert calls == [10]
+    assert len(source.page(limit=0).items) == 1
+    with pytest.raises(ValueError):
+        FeedSource(fetch_before, "invalid", max_page_size=0)
+
+
+def test_feed_source_render() -> None:
+    """Test items are rendered with the source's render."""
+    source = FeedSource(fetch_before, "rendered", render=lambda event: event["text"])
+    assert source.render(EVENTS[:2]) == ["Event 0", "Event 1"]
+    assert FeedSource.get("rendered") is source
@@ -0,0 +1,41 @@
+"""Unit tests for the Plotly figure template."""
+
+import copy
+
+import plotly.io as pio
+
+from dash_ui_kit import default_theme, figure_template, register_figure_template
+
+
+def test_figure_template_follows_theme() -> None:
+    """Test template colors, fonts and margins come from the theme."""
+    layout = figure_template().layout
+    assert layout.paper_bgcolor == "hsl(0,0%,100%)"
+    assert layout.font.color == "hsl(222,47%,11%)"
+    assert layout.font.size == 14
+    assert layout.xaxis.gridcolor == "hsl(214,32%,91%)"
+    assert layout.colorway[:3] == (
+        "hsl(220,80%,50%)",
+        "hsl(270,60%,55%)",
+        "hsl(310,80%,50%)",
+    )
+    assert layout.margin.l == 48
+
+
+def test_figure_template_custom_theme() -> None:
+    """Test a modified theme changes the template."""
+    theme = copy.deepcopy(default_theme)
+    theme["colors"]["background"] = "222 47% 11%"
+    assert figure_template(theme).layout.plot_bgcolor == "hsl(222,47%,11%)"
+
+
+def test_register_figure_template() -> None:
+    """Test the template is registered by name, and optionally as default."""
+    assert "dash_ui_kit" in pio.templates
+    previous = pio.templates.default
+    try:
+        register_figure_template(name="duk-test", default=True)
+        assert pio.templates.default == "duk-test"
+    finally:
+        pio.templates.default = previous
+        del pio.templates["duk-test"]
@@ -0,0 +1,143 @@
+"""Unit tests for Form component."""
+
+import json
+from typing import Any, List
+
+import pytest
+from dash import _callback, dcc
+
+from dash_ui_kit import (
+    Button,
+    Form,
+    Input,
+    OptionIndex,
+    Select,
+    Validator,
+    form_field_id,
+    form_state_id,
+    form_submit_id,
+    form_values_id,
+)
+
+
+def _matches(pattern: Any, component_id: Any) -> bool:
+    """Whether a component id matches a pattern-matching dependency id."""
+    if not isinstance(component_id, dict) or pattern.keys() != component_id.keys():
+        return False
+    return all(
+        isinstance(value, list) or component_id[key] == value
+        for key, value in pattern.items()
+    )
+
+
+def _collected(form: Any, form_id: str) -> List[str]:
+    """
+    Names of the fields a submission of ``form`` collects.
+
+    Reads the ``value`` States of the form's clientside callback and resolves
+    field names as assets/scripts/form.js does.
+    """
+    (callback,) = [
+        callback
+        for callback in _callback.GLOBAL_CALLBACK_LIST
+        if "duk-form-values" in callback["output"]
+    ]
+    patterns = [
+        json.loads(state["id"])
+        for state in callback["state"]
+        if state["property"] == "value"
+    ]
+
+    names = []
+    for component in form._traverse():
+        component_id = getattr(component, "id", None)
+        if not any(_matches(pattern, component_id) for pattern in patterns):
+            continue
+        if component_id["type"] != "duk-form-field":
+            if not component_id["id"].startswith("{"):
+                continue
+            component_id = json.loads(component_id["id"])
+        if component_id.get("form") == form_id:
+            names.append(component_id["name"])
+    return names
+
+
+def test_form_renders() -> None:
+    """Test Form keeps its children and appends its stores."""
+    form = Form(
+        [
+            Input(id=form_field_id("signup", "email")),
+            Button("Save", id=form_submit_id("signup")),
+        ],
+        id="signup",
+        initial={"email": ""},
+    )
+    assert "duk-form" in form.className
+    assert len(form.children) == 5
+    stores = [child for child in form.children if isinstance(child, dcc.Store)]
+    assert [store.id["type"] for store in stores] == [
+        "duk-form-config",
+        "duk-form-state",
+        "duk-form-values",
+    ]
+    assert stores[0].data == {"changed_only": True}
+    assert stores[1].data == {"email": ""}
+
+
+def test_form_single_child() -> None:
+    """Test a single child is accepted."""
+    form = Form(Input(id=form_field_id("f", "q")), id="f")
+    assert form.children[0].id == form_field_id("f", "q")
+
+
+def test_form_requires_id() -> None:
+    """Test Form needs an id."""
+    with pytest.raises(ValueError):
+        Form([])
+
+
+def test_form_ids() -> None:
+    """Test the pattern-matching ids share the form key."""
+    assert form_field_id("signup", "email") == {
+        "type": "duk-form-field",
+        "form": "signup",
+        "name": "email",
+    }
+    assert form_submit_id("signup")["form"] == "signup"
+    assert form_values_id("signup")["type"] == "duk-form-values"
+    assert form_state_id({"index": 1})["form"] == '{"index":1}'
+
+
+def test_form_collects_wrapped_fields() -> None:
+    """Test gated inputs and server-searched selects are submitted."""
+    plans = OptionIndex(
+        [{"label": "Free", "value": "free"}, {"label": "Pro", "value": "pro"}],
+        name="test-form-plans",
+    )
+    form = Form(
+        [
+            Input(id=form_field_id("signup", "email")),
+            Input(id=form_field_id("signup", "company"), min_length=2),
+            Select(id=form_field_id("signup", "plan"), options=plans),
+            Input(id=form_field_id("other", "email"), throttle_ms=100),
+            Input(id="search", throttle_ms=100),
+            Button("Save", id=form_submit_id("signup")),
+        ],
+        id="signup",
+    )
+    assert _collected(form, "signup") == ["email", "company", "plan"]
+
+
+def test_form_collects_validated_input() -> None:
+    """Test a validated input keeps its field name in the submission."""
+    form = Form(
+        [
+            Input(
+                id=form_field_id("signup", "email"),
+                validate=Validator(required=True, email=True),
+            ),
+            Button("Save", id=form_submit_id("signup")),
+        ],
+        id="signup",
+    )
+    assert _collected(form, "signup") == ["email"]
@@ -0,0 +1,51 @@
+"""Unit tests for vectorized number formatting."""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from dash_ui_kit import format_numbers, percent_change
+
+
+def test_format_numbers_separators_and_signs() -> None:
+    """Test thousands separators, rounding, prefixes and negative signs."""
+    assert format_numbers([12345, 45231.5, None, 0, -1234], prefix="$") == [
+        "$12,345",
+        "$45,232",
+        "—",
+        "$0",
+        "-$1,234",
+    ]
+    assert format_numbers([0.125, -0.004], decimals=2, suffix="%") == [
+        "0.12%",
+        "0.00%",
+    ]
+
+
+def test_format_numbers_compact() -> None:
+    """Test compact units, including values rounding up to the next unit."""
+    values = [1520, 2_400_000, 999_960, -5e12, 12, float("nan")]
+    assert format_numbers(values, decimals=1, compact=True) == [
+        "1.5K",
+        "2.4M",
+        "1.0M",
+        "-5.0T",
+        "12.0",
+        "—",
+    ]
+
+
+def test_format_numbers_accepts_columns() -> None:
+    """Test NumPy arrays and pandas Series, including nullable integers."""
+    assert format_numbers(np.array([1000, 2000])) == ["1,000", "2,000"]
+    series = pd.Series([1500, None], dtype="Int64")
+    assert format_numbers(series) == ["1,500", "—"]
+    assert format_numbers([]) == []
+
+
+def test_percent_change() -> None:
+    """Test percent changes are NaN where there is nothing to compare with."""
+    change = percent_change([120, 50, 10, None], [100, -100, 0, 5])
+    assert change[:2].tolist() == [20.0, 150.0]
+    assert math.isnan(change[2]) and math.isnan(change[3])
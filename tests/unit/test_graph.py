@@ -0,0 +1,127 @@
+"""Unit tests for Graph."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from dash import html
+
+from dash_ui_kit import Graph, figure_template, graph_id
+from tests.conftest import update_component
+
+
+def _points(trace) -> int:
+    return len(trace.y)
+
+
+def test_graph_resamples_long_traces() -> None:
+    """Test long traces are reduced, short and unordered ones kept."""
+    count = 100_000
+    y = np.random.default_rng(0).normal(size=count).cumsum()
+    figure = go.Figure(
+        [
+            go.Scattergl(y=y),
+            go.Scatter(y=[1, 2, 3]),
+            go.Scatter(x=np.arange(count)[::-1], y=y),
+            go.Bar(y=y),
+        ]
+    )
+    chart, store = Graph("sensor", figure, points=500).children
+
+    assert chart.id == graph_id("sensor") == {"type": "duk-graph", "id": "sensor"}
+    traces = chart.figure.data
+    assert _points(traces[0]) <= 502
+    assert traces[0].y.max() == y.max() and traces[0].y.min() == y.min()
+    assert [_points(trace) for trace in traces[1:]] == [3, count, count]
+    assert store.data["token"]
+
+
+def test_graph_template() -> None:
+    """Test the kit's template is applied unless disabled."""
+    figure = go.Figure(go.Scatter(y=[1, 2]))
+    chart = Graph("a", figure).children[0]
+    assert chart.figure.layout.template == figure_template()
+    chart = Graph("b", figure, template=None).children[0]
+    assert chart.figure.layout.template != figure_template()
+
+
+def test_graph_without_long_traces_keeps_no_data() -> None:
+    """Test small figures are not kept on the server."""
+    store = Graph("small", {"data": [{"type": "scatter", "y": [1, 2]}]}).children[1]
+    assert store.data["token"] is None
+
+
+def _relayout(client, id, relayout, session):
+    chart_id = {"id": id, "type": "duk-graph"}
+    return update_component(
+        client,
+        '{"id":["MATCH"],"type":"duk-graph"}.figure',
+        (chart_id, "figure"),
+        [(chart_id, "relayoutData", relayout)],
+        [({"id": id, "type": "duk-graph-session"}, "data", session)],
+    )
+
+
+def test_graph_resamples_zoomed_range(dash_app) -> None:
+    """Test zooming patches the trace with the visible range's points."""
+    count = 200_000
+    times = pd.date_range("2024-01-01", periods=count, freq="s")
+    values = np.sin(np.arange(count) / 1000)
+    graph = Graph("zoom", go.Figure(go.Scattergl(x=times, y=values)), points=200)
+    session = graph.children[1].data
+    client = dash_app(graph).server.test_client()
+
+    response = _relayout(
+        client,
+        "zoom",
+        {
+            "xaxis.range[0]": "2024-01-01 10:00:00",
+            "xaxis.range[1]": "2024-01-01 10:10:00",
+        },
+        session,
+    )
+    assert response.status_code == 200
+    patch = response.get_json()["response"]['{"id":"zoom","type":"duk-graph"}']
+    operations = patch["figure"]["operations"]
+    assert [op["location"] for op in operations] == [["data", 0, "x"], ["data", 0, "y"]]
+    x = pd.to_datetime(operations[0]["params"]["value"])
+    assert len(x) <= 202
+    assert x.min() <= pd.Timestamp("2024-01-01 10:00:00")
+    assert x.max() >= pd.Timestamp("2024-01-01 10:10:00")
+    assert x.max() - x.min() < pd.Timedelta(minutes=11)
+
+    response = _relayout(client, "zoom", {"xaxis.autorange": True}, session)
+    operations = response.get_json()["response"]['{"id":"zoom","type":"duk-graph"}']
+    x = pd.to_datetime(operations["figure"]["operations"][0]["params"]["value"])
+    assert x.min() == times[0] and x.max() == times[-1]
+
+    # A point count sent by the browser is ignored
+    forged = {**session, "points": 1}
+    response = _relayout(client, "zoom", {"xaxis.autorange": True}, forged)
+    operations = response.get_json()["response"]['{"id":"zoom","type":"duk-graph"}']
+    assert len(operations["figure"]["operations"][0]["params"]["value"]) <= 202
+
+    assert _relayout(client, "zoom", {"autosize": True}, session).status_code == 204
+    evicted = {"token": "evicted"}
+    assert (
+        _relayout(client, "zoom", {"xaxis.autorange": True}, evicted).status_code == 204
+    )
+
+
+def test_graph_evicts_least_recent_data(dash_app, monkeypatch) -> None:
+    """Test page views beyond the memory limit keep their initial resolution."""
+    from dash_ui_kit.components import graph as module
+
+    # Each figure keeps about 24 kB: x, y and their positions as 1000 floats
+    monkeypatch.setattr(module, "_MEMORY_LIMIT", 50_000)
+    figure = go.Figure(go.Scatter(y=np.arange(1000.0)))
+    first, second, third = (
+        Graph(name, figure, points=100).children[1].data for name in "abc"
+    )
+    assert first["token"] not in module._sessions
+    assert second["token"] in module._sessions
+    assert third["token"] in module._sessions
+
+    client = dash_app(html.Div()).server.test_client()
+    zoom = {"xaxis.range[0]": 100, "xaxis.range[1]": 200}
+    assert _relayout(client, "a", zoom, first).status_code == 204
+    assert _relayout(client, "c", zoom, third).status_code == 200
@@ -2,7 +2,16 @@
 
 import pytest
 
-from dash_ui_kit import Input, InputError, InputGroup, Label
+from dash_ui_kit import (
+    Input,
+    InputError,
+    InputGroup,
+    Label,
+    Validator,
+    input_error_id,
+    input_source_id,
+    input_value_id,
+)
 
 
 def test_input_renders() -> None:
@@ -64,3 +73,60 @@ def test_input_error_renders() -> None:
     error = InputError("This field is required", id="test-error")
     assert error.children == "This field is required"
     assert "duk-input-error" in error.className
+
+
+def test_input_debounce_ms() -> None:
+    """Test debounce_ms uses dcc.Input's debounce (in seconds)."""
+    input_field = Input(id="search", debounce_ms=300)
+    assert input_field.id == "search"
+    assert input_field.debounce == 0.3
+
+
+def test_input_gated() -> None:
+    """Test gated inputs wrap the field with config and value stores."""
+    wrapper = Input(
+        id="search", value="a", throttle_ms=500, min_length=3, suppress_unchanged=True
+    )
+    field, config, store = wrapper.children
+    assert field.id == input_source_id("search")
+    assert "duk-input" in field.className
+    assert config.data == {
+        "throttle_ms": 500,
+        "min_length": 3,
+        "suppress_unchanged": True,
+    }
+    assert store.id == input_value_id("search")
+    assert store.id == {"type": "duk-input-value", "id": "search"}
+    assert store.data == "a"
+
+
+def test_input_gated_requires_id() -> None:
+    """Test gated inputs need an id to address their value store."""
+    with pytest.raises(ValueError):
+        Input(min_length=2)
+
+
+def test_input_gated_pattern_id() -> None:
+    """Test dictionary ids are stringified inside the wrapper ids."""
+    store_id = input_value_id({"type": "filter", "index": 2})
+    assert store_id["id"] == '{"index":2,"type":"filter"}'
+
+
+def test_input_validated() -> None:
+    """Test validated inputs carry their rules and an error message."""
+    validator = Validator(required=True, email=True)
+    wrapper = Input(id="email", className="w-full", validate=validator)
+    field, _, _, rules, error = wrapper.children
+    assert field.id == input_source_id("email")
+    assert rules.data == {
+        "rules": list(validator.rules),
+        "className": "duk-input w-full",
+    }
+    assert error.id == input_error_id("email")
+    assert "duk-input-error" in error.className
+
+
+def test_input_validated_requires_id() -> None:
+    """Test validated inputs need an id to address their error message."""
+    with pytest.raises(ValueError):
+        Input(validate=Validator(required=True))
@@ -0,0 +1,107 @@
+"""Unit tests for flyweight interning of kit components."""
+
+import copy
+import json
+import pickle
+
+import pytest
+from dash import html
+
+from dash_ui_kit import (
+    Badge,
+    CardTitle,
+    FrozenComponentError,
+    StatCard,
+    intern_components,
+    serialize_layout,
+    set_interning,
+)
+from dash_ui_kit.cache.interning import clear_interned, interning_info
+
+
+@pytest.fixture(autouse=True)
+def reset_interning() -> None:
+    """Start every test with an empty pool and interning disabled."""
+    clear_interned()
+    yield
+    set_interning(False)
+    clear_interned()
+
+
+def test_interning_disabled_by_default() -> None:
+    """Test components are distinct unless interning is enabled."""
+    assert Badge("Active") is not Badge("Active")
+
+
+def test_interning_shares_identical_components() -> None:
+    """Test argument-identical, id-less components share one instance."""
+    with intern_components():
+        first = Badge("Active", variant="secondary")
+        second = Badge("Active", variant="secondary")
+        other = Badge("Active", variant="outline")
+        assert Badge(1) is not Badge(True)
+    assert first is second
+    assert first is not other
+    assert interning_info()["hits"] == 1
+
+
+def test_interning_skips_components_with_ids() -> None:
+    """Test components with an id are never shared."""
+    with intern_components():
+        assert Badge("Active", id="a") is not Badge("Active", id="a")
+        assert Badge("Active", "b") is not Badge("Active", "b")
+
+
+def test_interning_skips_non_plain_arguments() -> None:
+    """Test components with component or list arguments are not shared."""
+    with intern_components():
+        assert CardTitle([html.Span("x")]) is not CardTitle([html.Span("x")])
+        assert Badge("x", style={"color": "red"}) is not Badge(
+            "x", style={"color": "red"}
+        )
+
+
+def test_interned_component_is_immutable() -> None:
+    """Test shared instances refuse mutation, including nested children."""
+    with intern_components():
+        badge = Badge("Active")
+        card = StatCard("Revenue", "$1.2M")
+    with pytest.raises(FrozenComponentError):
+        badge.children = "Inactive"
+    with pytest.raises(FrozenComponentError):
+        badge.id = "badge"
+    with pytest.raises(FrozenComponentError):
+        card.children[0].className = "x"
+    with pytest.raises(AttributeError):
+        card.children.append("x")
+
+
+def test_interned_component_serializes_unchanged() -> None:
+    """Test shared instances serialize like regular components."""
+    with intern_components():
+        shared = StatCard("Revenue", "$1.2M")
+    regular = StatCard("Revenue", "$1.2M")
+    assert json.loads(serialize_layout(shared)) == json.loads(serialize_layout(regular))
+    assert isinstance(shared, html.Div)
+
+
+def test_interned_component_pickles_as_plain_component() -> None:
+    """Test pickling and copying a shared component gives a private instance."""
+    with intern_components():
+        badge = Badge("Active", variant="secondary")
+        title = CardTitle("Revenue")
+
+    for shared in (badge, title):
+        for restored in (pickle.loads(pickle.dumps(shared)), copy.deepcopy(shared)):
+            assert type(restored) is type(shared).__bases__[0]
+            assert serialize_layout(restored) == serialize_layout(shared)
+            restored.className = "changed"
+            assert shared.className != "changed"
+
+
+def test_set_interning_global() -> None:
+    """Test interning can be enabled globally and disabled per block."""
+    set_interning(True)
+    assert Badge("x") is Badge("x")
+    with intern_components(False):
+        assert Badge("x") is not Badge("x")
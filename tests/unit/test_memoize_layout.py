@@ -0,0 +1,131 @@
+"""Unit tests for the memoize_layout decorator."""
+
+import threading
+import time
+
+from dash import html
+
+from dash_ui_kit import SharedLayoutCache, memoize_layout
+
+
+def test_memoize_layout_caches() -> None:
+    """Test the factory runs once per key."""
+    calls = []
+
+    @memoize_layout(ttl=60)
+    def build(page: str = "home") -> html.Div:
+        calls.append(page)
+        return html.Div(page)
+
+    assert build() is build()
+    build("settings")
+    assert calls == ["home", "settings"]
+    assert build.cache_info()["hits"] == 1
+
+
+def test_memoize_layout_ttl() -> None:
+    """Test expired layouts are rebuilt."""
+    calls = []
+
+    @memoize_layout(ttl=0.01)
+    def build() -> html.Div:
+        calls.append(1)
+        return html.Div()
+
+    build()
+    time.sleep(0.02)
+    build()
+    assert len(calls) == 2
+
+
+def test_memoize_layout_custom_key() -> None:
+    """Test the key function varies the cache (e.g. by role)."""
+    role = {"value": "admin"}
+
+    @memoize_layout(key=lambda: role["value"])
+    def build() -> html.Div:
+        return html.Div(role["value"])
+
+    assert build().children == "admin"
+    role["value"] = "viewer"
+    assert build().children == "viewer"
+    role["value"] = "admin"
+    assert build().children == "admin"
+    assert build.cache_info()["entries"] == 2
+
+
+def test_memoize_layout_max_entries() -> None:
+    """Test least recently used layouts are evicted."""
+
+    @memoize_layout(max_entries=2)
+    def build(page: str) -> html.Div:
+        return html.Div(page)
+
+    for page in ["a", "b", "c"]:
+        build(page)
+    assert build.cache_info()["entries"] == 2
+
+
+def test_memoize_layout_invalidate() -> None:
+    """Test invalidate and cache_clear force a rebuild."""
+    calls = []
+
+    @memoize_layout()
+    def build() -> html.Div:
+        calls.append(1)
+        return html.Div()
+
+    build()
+    build.invalidate()
+    build()
+    build.cache_clear()
+    build()
+    assert len(calls) == 3
+
+
+def test_memoize_layout_serialize() -> None:
+    """Test serialized caching returns fresh component instances."""
+
+    @memoize_layout(serialize=True)
+    def build() -> html.Div:
+        return html.Div([html.Span("x")], id="root")
+
+    first, second = build(), build()
+    assert first is not second
+    assert isinstance(second, html.Div)
+    assert second.children[0].children == "x"
+
+
+def test_memoize_layout_stampede_protection() -> None:
+    """Test concurrent callers wait for a single build."""
+    calls = []
+
+    @memoize_layout()
+    def build() -> html.Div:
+        calls.append(1)
+        time.sleep(0.05)
+        return html.Div()
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+def test_memoize_layout_shared_backend(tmp_path) -> None:
+    """Test layouts built by one process-local memo are reused via the backend."""
+    calls = []
+    path = str(tmp_path / "layouts.cache")
+
+    def build() -> html.Div:
+        calls.append(1)
+        return html.Div("shared")
+
+    with SharedLayoutCache(path) as one, SharedLayoutCache(path) as two:
+        worker_one = memoize_layout(backend=one)(build)
+        worker_two = memoize_layout(backend=two)(build)
+        worker_one()
+        assert worker_two().children == "shared"
+    assert len(calls) == 1
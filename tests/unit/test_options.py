@@ -0,0 +1,111 @@
+"""Unit tests for columnar option building."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from dash_ui_kit import options_from_columns  # noqa: E402
+from dash_ui_kit.utils.options import _fingerprint  # noqa: E402
+
+
+def test_options_from_sequences() -> None:
+    """Test plain sequences are deduplicated and cleaned of missing values."""
+    assert options_from_columns(["b", "a", "b", None]) == [
+        {"label": "b", "value": "b"},
+        {"label": "a", "value": "a"},
+    ]
+    assert options_from_columns(["Beta", "Alpha"], ["b", "a"], sort=True) == [
+        {"label": "Alpha", "value": "a"},
+        {"label": "Beta", "value": "b"},
+    ]
+
+
+def test_options_from_numpy() -> None:
+    """Test NumPy arrays produce native Python values."""
+    options = options_from_columns(np.array([3, 1, 3, 2]), sort=True)
+    assert options == [{"label": value, "value": value} for value in (1, 2, 3)]
+    assert type(options[0]["value"]) is int
+
+    floats = options_from_columns(np.array([2.5, np.nan, 2.5]))
+    assert floats == [{"label": 2.5, "value": 2.5}]
+
+
+def test_options_from_pandas() -> None:
+    """Test Series pairs keep the first label of each value."""
+    frame = pd.DataFrame(
+        {"name": ["Ann", "Bob", "Ann (old)", "Cy"], "id": [1, 2, 1, None]}
+    )
+    assert options_from_columns(frame["name"], frame["id"]) == [
+        {"label": "Ann", "value": 1.0},
+        {"label": "Bob", "value": 2.0},
+    ]
+
+    dates = pd.Series(pd.to_datetime(["2024-01-02", "2024-01-01"]))
+    assert options_from_columns(dates, sort=True)[0]["value"] == "2024-01-01"
+
+
+def test_options_compact() -> None:
+    """Test compact output uses the smallest form dcc.Dropdown accepts."""
+    assert options_from_columns(["a", "b", "a"], compact=True) == ["a", "b"]
+    assert options_from_columns(["A", "B"], ["a", "b"], compact=True) == {
+        "a": "A",
+        "b": "B",
+    }
+    assert options_from_columns(["One"], [1], compact=True) == [
+        {"label": "One", "value": 1}
+    ]
+
+
+def test_options_compact_keeps_order_of_numeric_strings() -> None:
+    """Test integer-like string values are sent as a list to keep their order."""
+    options = options_from_columns(
+        ["Widget", "Gadget"], ["1001", "2"], sort=True, compact=True
+    )
+    assert options == [
+        {"label": "Gadget", "value": "2"},
+        {"label": "Widget", "value": "1001"},
+    ]
+    # Not array indices, so object keys keep their order
+    assert options_from_columns(["B", "A"], ["02", "-1"], compact=True) == {
+        "02": "B",
+        "-1": "A",
+    }
+
+
+def test_options_cached_by_content() -> None:
+    """Test equal columns reuse the same options object."""
+    series = pd.Series([f"item {i % 50}" for i in range(200)])
+    first = options_from_columns(series, sort=True)
+    assert options_from_columns(series.copy(), sort=True) is first
+    assert options_from_columns(series, sort=False) is not first
+
+    changed = series.copy()
+    changed[0] = "item 999"
+    assert options_from_columns(changed, sort=True) is not first
+
+
+def test_options_cache_distinguishes_equal_values() -> None:
+    """Test columns that are equal in Python but differ in type or content."""
+    assert options_from_columns([1, 0]) == [
+        {"label": 1, "value": 1},
+        {"label": 0, "value": 0},
+    ]
+    assert options_from_columns([True, False]) == [
+        {"label": True, "value": True},
+        {"label": False, "value": False},
+    ]
+    assert _fingerprint([1, 0]) != _fingerprint([1.0, 0.0])
+    # hash(-1) == hash(-2) in CPython
+    assert _fingerprint([-1]) != _fingerprint([-2])
+    assert _fingerprint(["a\x00", "b"]) != _fingerprint(["a", "\x00b"])
+    assert _fingerprint(np.array(["1", 1], dtype=object)) != _fingerprint(
+        np.array([1, "1"], dtype=object)
+    )
+    assert _fingerprint([object()]) is None
+
+
+def test_options_length_mismatch() -> None:
+    """Test labels and values must line up."""
+    with pytest.raises(ValueError):
+        options_from_columns(["a", "b"], ["a"])
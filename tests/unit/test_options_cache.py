@@ -0,0 +1,107 @@
+"""Unit tests for the options cache."""
+
+import gc
+
+import pytest
+from dash import no_update
+
+from dash_ui_kit import OptionsCache, cached_options
+
+pd = pytest.importorskip("pandas")
+
+
+def _frame() -> "pd.DataFrame":
+    return pd.DataFrame(
+        {
+            "region": ["West", "East", "West", "North"],
+            "code": ["w", "e", "w", "n"],
+        }
+    )
+
+
+def test_options_cache_returns_same_object() -> None:
+    """Test repeated lookups return the cached options object."""
+    cache = OptionsCache()
+    frame = _frame()
+    first = cache.get(frame, "region", sort=True)
+    assert first == [
+        {"label": "East", "value": "East"},
+        {"label": "North", "value": "North"},
+        {"label": "West", "value": "West"},
+    ]
+    assert cache.get(frame, "region", sort=True) is first
+    assert cache.cache_info()["hits"] == 1
+
+
+def test_options_cache_labels_and_compact() -> None:
+    """Test a separate label column and compact output."""
+    cache = OptionsCache()
+    options = cache.get(_frame(), "code", label="region", compact=True)
+    assert options == {"w": "West", "e": "East", "n": "North"}
+
+
+def test_options_cache_versions() -> None:
+    """Test a new version rebuilds and replaces the old options."""
+    cache = OptionsCache()
+    loads = []
+
+    def load() -> "pd.DataFrame":
+        loads.append(1)
+        return _frame()
+
+    first = cache.get("sales", "region", version=1, load=load)
+    assert cache.get("sales", "region", version=1, load=load) is first
+    second = cache.get("sales", "region", version=2, load=load)
+    assert second is not first
+    assert len(loads) == 2
+    assert cache.cache_info()["entries"] == 1
+
+
+def test_options_cache_client_version() -> None:
+    """Test options the browser already has are not resent."""
+    cache = OptionsCache()
+    frame = _frame()
+    assert cache.get(frame, "region", version=3, client_version=3) is no_update
+    assert cache.get(frame, "region", version=4, client_version=3) != no_update
+
+
+def test_options_cache_lru_eviction() -> None:
+    """Test least recently used entries are evicted."""
+    cache = OptionsCache(max_entries=2)
+    frame = _frame()
+    cache.get(frame, "region")
+    cache.get(frame, "code")
+    cache.get(frame, "region")
+    cache.get(frame, "region", sort=True)
+    assert cache.cache_info()["entries"] == 2
+
+    cache.get(frame, "region")
+    assert cache.cache_info()["misses"] == 3
+
+
+def test_options_cache_drops_collected_sources() -> None:
+    """Test entries of garbage collected data objects are dropped."""
+    cache = OptionsCache()
+    frame = _frame()
+    cache.get(frame, "region")
+    del frame
+    gc.collect()
+    assert cache.cache_info()["entries"] == 0
+
+
+def test_options_cache_invalidate() -> None:
+    """Test invalidating one source or everything."""
+    cache = OptionsCache()
+    frame, other = _frame(), _frame()
+    cache.get(frame, "region")
+    cache.get(other, "region")
+    cache.invalidate(frame)
+    assert cache.cache_info()["entries"] == 1
+    cache.invalidate()
+    assert cache.cache_info()["entries"] == 0
+
+
+def test_cached_options_shared() -> None:
+    """Test the module-level helper uses one shared cache."""
+    frame = _frame()
+    assert cached_options(frame, "code") is cached_options(frame, "code")
@@ -0,0 +1,125 @@
+"""Unit tests for layout diffing and Patch generation."""
+
+import copy
+import json
+from typing import Any
+
+from dash import Patch, html, no_update
+
+from dash_ui_kit import Badge, Card, CardTitle, diff_layout, layout_patch
+from dash_ui_kit.utils.serialization import serialize_layout
+
+
+def _spec(layout: Any) -> Any:
+    return json.loads(serialize_layout(layout))
+
+
+def _apply(value: Any, patch: Patch) -> Any:
+    """Apply patch operations the way the Dash renderer does."""
+    value = copy.deepcopy(value)
+    for operation in patch.to_plotly_json()["operations"]:
+        *parents, last = operation["location"]
+        target = value
+        for key in parents:
+            target = target[key]
+        params = operation["params"]
+        if operation["operation"] == "Assign":
+            target[last] = params["value"]
+        elif operation["operation"] == "Delete":
+            del target[last]
+        elif operation["operation"] == "Insert":
+            target[last].insert(params["index"], params["value"])
+        elif operation["operation"] == "Extend":
+            target[last].extend(params["value"])
+        else:
+            raise AssertionError(operation)
+    return value
+
+
+def _grid(statuses: Any) -> list:
+    return [
+        Card([CardTitle(name), Badge(status)], id=f"card-{name}")
+        for name, status in statuses
+    ]
+
+
+def _assert_patch_applies(old: Any, new: Any) -> Patch:
+    patch = layout_patch(old, new)
+    assert isinstance(patch, Patch)
+    wrapped_old, wrapped_new = {"v": _spec(old)}, {"v": _spec(new)}
+    root = Patch()
+    root["v"]._operations.extend(
+        {**op, "location": ["v"] + op["location"]}
+        for op in patch.to_plotly_json()["operations"]
+    )
+    assert _apply(wrapped_old, root) == wrapped_new
+    return patch
+
+
+def test_layout_patch_single_prop() -> None:
+    """Test changing one badge variant patches only its className."""
+    old = _grid([("a", "ok"), ("b", "ok")])
+    new = _grid([("a", "ok"), ("b", "ok")])
+    new[1].children[1] = Badge("ok", variant="destructive")
+    patch = _assert_patch_applies(old, new)
+    operations = patch.to_plotly_json()["operations"]
+    assert len(operations) == 1
+    assert operations[0]["location"] == [
+        1,
+        "props",
+        "children",
+        1,
+        "props",
+        "className",
+    ]
+
+
+def test_layout_patch_no_changes() -> None:
+    """Test identical layouts produce no_update."""
+    assert layout_patch(_grid([("a", "ok")]), _grid([("a", "ok")])) is no_update
+
+
+def test_layout_patch_keyed_insert_and_delete() -> None:
+    """Test cards matched by id are inserted and removed individually."""
+    old = _grid([("a", "ok"), ("b", "ok"), ("c", "ok")])
+    new = _grid([("a", "ok"), ("x", "new"), ("c", "late")])
+    patch = _assert_patch_applies(old, new)
+    ops = [op["operation"] for op in patch.to_plotly_json()["operations"]]
+    assert ops.count("Delete") == 1
+    assert ops.count("Insert") == 1
+
+
+def test_layout_patch_positional_growth_and_shrink() -> None:
+    """Test unkeyed lists extend or trim their tail."""
+    _assert_patch_applies([html.Li("a")], [html.Li("a"), html.Li("b"), html.Li("c")])
+    _assert_patch_applies([html.Li("a"), html.Li("b"), html.Li("c")], [html.Li("x")])
+
+
+def test_layout_patch_removed_prop() -> None:
+    """Test props missing from the new layout are deleted."""
+    _assert_patch_applies(
+        [html.Div("a", title="hint")],
+        [html.Div("a")],
+    )
+
+
+def test_layout_patch_reorder_resends_list() -> None:
+    """Test reordered keyed lists are replaced."""
+    old = _grid([("a", "ok"), ("b", "ok")])
+    new = _grid([("b", "ok"), ("a", "ok")])
+    changes = diff_layout(old, new)
+    assert len(changes) == 1
+    assert changes[0].op == "assign"
+
+
+def test_layout_patch_root_replacement() -> None:
+    """Test a changed root component is returned as-is."""
+    new = html.Span("x")
+    assert layout_patch(html.Div("x"), new) is new
+
+
+def test_layout_patch_accepts_specs() -> None:
+    """Test spec trees (e.g. from State) can be diffed against components."""
+    old = _spec(_grid([("a", "ok")]))
+    patch = layout_patch(old, _grid([("a", "down")]))
+    assert isinstance(patch, Patch)
@@ -0,0 +1,79 @@
+"""Unit tests for server-side option search."""
+
+import pytest
+
+from dash_ui_kit import OptionIndex
+
+OPTIONS = [
+    {"label": "Steel bolt M6", "value": "b6"},
+    {"label": "Brass nut M6", "value": "n6"},
+    {"label": "Bolt cutter", "value": "cutter"},
+    {"label": "Anchor bolt", "value": "anchor"},
+    {"label": "Thunderbolt decal", "value": "decal"},
+    {"label": "Washer", "value": "washer"},
+]
+
+
+@pytest.fixture()
+def index() -> OptionIndex:
+    """Index over the sample options."""
+    return OptionIndex(OPTIONS, name="test-parts")
+
+
+def test_search_ranks_matches(index: OptionIndex) -> None:
+    """Test label prefixes rank before word prefixes, then other matches."""
+    page = index.search("BOLT")
+    assert [option["value"] for option in page.options] == [
+        "cutter",
+        "b6",
+        "anchor",
+        "decal",
+    ]
+    assert page.total == 4
+
+
+def test_search_short_query_matches_word_prefixes(index: OptionIndex) -> None:
+    """Test queries shorter than a trigram match word prefixes."""
+    page = index.search("m6")
+    assert [option["value"] for option in page.options] == ["b6", "n6"]
+
+
+def test_search_requires_contiguous_match(index: OptionIndex) -> None:
+    """Test options sharing all trigrams out of order are not matched."""
+    assert index.search("nutbra").total == 0
+    assert index.search("xyz").options == []
+
+
+def test_search_pagination(index: OptionIndex) -> None:
+    """Test offset and limit page through matches."""
+    first = index.search("bolt", limit=3)
+    assert len(first.options) == 3
+    assert first.next_offset == 3
+
+    second = index.search("bolt", limit=3, offset=first.next_offset)
+    assert [option["value"] for option in second.options] == ["decal"]
+    assert second.next_offset is None
+
+
+def test_search_empty_query(index: OptionIndex) -> None:
+    """Test an empty query pages through options in their original order."""
+    page = index.search("", limit=2)
+    assert page.options == OPTIONS[:2]
+    assert page.total == len(OPTIONS)
+
+
+def test_lookup(index: OptionIndex) -> None:
+    """Test selected values map back to their options."""
+    assert index.lookup("washer") == [OPTIONS[5]]
+    assert index.lookup(["n6", "missing", "b6"]) == [OPTIONS[1], OPTIONS[0]]
+    assert index.lookup(None) == []
+
+
+def test_registry(index: OptionIndex) -> None:
+    """Test indexes are registered and cached by name."""
+    assert OptionIndex.get("test-parts") is index
+    assert OptionIndex.cached("test-parts", lambda: []) is index
+
+    OptionIndex.drop("test-parts")
+    with pytest.raises(KeyError):
+        OptionIndex.get("test-parts")
@@ -2,7 +2,8 @@
 
 import pytest
 
-from dash_ui_kit import Select
+from dash_ui_kit import OptionIndex, Select, select_dropdown_id
+from dash_ui_kit.components.select import _search_options
 
 
 def test_select_renders() -> None:
@@ -56,3 +57,47 @@ def test_select_value() -> None:
     """Test value prop."""
     select = Select(value="1")
     assert select.value == "1"
+
+
+def test_select_option_index() -> None:
+    """Test selects over an OptionIndex hold one page plus the selection."""
+    options = [{"label": f"Item {i}", "value": i} for i in range(100)]
+    index = OptionIndex(options, name="test-items")
+
+    wrapper = Select(id="item", options=index, value=80, page_size=10)
+    dropdown, config = wrapper.children
+    assert dropdown.id == select_dropdown_id("item")
+    assert [option["value"] for option in dropdown.options] == list(range(10)) + [80]
+    assert config.data == {"source": "test-items", "page_size": 10}
+
+
+def test_select_search_callback() -> None:
+    """Test the search callback returns matches and keeps the selection."""
+    options = [{"label": f"Item {i}", "value": i} for i in range(100)]
+    OptionIndex(options, name="test-items")
+
+    results = _search_options("item 9", [3], {"source": "test-items", "page_size": 5})
+    assert [option["value"] for option in results] == [9, 90, 91, 92, 93, 3]
+    assert _search_options("item", [3], {"source": "unknown", "page_size": 5}) == []
+
+
+def test_select_option_index_requires_id() -> None:
+    """Test server-searched selects need an id."""
+    with pytest.raises(ValueError):
+        Select(options=OptionIndex([], name="test-empty"))
+
+
+def test_select_columnar_options() -> None:
+    """Test columnar sources are converted to compact options."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"name": ["Beta", "Alpha", "Beta"], "id": [2, 1, 2]})
+    select = Select(options=frame, sort_options=True)
+    assert select.options == [
+        {"label": "Alpha", "value": 1},
+        {"label": "Beta", "value": 2},
+    ]
+    assert Select(options=frame[["name"]]).options == ["Beta", "Alpha"]
+    assert Select(options=(["Yes", "No"], ["y", "n"])).options == {
+        "y": "Yes",
+        "n": "No",
+    }
@@ -0,0 +1,34 @@
+"""Unit tests for layout serialization helpers."""
+
+import json
+
+from dash import dcc, html
+
+from dash_ui_kit import deserialize_layout, serialize_layout
+
+
+def test_serialize_layout_matches_dash_json() -> None:
+    """Test serialization produces the JSON spec Dash sends."""
+    data = serialize_layout(html.Div("Hello", id="root"))
+    assert json.loads(data) == {
+        "props": {"children": "Hello", "id": "root"},
+        "type": "Div",
+        "namespace": "dash_html_components",
+    }
+
+
+def test_deserialize_layout_rebuilds_components() -> None:
+    """Test nested components are rebuilt with their props."""
+    layout = html.Div(
+        [dcc.Input(id="q", value="x"), html.Span("a", className="b")], id="root"
+    )
+    restored = deserialize_layout(serialize_layout(layout))
+    assert isinstance(restored, html.Div)
+    assert isinstance(restored.children[0], dcc.Input)
+    assert restored.children[1].className == "b"
+
+
+def test_deserialize_layout_spec() -> None:
+    """Test components=False returns plain dicts."""
+    restored = deserialize_layout(serialize_layout(html.P("x")), components=False)
+    assert restored["type"] == "P"
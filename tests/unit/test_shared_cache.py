@@ -0,0 +1,114 @@
+"""Unit tests for the shared memory-mapped layout cache."""
+
+import os
+import time
+
+import pytest
+from dash import html
+
+from dash_ui_kit import SharedLayoutCache, serialize_layout
+
+
+@pytest.fixture
+def cache(tmp_path) -> SharedLayoutCache:
+    """A small shared cache in a temporary file."""
+    with SharedLayoutCache(
+        str(tmp_path / "layouts.cache"), max_entries=16, max_bytes=1024
+    ) as cache:
+        yield cache
+
+
+def test_cache_set_get(cache: SharedLayoutCache) -> None:
+    """Test raw bytes round trip and hit/miss counters."""
+    assert cache.get("missing") is None
+    cache.set("home", b"layout")
+    assert cache.get("home") == b"layout"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_overwrite_and_delete(cache: SharedLayoutCache) -> None:
+    """Test overwriting and deleting a key."""
+    cache.set("home", b"one")
+    cache.set("home", b"two")
+    assert cache.get("home") == b"two"
+    assert len(cache) == 1
+    assert cache.delete("home") is True
+    assert cache.get("home") is None
+    assert cache.delete("home") is False
+
+
+def test_cache_shared_between_instances(tmp_path) -> None:
+    """Test a second handle on the same file sees entries (as a worker would)."""
+    path = str(tmp_path / "layouts.cache")
+    with SharedLayoutCache(path) as writer, SharedLayoutCache(path) as reader:
+        writer.set("home", b"built once")
+        assert reader.get("home") == b"built once"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork and flock")
+def test_cache_forked_worker_has_own_lock(cache: SharedLayoutCache) -> None:
+    """Test a forked worker is excluded while its parent holds the lock."""
+    import fcntl
+
+    with cache._locked(exclusive=True):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            cache._reopen_after_fork()
+            try:
+                fcntl.flock(cache._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os._exit(0)
+            os._exit(1)
+        _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_cache_ttl(cache: SharedLayoutCache) -> None:
+    """Test expired entries are misses and are reclaimed."""
+    cache.set("short", b"x", ttl=0.01)
+    cache.set("long", b"y", ttl=60)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    cache.evict_expired()
+    assert cache.stats()["entries"] == 1
+    assert cache.get("long") == b"y"
+
+
+def test_cache_evicts_oldest_when_full(cache: SharedLayoutCache) -> None:
+    """Test the oldest entries are evicted once the data region is full."""
+    for i in range(10):
+        cache.set(f"key-{i}", bytes([i]) * 200)
+    assert cache.get("key-9") == bytes([9]) * 200
+    assert cache.get("key-0") is None
+    assert cache.stats()["bytes"] <= 1024
+    assert cache.evictions > 0
+
+
+def test_cache_rejects_oversized_value(cache: SharedLayoutCache) -> None:
+    """Test values larger than the data region raise."""
+    with pytest.raises(ValueError):
+        cache.set("big", b"x" * 2048)
+
+
+def test_cache_get_or_build(cache: SharedLayoutCache) -> None:
+    """Test layouts are built once and rebuilt as components."""
+    calls = []
+
+    def build() -> html.Div:
+        calls.append(1)
+        return html.Div([html.Span("Active")], id="root")
+
+    first = cache.get_or_build("home", build)
+    second = cache.get_or_build("home", build)
+    assert len(calls) == 1
+    assert isinstance(second, html.Div)
+    assert serialize_layout(second) == serialize_layout(first)
+    assert second.children[0].children == "Active"
+
+
+def test_cache_clear(cache: SharedLayoutCache) -> None:
+    """Test clear removes all entries."""
+    cache.set_layout("home", html.P("Hi"))
+    cache.clear()
+    assert cache.get_layout("home") is None
@@ -0,0 +1,66 @@
+"""Unit tests for Skeleton placeholders."""
+
+from dash_ui_kit import (
+    Badge,
+    Button,
+    Card,
+    Skeleton,
+    SkeletonBadge,
+    SkeletonButton,
+    SkeletonCard,
+    SkeletonRows,
+    SkeletonText,
+)
+
+
+def test_skeleton_renders() -> None:
+    """Test Skeleton shapes and sizes."""
+    block = Skeleton(shape="circle", width=40, height="2rem")
+    assert block.className == "duk-skeleton duk-skeleton--circle"
+    assert block.style == {"width": "40px", "height": "2rem"}
+    assert getattr(block, "aria-hidden") == "true"
+
+    line = Skeleton(style={"marginTop": 4})
+    assert "duk-skeleton--text" in line.className
+    assert line.style == {"marginTop": 4}
+
+
+def test_skeleton_text_last_line_shorter() -> None:
+    """Test SkeletonText shortens only its last line."""
+    lines = SkeletonText(lines=3).children
+    assert len(lines) == 3
+    assert [line.style.get("width") for line in lines] == [None, None, "60%"]
+    assert SkeletonText(lines=1).children[0].style == {}
+
+
+def test_skeleton_button_and_badge_use_component_classes() -> None:
+    """Test placeholders reuse the size classes of the real components."""
+    button = SkeletonButton(variant="outline", size="lg")
+    for name in Button("Save", variant="outline", size="lg").className.split():
+        assert name in button.className.split()
+
+    badge = SkeletonBadge(size="sm", width=48)
+    for name in Badge("New", size="sm").className.split():
+        assert name in badge.className.split()
+    assert badge.style == {"width": "48px"}
+
+
+def test_skeleton_card_mirrors_card() -> None:
+    """Test SkeletonCard has the sections of a Card."""
+    card = SkeletonCard(variant="elevated", lines=2, footer=True, height=200)
+    assert Card(variant="elevated").className in card.className
+    assert card.style == {"minHeight": "200px"}
+    header, content, footer = card.children
+    assert header.className == "duk-card-header"
+    assert len(content.children.children) == 2
+    assert footer.className == "duk-card-footer"
+
+    assert len(SkeletonCard(description=False).children[0].children) == 1
+
+
+def test_skeleton_rows() -> None:
+    """Test SkeletonRows builds rows of placeholder cells."""
+    rows = SkeletonRows(columns=4, rows=2)
+    assert len(rows) == 2
+    assert len(rows[0].children) == 4
+    assert rows[0].children[0].children.className.startswith("duk-skeleton")
@@ -0,0 +1,48 @@
+"""Unit tests for Sparkline."""
+
+from urllib.parse import unquote
+
+import numpy as np
+import pytest
+
+from dash_ui_kit import Sparkline
+
+
+def _svg(sparkline) -> str:
+    return unquote(sparkline.style["maskImage"])
+
+
+def test_sparkline_renders() -> None:
+    """Test Sparkline sizes, classes and accessibility props."""
+    sparkline = Sparkline(
+        [1, 3, 2], width=100, height=20, variant="muted", label="Sales", id="s"
+    )
+    assert sparkline.id == "s"
+    assert sparkline.className == "duk-sparkline duk-sparkline--muted"
+    assert sparkline.style["width"] == "100px"
+    assert sparkline.style["height"] == "20px"
+    assert sparkline.role == "img"
+    assert getattr(sparkline, "aria-label") == "Sales"
+    assert sparkline.style["WebkitMaskImage"] == sparkline.style["maskImage"]
+    assert "M0.0,19.2L50.0,0.8L100.0,10.0" in _svg(sparkline)
+
+
+def test_sparkline_downsamples_to_width() -> None:
+    """Test long series are drawn with one point per pixel."""
+    data = np.random.default_rng(1).normal(size=100_000).cumsum()
+    path = _svg(Sparkline(data, width=120)).split("d='M")[1].split("'")[0]
+    assert len(path.split("L")) == 120
+
+
+def test_sparkline_fill_and_flat_series() -> None:
+    """Test the area fill and flat series drawn mid-height."""
+    assert "Z' opacity=" in _svg(Sparkline([1, 2, 3], fill=True))
+    assert "M0.0,16.0L60.0,16.0L120.0,16.0" in _svg(Sparkline([5, 5, 5]))
+
+
+def test_sparkline_empty_series() -> None:
+    """Test series without two points render an empty box."""
+    assert "maskImage" not in Sparkline([]).style
+    assert "maskImage" not in Sparkline([None, 4]).style
+    with pytest.raises(ValueError):
+        Sparkline([1, 2], width=1)
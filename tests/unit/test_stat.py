@@ -0,0 +1,109 @@
+"""Unit tests for StatCard."""
+
+import pandas as pd
+import pytest
+
+from dash_ui_kit import StatCard, stat_cards_from_frame
+
+
+def _parts(card):
+    header, content = card.children
+    return header.children, content.children
+
+
+def test_stat_card_renders() -> None:
+    """Test StatCard shows its title, value, description and delta."""
+    card = StatCard(
+        "Total Users",
+        12345,
+        description="Active users",
+        delta="+20.1% from last month",
+        trend="up",
+        id="users",
+    )
+    assert card.id == "users"
+    assert "duk-card" in card.className and "duk-stat-card" in card.className
+
+    header, content = _parts(card)
+    assert [part.children for part in header] == ["Total Users", "Active users"]
+    value, delta = content
+    assert value.children == "12,345"
+    assert value.className == "duk-stat-card__value"
+    assert delta.children == "+20.1% from last month"
+    assert delta.className == "duk-stat-card__delta duk-stat-card__delta--up"
+
+
+def test_stat_card_without_delta() -> None:
+    """Test StatCard keeps text values and omits absent parts."""
+    header, content = _parts(StatCard("Status", "Healthy"))
+    assert len(header) == 1
+    assert [part.children for part in content] == ["Healthy"]
+
+
+def test_stat_cards_from_frame() -> None:
+    """Test cards are built per row with formatted values and trends."""
+    kpis = pd.DataFrame(
+        {
+            "title": ["Users", "Revenue", "Orders", "Churn"],
+            "value": [12345, 45231.4, 573, None],
+            "previous": [10280, 39264, 600, 0],
+        }
+    )
+    cards = stat_cards_from_frame(
+        kpis, previous="previous", prefix="$", delta_label="vs last month"
+    )
+    assert len(cards) == 4
+
+    contents = [_parts(card)[1] for card in cards]
+    assert [content[0].children for content in contents] == [
+        "$12,345",
+        "$45,231",
+        "$573",
+        "—",
+    ]
+    assert contents[0][1].children == "+20.1% vs last month"
+    assert contents[0][1].className.endswith("--up")
+    assert contents[2][1].children == "-4.5% vs last month"
+    assert contents[2][1].className.endswith("--down")
+    assert len(contents[3]) == 1
+
+
+def test_stat_cards_from_mapping() -> None:
+    """Test a mapping of columns works like a DataFrame."""
+    cards = stat_cards_from_frame(
+        {"name": ["Sessions"], "count": [2_400_000], "note": ["Last 30 days"]},
+        title="name",
+        value="count",
+        description="note",
+        decimals=1,
+        compact=True,
+    )
+    header, content = _parts(cards[0])
+    assert header[1].children == "Last 30 days"
+    assert content[0].children == "2.4M"
+
+    with pytest.raises(TypeError):
+        stat_cards_from_frame([("Sessions", 1)])
+
+
+def test_stat_cards_from_frame_missing_and_flat() -> None:
+    """Test missing descriptions are omitted and tiny changes read 0.0%."""
+    kpis = pd.DataFrame(
+        {
+            "title": ["Users", "Orders", "Churn"],
+            "value": [99_999, 100, 5],
+            "previous": [100_000, 100, 4],
+            "note": [None, float("nan"), "Monthly"],
+        }
+    )
+    kpis["note"] = kpis["note"].astype("string")
+    cards = stat_cards_from_frame(kpis, previous="previous", description="note")
+
+    assert [len(_parts(card)[0]) for card in cards] == [1, 1, 2]
+    deltas = [_parts(card)[1][1] for card in cards]
+    assert [delta.children.split()[0] for delta in deltas] == [
+        "0.0%",
+        "0.0%",
+        "+25.0%",
+    ]
+    assert deltas[0].className.endswith("--neutral")
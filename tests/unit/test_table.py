@@ -0,0 +1,143 @@
+"""Unit tests for the DataTable component."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dash_ui_kit import DataTable, TableSource, table_state_id  # noqa: E402
+from dash_ui_kit.components.table import _apply  # noqa: E402
+from tests.conftest import update_component  # noqa: E402
+
+ROWS = [{"sku": f"S{i:03}", "stock": i % 7} for i in range(60)]
+
+
+@pytest.fixture()
+def source() -> TableSource:
+    """Table over the sample rows."""
+    return TableSource(ROWS, name="test-stock")
+
+
+def test_data_table_renders_first_page(source: TableSource) -> None:
+    """Test only the first page is rendered, with a pager and state."""
+    table = DataTable(id="stock", source=source, page_size=10)
+    scroll, pagination, store = table.children
+    body = scroll.children.children[1]
+    assert len(body.children) == 10
+    assert body.children[0].children[0].children == "S000"
+    assert pagination.children[0].children == "1–10 of 60"
+    assert pagination.children[1].disabled is True
+    assert pagination.children[2].disabled is False
+    assert store.id == table_state_id("stock")
+    assert store.data["total"] == 60
+    assert set(store.data) == {
+        "page",
+        "page_size",
+        "sort_by",
+        "descending",
+        "filters",
+        "total",
+    }
+
+
+def test_data_table_columns_and_sort(source: TableSource) -> None:
+    """Test column labels and the initial sort indicator."""
+    table = DataTable(
+        id="stock",
+        source=source,
+        columns=[{"id": "stock", "name": "In stock"}],
+        sort_by="stock",
+        descending=True,
+        filterable=False,
+    )
+    thead = table.children[0].children.children[0]
+    assert len(thead.children) == 1
+    button = thead.children[0].children[0].children
+    assert button.children == "In stock"
+    assert button.className == "duk-table__sort duk-table__sort--desc"
+    assert button.id == {"type": "duk-table-sort", "id": "stock", "column": "stock"}
+
+
+def test_data_table_rejects_other_sources() -> None:
+    """Test DataTable needs a TableSource and known columns."""
+    with pytest.raises(TypeError):
+        DataTable(id="stock", source=ROWS)
+    with pytest.raises(KeyError):
+        DataTable(
+            id="stock", source=TableSource(ROWS, name="test-stock"), columns=["x"]
+        )
+
+
+def test_data_table_events() -> None:
+    """Test headers cycle sorting, filters and the pager move pages."""
+    state = {"page": 2, "sort_by": None, "descending": False, "filters": {}}
+    sort = {"type": "duk-table-sort", "id": "stock", "column": "stock"}
+
+    state = _apply(state, sort, {})
+    assert (state["sort_by"], state["descending"], state["page"]) == ("stock", False, 0)
+    state = _apply(state, sort, {})
+    assert (state["sort_by"], state["descending"]) == ("stock", True)
+    state = _apply(state, sort, {})
+    assert (state["sort_by"], state["descending"]) == (None, False)
+
+    state = _apply(state, {"type": "duk-table-next", "id": "stock"}, {})
+    assert state["page"] == 1
+    state = _apply(state, {"type": "duk-table-filter", "id": "stock"}, {"sku": "S1"})
+    assert (state["page"], state["filters"]) == (0, {"sku": "S1"})
+
+
+def _query(client, state, filters=(None, None)):
+    """Click the "Next" button of the table "stock" with the given store."""
+
+    def ids(kind):
+        return [
+            {"column": column, "id": "stock", "type": f"duk-table-{kind}"}
+            for column in ("sku", "stock")
+        ]
+
+    def table(kind):
+        return {"id": "stock", "type": f"duk-table-{kind}"}
+
+    return update_component(
+        client,
+        '..{"id":["MATCH"],"type":"duk-table-body"}.children'
+        '...{"id":["MATCH"],"type":"duk-table-state"}.data'
+        '...{"id":["MATCH"],"type":"duk-table-status"}.children'
+        '...{"id":["MATCH"],"type":"duk-table-previous"}.disabled'
+        '...{"id":["MATCH"],"type":"duk-table-next"}.disabled'
+        '...{"column":["ALL"],"id":["MATCH"],"type":"duk-table-sort"}.className..',
+        [
+            (table("body"), "children"),
+            (table("state"), "data"),
+            (table("status"), "children"),
+            (table("previous"), "disabled"),
+            (table("next"), "disabled"),
+            [(id, "className") for id in ids("sort")],
+        ],
+        [
+            [(id, "n_clicks", 0) for id in ids("sort")],
+            [(id, "value", value) for id, value in zip(ids("filter"), filters)],
+            (table("previous"), "n_clicks", None),
+            (table("next"), "n_clicks", 1),
+        ],
+        [(table("state"), "data", state)],
+        changed=[(table("next"), "n_clicks")],
+    )
+
+
+def test_data_table_query_uses_server_config(dash_app, source: TableSource) -> None:
+    """Test the page size and columns come from the server, not the store."""
+    table = DataTable(id="stock", source=source, page_size=10)
+    client = dash_app(table).server.test_client()
+    forged = {**table.children[2].data, "page_size": 1000, "sort_by": "secret"}
+
+    result = _query(client, forged).get_json()["response"]
+    state = result['{"id":"stock","type":"duk-table-state"}']["data"]
+    assert (state["page"], state["page_size"], state["sort_by"]) == (1, 10, None)
+    rows = result['{"id":"stock","type":"duk-table-body"}']["children"]
+    assert len(rows) == 10
+
+    # Filters on columns the table doesn't show are ignored
+    table = DataTable(id="stock", source=source, columns=["sku"], page_size=10)
+    response = _query(client, table.children[2].data, filters=(None, "0"))
+    rows = response.get_json()["response"]['{"id":"stock","type":"duk-table-body"}']
+    assert len(rows["children"]) == 10
@@ -0,0 +1,98 @@
+"""Unit tests for server-side tables."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dash_ui_kit import TableSource  # noqa: E402
+
+ROWS = [
+    {"name": "Bolt", "total": 3.0, "country": "FR"},
+    {"name": "anchor", "total": None, "country": "DE"},
+    {"name": None, "total": 1.0, "country": "FR"},
+    {"name": "Cutter", "total": 5.0, "country": "US"},
+    {"name": "Anchor", "total": 2.0, "country": "FR"},
+]
+
+
+@pytest.fixture()
+def table() -> TableSource:
+    """Table over the sample rows."""
+    return TableSource(ROWS, name="test-table")
+
+
+def names(page):
+    return [row["name"] for row in page.rows]
+
+
+def test_query_pages(table: TableSource) -> None:
+    """Test pages are clamped and report the number of pages."""
+    page = table.query(page=1, page_size=2)
+    assert names(page) == [None, "Cutter"]
+    assert (page.total, page.page, page.page_count) == (5, 1, 3)
+    assert table.query(page=99, page_size=2).page == 2
+    assert table.query(page=-1, page_size=2).page == 0
+
+
+def test_query_sorts_missing_last(table: TableSource) -> None:
+    """Test sorts are stable and keep missing values last both ways."""
+    totals = [row["total"] for row in table.query(sort_by="total").rows]
+    assert totals == [1.0, 2.0, 3.0, 5.0, None]
+    totals = [
+        row["total"] for row in table.query(sort_by="total", descending=True).rows
+    ]
+    assert totals == [5.0, 3.0, 2.0, 1.0, None]
+    assert names(table.query(sort_by="country", descending=True)) == [
+        "Cutter",
+        "Bolt",
+        None,
+        "Anchor",
+        "anchor",
+    ]
+
+
+def test_query_caches_sort_orders(table: TableSource) -> None:
+    """Test sort permutations are computed once per column and direction."""
+    table.query(sort_by="name")
+    order = table._orders[("name", False)]
+    table.query(sort_by="name", page=1, page_size=2)
+    assert table._orders[("name", False)] is order
+
+
+def test_query_filters(table: TableSource) -> None:
+    """Test text filters match substrings and numeric filters compare."""
+    assert names(table.query(filters={"name": "ANCH"})) == ["anchor", "Anchor"]
+    assert names(table.query(filters={"total": ">= 2"})) == ["Bolt", "Cutter", "Anchor"]
+    assert names(table.query(filters={"total": "1"})) == [None]
+    assert names(table.query(filters={"country": "fr", "total": "< 3"})) == [
+        None,
+        "Anchor",
+    ]
+    assert table.query(filters={"name": ""}).total == 5
+    assert table.query(filters={"name": "zzz"}).page_count == 1
+
+
+def test_query_unknown_column(table: TableSource) -> None:
+    """Test unknown sort and filter columns raise KeyError."""
+    with pytest.raises(KeyError):
+        table.query(sort_by="missing")
+    with pytest.raises(KeyError):
+        table.query(filters={"missing": "x"})
+
+
+def test_dataframe_source() -> None:
+    """Test DataFrame sources keep selected columns with JSON-friendly values."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        {
+            "when": pd.to_datetime(["2024-01-02", "2024-01-01"]),
+            "value": [np.nan, 1.5],
+            "skip": [1, 2],
+        }
+    )
+    table = TableSource(frame, name="test-frame", columns=["when", "value"])
+    assert table.columns == ["when", "value"]
+    assert table.query(sort_by="when").rows == [
+        {"when": "2024-01-01", "value": 1.5},
+        {"when": "2024-01-02", "value": None},
+    ]
@@ -0,0 +1,164 @@
+"""Unit tests for lazy Tabs."""
+
+import pytest
+from dash import html
+
+from dash_ui_kit import Tab, Tabs, tabs_id
+from tests.conftest import update_component
+
+
+def panels(component):
+    return {tab.value: tab.children for tab in component.children[0].children}
+
+
+def test_tabs_build_only_the_selected_tab() -> None:
+    """Test lazy tabs are placeholders until selected."""
+    built = []
+
+    def load(name):
+        return lambda: built.append(name) or html.P(name)
+
+    component = Tabs(
+        id="report",
+        tabs=[
+            Tab("Overview", "overview", load=load("overview")),
+            Tab("Revenue", "revenue", load=load("revenue")),
+            Tab("Notes", "notes", children=html.P("Static")),
+        ],
+    )
+    tabs, loaded, request, token = component.children
+    assert tabs.id == tabs_id("report")
+    assert tabs.value == "overview"
+    assert built == ["overview"]
+    assert loaded.data == ["overview", "notes"]
+
+    content = panels(component)
+    assert content["overview"].children.children == "overview"
+    assert content["revenue"].children is None
+    assert content["revenue"].id == {
+        "type": "duk-tab-panel",
+        "id": "report",
+        "tab": "revenue",
+    }
+
+
+def test_tabs_default_skips_disabled() -> None:
+    """Test the first enabled tab is selected by default."""
+    component = Tabs(
+        id="report",
+        tabs=[Tab("A", "a", disabled=True), Tab("B", "b")],
+    )
+    assert component.children[0].value == "b"
+
+
+def test_tabs_cache() -> None:
+    """Test tabs with a cache key are built through the cache."""
+
+    class Cache:
+        def __init__(self):
+            self.keys = []
+
+        def get_or_build(self, key, builder):
+            self.keys.append(key)
+            return builder()
+
+    cache = Cache()
+    Tabs(
+        id="report",
+        tabs=[Tab("A", "a", load=lambda: "a", cache_key="a-v1")],
+        cache=cache,
+    )
+    assert cache.keys == ["a-v1"]
+
+
+def test_tabs_validate() -> None:
+    """Test tabs need unique values."""
+    with pytest.raises(ValueError):
+        Tabs(id="report", tabs=[])
+    with pytest.raises(ValueError):
+        Tabs(id="report", tabs=[Tab("A", "a"), Tab("B", "a")])
+
+
+def _load(client, id, tab, loaded, token):
+    """Request the content of ``tab`` from the load callback."""
+
+    def panel(value):
+        return ({"id": id, "tab": value, "type": "duk-tab-panel"}, "children")
+
+    loaded_id = {"id": id, "type": "duk-tabs-loaded"}
+    return update_component(
+        client,
+        '..{"id":["MATCH"],"tab":["ALL"],"type":"duk-tab-panel"}.children'
+        '...{"id":["MATCH"],"type":"duk-tabs-loaded"}.data..',
+        [[panel("a"), panel("b")], (loaded_id, "data")],
+        [({"id": id, "type": "duk-tabs-request"}, "data", {"value": tab})],
+        [
+            (loaded_id, "data", loaded),
+            ({"id": id, "type": "duk-tabs-token"}, "data", token),
+        ],
+    )
+
+
+def test_tabs_load_callback(dash_app) -> None:
+    """Test the load callback fills only the requested panel."""
+    layout = Tabs(
+        id="lazy",
+        tabs=[
+            Tab("A", "a", children="A"),
+            Tab("B", "b", load=lambda: html.P("B")),
+        ],
+    )
+    client = dash_app(layout).server.test_client()
+
+    response = _load(client, "lazy", "b", ["a"], layout.children[3].data)
+    assert response.status_code == 200
+    result = response.get_json()["response"]
+    assert result['{"id":"lazy","tab":"b","type":"duk-tab-panel"}']["children"] == {
+        "props": {"children": "B"},
+        "type": "P",
+        "namespace": "dash_html_components",
+    }
+    assert '{"id":"lazy","tab":"a","type":"duk-tab-panel"}' not in result
+    assert result['{"id":"lazy","type":"duk-tabs-loaded"}']["data"] == ["a", "b"]
+
+
+def test_tabs_load_per_build(dash_app) -> None:
+    """Test each build of the same tabs loads its own content."""
+
+    def build(user):
+        return Tabs(
+            id="lazy",
+            tabs=[
+                Tab("A", "a", children="A"),
+                Tab("B", "b", load=lambda: f"B for {user}"),
+            ],
+        )
+
+    alice, bob = build("alice"), build("bob")
+    client = dash_app(html.Div([alice])).server.test_client()
+    panel = '{"id":"lazy","tab":"b","type":"duk-tab-panel"}'
+
+    for layout, user in ((alice, "alice"), (bob, "bob")):
+        response = _load(client, "lazy", "b", ["a"], layout.children[3].data)
+        assert response.get_json()["response"][panel]["children"] == f"B for {user}"
+
+    # A token from another worker falls back to the last build with this id
+    response = _load(client, "lazy", "b", ["a"], "unknown")
+    assert response.get_json()["response"][panel]["children"] == "B for bob"
+
+
+def test_tabs_load_without_loader(dash_app, monkeypatch) -> None:
+    """Test a tab no loader is found for shows an error and stays unloaded."""
+    from dash_ui_kit.components import tabs
+    from dash_ui_kit.utils.loaders import LoaderRegistry
+
+    layout = Tabs(id="lazy", tabs=[Tab("A", "a"), Tab("B", "b", load=lambda: "B")])
+    client = dash_app(layout).server.test_client()
+    # A worker that never built this layout
+    monkeypatch.setattr(tabs, "_loaders", LoaderRegistry())
+
+    response = _load(client, "lazy", "b", ["a"], layout.children[3].data)
+    result = response.get_json()["response"]
+    panel = result['{"id":"lazy","tab":"b","type":"duk-tab-panel"}']["children"]
+    assert panel["props"]["role"] == "alert"
+    assert result['{"id":"lazy","type":"duk-tabs-loaded"}']["data"] == ["a"]
@@ -0,0 +1,49 @@
+"""Unit tests for row templates."""
+
+import pytest
+from dash import dcc, html
+
+from dash_ui_kit import Badge, render_template
+from dash_ui_kit.utils.templates import template_fields
+
+
+def test_render_template_html() -> None:
+    """Test html components render to markup with their attributes."""
+    template = html.Div(
+        [html.Span("{name}", style={"fontWeight": "bold"}), html.Br()],
+        id="ignored",
+        className="row",
+        title="{name}",
+    )
+    assert render_template(template) == (
+        '<div class="row" title="{name}">'
+        '<span style="font-weight:bold">{name}</span><br>'
+        "</div>"
+    )
+
+
+def test_render_template_kit_components() -> None:
+    """Test kit components render with their classes and placeholders."""
+    rendered = render_template(Badge("{level}", variant="{variant}"))
+    assert rendered.startswith('<span class="duk-badge duk-badge--{variant}')
+    assert rendered.endswith(">{level}</span>")
+
+
+def test_render_template_escapes_text() -> None:
+    """Test literal text and attribute values are escaped."""
+    template = html.A("<b> & co", href='/q?a="1"&b=2')
+    assert render_template(template) == (
+        '<a href="/q?a=&quot;1&quot;&amp;b=2">&lt;b&gt; &amp; co</a>'
+    )
+
+
+def test_render_template_rejects_dcc() -> None:
+    """Test templates can't contain non-html components."""
+    with pytest.raises(ValueError):
+        render_template(html.Div(dcc.Input(value="{name}")))
+
+
+def test_template_fields() -> None:
+    """Test placeholder fields are listed once, sorted."""
+    rendered = render_template(html.Div(["{b}", html.Span("{a} {b}")]))
+    assert template_fields(rendered) == ["a", "b"]
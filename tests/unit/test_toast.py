@@ -0,0 +1,38 @@
+"""Unit tests for Toaster."""
+
+import pytest
+
+from dash_ui_kit import Toaster, toast, toaster_id
+
+
+def test_toaster_renders() -> None:
+    """Test Toaster renders its stack, store and settings."""
+    toaster = Toaster(max_visible=5, duration=3000, position="top-right")
+    stack, store = toaster.children
+    assert store.id == toaster_id()
+    assert stack.id == {"type": "duk-toaster-stack", "id": "toaster"}
+    assert getattr(stack, "aria-live") == "polite"
+    assert "duk-toaster--top-right" in toaster.className
+    assert getattr(toaster, "data-duk-max-visible") == "5"
+    assert getattr(toaster, "data-duk-duration") == "3000"
+
+
+def test_toaster_validates_max_visible() -> None:
+    """Test Toaster shows at least one toast."""
+    with pytest.raises(ValueError):
+        Toaster(max_visible=0)
+
+
+def test_toast_has_unique_key() -> None:
+    """Test identical toasts get distinct keys."""
+    first = toast("Saved", title="Done", duration=0)
+    second = toast("Saved", title="Done", duration=0)
+    assert first["key"] != second["key"]
+    assert {**first, "key": None} == {
+        "key": None,
+        "message": "Saved",
+        "title": "Done",
+        "variant": "default",
+        "duration": 0,
+    }
+    assert toaster_id("alerts") == {"type": "duk-toaster", "id": "alerts"}
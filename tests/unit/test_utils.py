@@ -3,6 +3,7 @@
 import pytest
 
 from dash_ui_kit.utils.classnames import cn
+from dash_ui_kit.utils.loaders import LoaderRegistry
 
 
 def test_cn_basic() -> None:
@@ -73,3 +74,16 @@ def test_cn_complex() -> None:
     assert "btn-medium" in result
     assert "custom-class" in result
     assert "btn-large" not in result
+
+
+def test_loader_registry_drops_least_recently_used() -> None:
+    """Test the registry keeps at most max_entries loaders."""
+    registry = LoaderRegistry(max_entries=2)
+    registry.register("a", lambda: "A")
+    registry.register("b", lambda: "B")
+    assert registry.build("a") == "A"
+    registry.register("c", lambda: "C")
+    assert "b" not in registry
+    assert len(registry) == 2
+    with pytest.raises(KeyError):
+        registry.build("b")
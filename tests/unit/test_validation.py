@@ -0,0 +1,80 @@
+"""Unit tests for field validation."""
+
+import pytest
+
+from dash_ui_kit import Validator, validate_values
+
+
+def test_validator_required() -> None:
+    """Test empty values only fail the required rule."""
+    assert Validator(required=True)("") == "This field is required"
+    assert Validator(required=True)(None) == "This field is required"
+    assert Validator(min_length=3, email=True)("") is None
+
+
+def test_validator_lengths() -> None:
+    """Test minimum and maximum lengths."""
+    validator = Validator(min_length=3, max_length=5)
+    assert validator("ab") == "Must be at least 3 characters"
+    assert validator("abcdef") == "Must be at most 5 characters"
+    assert validator.is_valid("abcd")
+
+
+def test_validator_email_and_pattern() -> None:
+    """Test patterns must match the whole value."""
+    assert Validator(email=True)("someone@example") == "Enter a valid email address"
+    assert Validator(email=True).is_valid("someone@example.com")
+
+    sku = Validator(pattern=r"[A-Z]{3}-\d+")
+    assert sku.is_valid("ABC-12")
+    assert sku("xABC-12") == "Invalid format"
+
+
+def test_validator_numeric_range() -> None:
+    """Test numeric ranges accept numbers and numeric strings."""
+    validator = Validator(min=1, max=10)
+    assert validator(5) is None
+    assert validator("7.5") is None
+    assert validator("0") == "Must be at least 1"
+    assert validator(11) == "Must be at most 10"
+    assert validator("1_000") == "Must be a number"
+    assert validator("nan") == "Must be a number"
+
+
+def test_validator_messages() -> None:
+    """Test custom messages and their placeholders."""
+    validator = Validator(
+        min_length=8, messages={"min_length": "Use {min_length}+ characters"}
+    )
+    assert validator("short") == "Use 8+ characters"
+
+    # Unknown placeholders are kept as written
+    validator = Validator(min=1, messages={"min": "Pick {count} or more"})
+    assert validator("0") == "Pick {count} or more"
+
+    with pytest.raises(ValueError):
+        Validator(messages={"minimum": "Too small"})
+
+
+def test_validator_rules_order() -> None:
+    """Test rules are reported in a fixed order, first failure wins."""
+    validator = Validator(required=True, min_length=5, email=True)
+    assert [rule["rule"] for rule in validator.rules] == [
+        "required",
+        "min_length",
+        "pattern",
+    ]
+    assert validator("a@b") == "Must be at least 5 characters"
+
+
+def test_validate_values() -> None:
+    """Test validating a dict of named values."""
+    validators = {
+        "email": Validator(required=True, email=True),
+        "age": Validator(min=18),
+    }
+    assert validate_values({"email": "a@b.co", "age": 30}, validators) == {}
+    assert validate_values({"age": 12}, validators) == {
+        "email": "This field is required",
+        "age": "Must be at least 18",
+    }
@@ -0,0 +1,146 @@
+"""Unit tests for VirtualList, CardGrid and row sources."""
+
+import json
+
+import plotly
+import pytest
+from dash import html
+from dash.exceptions import PreventUpdate
+
+from dash_ui_kit import (
+    Card,
+    CardContent,
+    CardGrid,
+    CardHeader,
+    CardTitle,
+    RowSource,
+    VirtualList,
+)
+from dash_ui_kit.components.virtual import _fetch_window
+
+ROWS = [{"id": i, "message": f"Event {i}"} for i in range(1000)]
+TEMPLATE = html.Div(html.Span("{message}"), className="event")
+
+
+def test_row_source_windows() -> None:
+    """Test row sources return clamped windows of rows."""
+    source = RowSource(ROWS, name="test-events")
+    assert len(source) == 1000
+    assert source.rows(10, 12) == ROWS[10:12]
+    assert source.rows(-5, 1) == ROWS[:1]
+    assert source.rows(998, 2000) == ROWS[998:]
+    assert RowSource.get("test-events") is source
+
+
+def test_row_source_dataframe() -> None:
+    """Test DataFrame sources return records regardless of the index."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(ROWS[:5], index=list("abcde"))
+    source = RowSource(frame, name="test-frame")
+    assert source.rows(3, 10) == ROWS[3:5]
+
+
+def test_row_source_unknown_name() -> None:
+    """Test looking up a missing source names the class."""
+    with pytest.raises(KeyError, match="RowSource"):
+        RowSource.get("test-missing")
+
+
+def test_virtual_list_inline_data() -> None:
+    """Test inline rows are all sent with the layout."""
+    virtual = VirtualList(id="log", data=ROWS[:50], template=TEMPLATE, row_height=20)
+    spacer, rows, page, window, config, trigger = virtual.children
+    assert virtual.id == {"type": "duk-virtual-list", "id": "log"}
+    assert "duk-virtual-list" in virtual.className
+    assert spacer.style == {"height": "1000px"}
+    assert page.data == {"start": 0, "rows": ROWS[:50], "total": 50}
+    assert config.data == {"source": None, "window": 100}
+    assert trigger.hidden is True
+
+    attributes = virtual.to_plotly_json()["props"]
+    assert attributes["data-duk-template"] == (
+        '<div class="event"><span>{message}</span></div>'
+    )
+    assert attributes["data-duk-row-height"] == "20"
+    assert attributes["data-duk-remote"] == "false"
+
+
+def test_virtual_list_row_source() -> None:
+    """Test row sources only send their first window."""
+    source = RowSource(ROWS, name="test-events")
+    virtual = VirtualList(id="log", data=source, template=TEMPLATE, window=25)
+    page, config = virtual.children[2].data, virtual.children[4].data
+    assert page == {"start": 0, "rows": ROWS[:25], "total": 1000}
+    assert config == {"source": "test-events", "window": 25}
+    assert virtual.children[0].style == {"height": "40000px"}
+    assert virtual.to_plotly_json()["props"]["data-duk-remote"] == "true"
+
+
+def test_virtual_list_height() -> None:
+    """Test the viewport height accepts pixels or CSS lengths."""
+    assert VirtualList(id="a", template=TEMPLATE, height=300).style == {
+        "height": "300px"
+    }
+    assert VirtualList(id="b", template=TEMPLATE, height="60vh").style == {
+        "height": "60vh"
+    }
+
+
+def test_virtual_list_fetch_window() -> None:
+    """Test the window callback serves requested rows, capped in size."""
+    RowSource(ROWS, name="test-events")
+    config = {"source": "test-events", "window": 10}
+
+    page = _fetch_window({"start": 100, "end": 110}, config)
+    assert page == {"start": 100, "rows": ROWS[100:110], "total": 1000}
+
+    page = _fetch_window({"start": 0, "end": 1000}, config)
+    assert len(page["rows"]) == 20
+
+    with pytest.raises(PreventUpdate):
+        _fetch_window({"start": 0, "end": 10}, {"source": None, "window": 10})
+
+
+def test_card_grid() -> None:
+    """Test card grids render a grid viewport with their layout settings."""
+    template = Card([CardHeader(CardTitle("{name}")), CardContent("{location}")])
+    grid = CardGrid(
+        id="assets",
+        data=ROWS[:10],
+        template=template,
+        card_height=160,
+        min_card_width=260,
+        gap=12,
+        style={"marginTop": "1rem"},
+    )
+    spacer, cells = grid.children[:2]
+    assert grid.id == {"type": "duk-card-grid", "id": "assets"}
+    assert "duk-card-grid" in grid.className
+    assert cells.className == "duk-card-grid__cells"
+    assert grid.style == {
+        "height": "600px",
+        "--duk-card-height": "160px",
+        "--duk-card-min-width": "260px",
+        "--duk-card-gap": "12px",
+        "marginTop": "1rem",
+    }
+
+    attributes = grid.to_plotly_json()["props"]
+    assert attributes["data-duk-layout"] == "grid"
+    assert attributes["data-duk-min-width"] == "260"
+    assert attributes["data-duk-gap"] == "12"
+    assert attributes["data-duk-template"].startswith('<div class="duk-card">')
+    assert "{location}" in attributes["data-duk-template"]
+
+
+def test_card_grid_payload_is_constant() -> None:
+    """Test the layout of a RowSource grid doesn't grow with the source."""
+    template = Card(CardTitle("{message}"))
+
+    def payload(count: int) -> int:
+        source = RowSource(ROWS * (count // len(ROWS)), name=f"test-cards-{count}")
+        grid = CardGrid(id="cards", data=source, template=template, window=50)
+        return len(json.dumps(grid, cls=plotly.utils.PlotlyJSONEncoder))
+
+    # Only the digits of the total row count differ
+    assert payload(50_000) - payload(5_000) <= 4